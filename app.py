@@ -1,13 +1,22 @@
 import streamlit as st
-import json
+import functools
 import os
 import random
+import time
 import urllib.parse
+from array import array
 import streamlit.components.v1 as components
 import extra_streamlit_components as stx
 from datetime import datetime, timedelta
 # Wir importieren den Scraper, um bei Bedarf live nachzuladen
-from scraper import scrape_nodata
+from release_grid import grid_toggles, release_grid
+from search import SearchIndex
+from seen_state import chunk_cookie_name, decode_seen, join_chunks, stored_chunk_count, to_cookie_chunks
+from storage import (
+    STORE_BACKEND, Release, ReleaseOverlay, migrate_json_to_sqlite, open_store, release_key, to_releases
+)
+
+run_started = time.perf_counter()  # Für NODATA_PROFILE (Dauer des vollen Laufs)
 
 # --- Page Config ---
 st.set_page_config(
@@ -490,48 +499,110 @@ st.markdown("""
 cookie_manager = stx.CookieManager(key="nodata_cookie_manager")
 
 # --- Data Loading ---
-@st.cache_data(ttl=3600)
+USE_SQL_STORE = STORE_BACKEND == "sqlite"
+SEARCH_PAGE_SIZE = 24  # Treffer pro Seite in der Suche (Index bzw. SQLite)
+ARCHIVE_SEARCH_BUDGET = 20  # Sekunden pro Klick auf "Im Archiv suchen"
+# Browse-Grid: "virtual" = ein Custom Component mit virtuellem Scrolling (release_grid),
+# "cards" = eine Karte aus Streamlit-Elementen pro Release
+USE_VIRTUAL_GRID = os.environ.get("NODATA_GRID", "virtual") != "cards"
+PAGE_STEP = int(os.environ.get("NODATA_PAGE_SIZE", 1000 if USE_VIRTUAL_GRID else 12))  # Karten pro "Mehr laden"
+
+@st.cache_resource
+def get_release_store():
+    # Mit NODATA_STORE=sqlite fragt Browse direkt die DB ab (LIMIT/OFFSET + FTS5)
+    store = open_store()
+    if USE_SQL_STORE and store.count() == 0:
+        # Frisches Deployment ohne releases.db: einmalig aus den JSON-Dateien befüllen
+        migrate_json_to_sqlite(store.path)
+    return store
+
+@st.cache_resource(max_entries=1)
+def get_shared_releases(data_version):
+    # JSONL: Snapshot (releases.json) + noch nicht kompaktiertes Log (releases.jsonl)
+    # Kompakte Release-Objekte: Such-Links werden erst beim Anzeigen erzeugt
+    # Ein unveränderliches Tuple pro Datenstand (siehe store.version()), das sich alle
+    # Sessions teilen (st.cache_data würde jedem Aufrufer eine eigene Kopie liefern)
+    return tuple(to_releases(get_release_store().load()))
+
 def load_initial_data():
-    if os.path.exists("releases.json"):
-        with open("releases.json", "r") as f: return json.load(f)
-    return []
+    return get_shared_releases(get_release_store().version())
+
+@st.cache_resource(max_entries=1)
+def get_search_index(data_version):
+    # Ein Index pro Datenstand, verweist auf dieselben Release-Objekte wie get_shared_releases
+    return SearchIndex(get_shared_releases(data_version))
 
 # --- Cookie Constants ---
-COOKIE_NAME = "nodata_seen_v1"
+COOKIE_NAME = "nodata_seen_v2"  # Kompakt kodiert, bei Bedarf auf mehrere Cookies verteilt (seen_state)
+LEGACY_COOKIE_NAME = "nodata_seen_v1"  # Altes Format: JSON-Liste von IDs, wird beim Laden übernommen
 COOKIE_EXPIRY_DAYS = 365
 
 # --- Session State Init (with cookie sync) ---
 # Flag to track if we've attempted to load cookies
 if 'cookie_loaded' not in st.session_state:
     st.session_state.cookie_loaded = False
-    st.session_state.seen_releases = []
+    st.session_state.seen_releases = set()
+    st.session_state.seen_cookie_chunks = 0
     st.session_state.cookie_attempts = 0
 
+def _canonical_seen_ids(seen: set) -> set:
+    """Stellt Titel-IDs aus alten Cookies auf Post-IDs um (Titel sind nur noch Alias)."""
+    aliases = {r.id: r.key for r in load_initial_data() if r.key != r.id}
+    if not any(x in aliases for x in seen):
+        return seen
+    return {aliases.get(x, x) for x in seen}
+
+def _save_seen_cookie():
+    """Speichert den aktuellen seen_releases State kompakt kodiert im Cookie (ggf. in Stücken)."""
+    expire_date = datetime.now() + timedelta(days=COOKIE_EXPIRY_DAYS)
+    chunks = to_cookie_chunks(st.session_state.seen_releases, COOKIE_NAME)
+    for name, value in chunks:
+        cookie_manager.set(name, value, expires_at=expire_date, key=f"set_{name}")
+    # Überzählige Stücke eines früher größeren Werts entfernen
+    for index in range(len(chunks), st.session_state.seen_cookie_chunks):
+        stale = chunk_cookie_name(COOKIE_NAME, index)
+        cookie_manager.delete(stale, key=f"delete_{stale}")
+    st.session_state.seen_cookie_chunks = len(chunks)
+
 # Attempt to sync cookie value on each run until successful or after 3 attempts.
 # extra-streamlit-components returns None until its JS component fires back,
 # so we cap retries to avoid an infinite rerun loop on first visit (no cookie).
 if not st.session_state.cookie_loaded:
-    cookie_val = cookie_manager.get(cookie=COOKIE_NAME)
+    cookie_val = join_chunks(cookie_manager.get, COOKIE_NAME)
+    legacy_val = cookie_manager.get(cookie=LEGACY_COOKIE_NAME)
     st.session_state.cookie_attempts += 1
 
-    if cookie_val is not None:
-        try:
-            st.session_state.seen_releases = json.loads(cookie_val)
-        except (json.JSONDecodeError, TypeError):
-            st.session_state.seen_releases = []
+    if cookie_val is not None or legacy_val is not None:
+        st.session_state.seen_releases = _canonical_seen_ids(
+            decode_seen(cookie_val) | decode_seen(legacy_val)
+        )
+        st.session_state.seen_cookie_chunks = stored_chunk_count(cookie_manager.get, COOKIE_NAME)
         st.session_state.cookie_loaded = True
+        if legacy_val is not None:
+            # Einmalig ins neue Format übernehmen, das alte Cookie wird sonst bei jedem Request mitgeschickt
+            _save_seen_cookie()
+            cookie_manager.delete(LEGACY_COOKIE_NAME, key="delete_legacy_seen")
     elif st.session_state.cookie_attempts >= 3:
         # No cookie found after 3 reruns — assume first visit, stop waiting
         st.session_state.cookie_loaded = True
 
 if 'all_releases' not in st.session_state:
     initial_data = load_initial_data()
-    st.session_state.all_releases = initial_data
+    # Geteilte Basis + nur die eigenen Ergänzungen der Session (Archivsuche)
+    st.session_state.all_releases = ReleaseOverlay(initial_data)
     # Startpunkt für Live-Scraping: Berechnung basierend auf Items pro Seite (~7-10)
     st.session_state.current_scrape_page = max(1, len(initial_data) // 8)
 
 if 'page_size' not in st.session_state:
-    st.session_state.page_size = 12
+    st.session_state.page_size = PAGE_STEP
+
+if 'search_page' not in st.session_state:
+    st.session_state.search_page = 0
+    st.session_state.search_query = ""
+
+# Releases aus der Archivsuche, deren Genres wegen des Zeitbudgets noch fehlen
+if 'deferred_details' not in st.session_state:
+    st.session_state.deferred_details = []
 
 # --- Radio Session State ---
 if 'radio_index' not in st.session_state:
@@ -541,22 +612,61 @@ if 'radio_shuffle' not in st.session_state:
 if 'radio_playlist' not in st.session_state:
     st.session_state.radio_playlist = []
 
-# --- Helper Functions ---
-def _save_seen_cookie():
-    """Speichert den aktuellen seen_releases State im Cookie."""
-    expire_date = datetime.now() + timedelta(days=COOKIE_EXPIRY_DAYS)
-    cookie_manager.set(COOKIE_NAME, json.dumps(st.session_state.seen_releases), expires_at=expire_date)
+# --- Partial Reruns ---
+# Karten und Radio sind st.fragment: Klicks darin führen nur das Fragment neu aus.
+# Buttons darin ändern den State per on_click-Callback, ein zusätzliches st.rerun entfällt.
+# NODATA_FRAGMENTS=0 schaltet zurück auf Vollläufe (Vergleichsmessung),
+# NODATA_PROFILE=1 loggt die Laufzeit jedes vollen Laufs und jedes Fragments.
+USE_FRAGMENTS = os.environ.get("NODATA_FRAGMENTS", "1") != "0"
+PROFILE_RUNS = os.environ.get("NODATA_PROFILE") == "1"
+
+def _profiled(label: str, func):
+    """Wrapper, der die Laufzeit von func loggt (auch wenn es per st.rerun abbricht)."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            print(f"⏱ {label}: {(time.perf_counter() - started) * 1000:.1f} ms")
+    return wrapper
+
+def fragment(func):
+    """st.fragment (bzw. normale Funktion bei NODATA_FRAGMENTS=0), optional mit Laufzeit-Log."""
+    if PROFILE_RUNS:
+        func = _profiled(f"Fragment {func.__name__}", func)
+    return st.fragment(func) if USE_FRAGMENTS else func
 
+# --- Helper Functions ---
 def mark_as_seen(release_id):
-    """Markiert ein Release als gesehen und speichert im Cookie."""
+    """Markiert ein Release als gesehen (das Cookie schreibt flush_seen_cookie)."""
     if release_id not in st.session_state.seen_releases:
-        st.session_state.seen_releases.append(release_id)
-        _save_seen_cookie()
+        st.session_state.seen_releases.add(release_id)
+        st.session_state.seen_cookie_dirty = True
 
 def unmark_as_seen(release_id):
-    """Entfernt die Gesehen-Markierung und aktualisiert das Cookie."""
+    """Entfernt die Gesehen-Markierung (das Cookie schreibt flush_seen_cookie)."""
     if release_id in st.session_state.seen_releases:
-        st.session_state.seen_releases.remove(release_id)
+        st.session_state.seen_releases.discard(release_id)
+        st.session_state.seen_cookie_dirty = True
+
+def toggle_seen(release_id):
+    """on_click-Callback der Gesehen-Buttons."""
+    if release_id in st.session_state.seen_releases:
+        unmark_as_seen(release_id)
+    else:
+        mark_as_seen(release_id)
+
+def flush_seen_cookie():
+    """
+    Schreibt einen geänderten Gesehen-Status ins Cookie.
+
+    Wird im Fragment nach dem Callback aufgerufen: Der Cookie-Component landet
+    so im gerade neu gerenderten Fragment, statt in einem Lauf, der sofort
+    per st.rerun verworfen wird.
+    """
+    if st.session_state.get('seen_cookie_dirty'):
+        st.session_state.seen_cookie_dirty = False
         _save_seen_cookie()
 
 def get_soundcloud_links(artist: str, album: str) -> dict:
@@ -580,7 +690,7 @@ def get_soundcloud_links(artist: str, album: str) -> dict:
 def init_radio_playlist():
     """Build or rebuild the radio playlist (shuffle or sequential)."""
     n = len(st.session_state.all_releases)
-    indices = list(range(n))
+    indices = array('I', range(n))  # 4 Byte pro Eintrag statt int-Objekten
     if st.session_state.radio_shuffle:
         random.shuffle(indices)
     st.session_state.radio_playlist = indices
@@ -601,6 +711,17 @@ def radio_navigate(direction: int):
     st.session_state.radio_index = (st.session_state.radio_index + direction) % total
 
 
+def radio_jump(playlist_pos: int):
+    """Springt zu einer Position in der Warteschlange."""
+    st.session_state.radio_index = playlist_pos
+
+
+def toggle_radio_shuffle():
+    """Wechselt zwischen Shuffle und sequenzieller Reihenfolge."""
+    st.session_state.radio_shuffle = not st.session_state.radio_shuffle
+    init_radio_playlist()
+
+
 def get_current_radio_release():
     """Return the currently active release in radio mode."""
     ensure_radio_playlist()
@@ -657,6 +778,107 @@ def render_release_card(release: dict, is_seen: bool, card_idx: int) -> str:
     '''
     return html
 
+@fragment
+def render_browse_card(release, idx: int):
+    """
+    Rendert eine Release-Karte im Browse-Grid als eigenes Fragment.
+
+    Ein Klick auf den Gesehen-Button führt nur diese Karte neu aus, nicht das
+    ganze Grid. Die Gesehen-Zahl im Header aktualisiert sich erst beim
+    nächsten vollen Lauf.
+
+    Args:
+        release: Release (storage.Release oder Dict)
+        idx: Position im Grid (für eindeutige Widget-Keys)
+    """
+    flush_seen_cookie()
+    key = release_key(release)
+    is_seen = key in st.session_state.seen_releases
+    card_opacity = "0.4" if is_seen else "1"
+
+    with st.container(border=True):
+        # --- SEEN BADGE ---
+        if is_seen:
+            st.markdown(
+                '<div style="background:rgba(74,222,128,0.15); color:#4ade80; padding:4px 10px; '
+                'border-radius:20px; font-size:0.7rem; font-weight:600; display:inline-block; '
+                'margin-bottom:8px;">✓ Gesehen</div>',
+                unsafe_allow_html=True
+            )
+
+        # --- COVER IMAGE ---
+        image_url = release.get('image') or 'https://placehold.co/400x400/1a1a1f/444?text=No+Cover'
+        st.markdown(f'<div style="opacity:{card_opacity}; transition:opacity 0.3s;">', unsafe_allow_html=True)
+        st.image(image_url, use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        # --- ARTIST & ALBUM ---
+        artist = release.get('artist', 'Unknown')
+        album = release.get('album', '')
+
+        st.markdown(f"**{artist}**")
+        if album:
+            st.caption(album)
+
+        # --- GENRE PILLS ---
+        genres = release.get('genres', [])[:4]
+        if genres:
+            pills_html = "".join([
+                f'<span style="background:rgba(128,128,128,0.2); color:inherit; '
+                f'padding:3px 10px; border-radius:100px; font-size:0.65rem; font-weight:500; '
+                f'text-transform:uppercase; letter-spacing:0.04em; margin-right:5px; '
+                f'display:inline-block; margin-bottom:5px; border:1px solid rgba(128,128,128,0.3);">{g}</span>'
+                for g in genres
+            ])
+            st.markdown(f'<div style="margin-top:8px;">{pills_html}</div>', unsafe_allow_html=True)
+
+        # --- ACTION BUTTONS ---
+        col_play, col_links, col_check = st.columns([2, 2, 1])
+
+        with col_play:
+            youtube_url = release.get('links', {}).get('youtube', '#')
+            st.link_button("▶️ Play", youtube_url, use_container_width=True)
+
+        with col_links:
+            with st.popover("🔗", use_container_width=True):
+                st.markdown("**Suche auf:**")
+                bandcamp_url = release.get('links', {}).get('bandcamp', '#')
+                st.markdown(f"🎸 [Bandcamp]({bandcamp_url})")
+                sc_links = get_soundcloud_links(artist, album)
+                st.markdown(f"☁️ [SoundCloud]({sc_links['mobile']})")
+                apple_url = release.get('links', {}).get('apple', '#')
+                st.markdown(f"🍎 [Apple Music]({apple_url})")
+                if release.get('detail_url'):
+                    st.divider()
+                    st.markdown(f"🌐 [Nodata Original]({release['detail_url']})")
+
+        with col_check:
+            btn_icon = "✓" if is_seen else "○"
+            btn_type = "secondary" if is_seen else "primary"
+            btn_help = "Als ungesehen markieren" if is_seen else "Als gesehen markieren"
+
+            st.button(btn_icon, key=f"seen_{idx}_{key}", type=btn_type, help=btn_help,
+                      use_container_width=True, on_click=toggle_seen, args=(key,))
+
+def apply_grid_toggles():
+    """on_change-Callback des virtuellen Grids: übernimmt einen Batch Gesehen-Toggles."""
+    for release_id, seen in grid_toggles(st.session_state.release_grid):
+        if seen:
+            mark_as_seen(release_id)
+        else:
+            unmark_as_seen(release_id)
+
+@fragment
+def render_virtual_grid(releases):
+    """
+    Rendert das Browse-Grid als ein Element (release_grid Custom Component).
+
+    Das Frontend zeichnet nur sichtbare Karten und schickt Gesehen-Toggles
+    gesammelt zurück: ein Batch = ein Fragment-Rerun statt einem pro Klick.
+    """
+    flush_seen_cookie()
+    release_grid(releases, st.session_state.seen_releases, key="release_grid", on_change=apply_grid_toggles)
+
 # --- Header ---
 st.markdown("""
 <div class="app-header">
@@ -674,105 +896,72 @@ with tab_browse:
     # Search Input
     search = st.text_input("🔍 Suche nach Artist oder Album...", "", label_visibility="collapsed", placeholder="🔍 Suche nach Artist oder Album...")
 
-    # Filtering
-    if search:
-        search_lower = search.lower()
-        filtered_data = [
-            r for r in st.session_state.all_releases
-            if search_lower in r.get('artist', '').lower()
-            or search_lower in r.get('album', '').lower()
-            or any(search_lower in g.lower() for g in r.get('genres', []))
-        ]
+    # Filtering (neue Suche beginnt wieder auf der ersten Trefferseite)
+    if search != st.session_state.search_query:
+        st.session_state.search_query = search
+        st.session_state.search_page = 0
+    search_offset = st.session_state.search_page * SEARCH_PAGE_SIZE
+    search_total = 0
+
+    if USE_SQL_STORE:
+        release_store = get_release_store()
+        if search:
+            filtered_data = to_releases(release_store.query(
+                search=search, limit=SEARCH_PAGE_SIZE, offset=search_offset
+            ))
+            search_total = release_store.count(search=search)
+        else:
+            filtered_data = to_releases(release_store.query(limit=st.session_state.page_size))
+        is_search_mode = bool(search)
+    elif search:
+        # Invertierter Index statt linearem Scan: Top-Treffer nach Relevanz
+        search_index = get_search_index(get_release_store().version())
+        filtered_data, search_total = search_index.search(
+            search, limit=SEARCH_PAGE_SIZE, offset=search_offset,
+            extra=st.session_state.all_releases.added,
+        )
+        filtered_data = [st.session_state.all_releases.resolve(r) for r in filtered_data]
         is_search_mode = True
     else:
         filtered_data = st.session_state.all_releases[:st.session_state.page_size]
         is_search_mode = False
 
     # Stats
-    total_count = len(st.session_state.all_releases)
+    total_count = get_release_store().count() if USE_SQL_STORE else len(st.session_state.all_releases)
     seen_count = len(st.session_state.seen_releases)
     st.caption(f"📀 {total_count} Releases • ✅ {seen_count} gesehen")
 
     # --- Main Grid ---
     if not filtered_data:
         st.info("🔍 Keine Releases gefunden. Versuche einen anderen Suchbegriff.")
+    elif USE_VIRTUAL_GRID:
+        render_virtual_grid(filtered_data)
     else:
         cols = st.columns(4)
 
         for idx, release in enumerate(filtered_data):
             col_index = idx % 4
-            is_seen = release['id'] in st.session_state.seen_releases
 
             with cols[col_index]:
-                card_opacity = "0.4" if is_seen else "1"
-
-                with st.container(border=True):
-                    # --- SEEN BADGE ---
-                    if is_seen:
-                        st.markdown(
-                            '<div style="background:rgba(74,222,128,0.15); color:#4ade80; padding:4px 10px; '
-                            'border-radius:20px; font-size:0.7rem; font-weight:600; display:inline-block; '
-                            'margin-bottom:8px;">✓ Gesehen</div>',
-                            unsafe_allow_html=True
-                        )
-
-                    # --- COVER IMAGE ---
-                    image_url = release.get('image') or 'https://placehold.co/400x400/1a1a1f/444?text=No+Cover'
-                    st.markdown(f'<div style="opacity:{card_opacity}; transition:opacity 0.3s;">', unsafe_allow_html=True)
-                    st.image(image_url, use_container_width=True)
-                    st.markdown('</div>', unsafe_allow_html=True)
-
-                    # --- ARTIST & ALBUM ---
-                    artist = release.get('artist', 'Unknown')
-                    album = release.get('album', '')
-
-                    st.markdown(f"**{artist}**")
-                    if album:
-                        st.caption(album)
-
-                    # --- GENRE PILLS ---
-                    genres = release.get('genres', [])[:4]
-                    if genres:
-                        pills_html = "".join([
-                            f'<span style="background:rgba(128,128,128,0.2); color:inherit; '
-                            f'padding:3px 10px; border-radius:100px; font-size:0.65rem; font-weight:500; '
-                            f'text-transform:uppercase; letter-spacing:0.04em; margin-right:5px; '
-                            f'display:inline-block; margin-bottom:5px; border:1px solid rgba(128,128,128,0.3);">{g}</span>'
-                            for g in genres
-                        ])
-                        st.markdown(f'<div style="margin-top:8px;">{pills_html}</div>', unsafe_allow_html=True)
-
-                    # --- ACTION BUTTONS ---
-                    col_play, col_links, col_check = st.columns([2, 2, 1])
-
-                    with col_play:
-                        youtube_url = release.get('links', {}).get('youtube', '#')
-                        st.link_button("▶️ Play", youtube_url, use_container_width=True)
-
-                    with col_links:
-                        with st.popover("🔗", use_container_width=True):
-                            st.markdown("**Suche auf:**")
-                            bandcamp_url = release.get('links', {}).get('bandcamp', '#')
-                            st.markdown(f"🎸 [Bandcamp]({bandcamp_url})")
-                            sc_links = get_soundcloud_links(artist, album)
-                            st.markdown(f"☁️ [SoundCloud]({sc_links['mobile']})")
-                            apple_url = release.get('links', {}).get('apple', '#')
-                            st.markdown(f"🍎 [Apple Music]({apple_url})")
-                            if release.get('detail_url'):
-                                st.divider()
-                                st.markdown(f"🌐 [Nodata Original]({release['detail_url']})")
-
-                    with col_check:
-                        btn_icon = "✓" if is_seen else "○"
-                        btn_type = "secondary" if is_seen else "primary"
-                        btn_help = "Als ungesehen markieren" if is_seen else "Als gesehen markieren"
-
-                        if st.button(btn_icon, key=f"seen_{idx}_{release['id'][:20]}", type=btn_type, help=btn_help, use_container_width=True):
-                            if is_seen:
-                                unmark_as_seen(release['id'])
-                            else:
-                                mark_as_seen(release['id'])
-                            st.rerun()
+                render_browse_card(release, idx)
+
+    # --- Search Pagination ---
+    if is_search_mode and search_total > SEARCH_PAGE_SIZE:
+        col_prev, col_info, col_next = st.columns([1, 2, 1])
+        last_page = (search_total - 1) // SEARCH_PAGE_SIZE
+        with col_prev:
+            if st.button("← Zurück", disabled=st.session_state.search_page == 0, use_container_width=True):
+                st.session_state.search_page -= 1
+                st.rerun()
+        with col_info:
+            st.caption(
+                f"Treffer {search_offset + 1}–{min(search_offset + SEARCH_PAGE_SIZE, search_total)} "
+                f"von {search_total}"
+            )
+        with col_next:
+            if st.button("Weiter →", disabled=st.session_state.search_page >= last_page, use_container_width=True):
+                st.session_state.search_page += 1
+                st.rerun()
 
     # --- Load More / Footer ---
     if not is_search_mode:
@@ -781,8 +970,8 @@ with tab_browse:
         _, col_center, _ = st.columns([1, 2, 1])
 
         with col_center:
-            has_more_local = len(st.session_state.all_releases) > st.session_state.page_size
-            remaining = len(st.session_state.all_releases) - st.session_state.page_size
+            has_more_local = total_count > st.session_state.page_size
+            remaining = total_count - st.session_state.page_size
 
             if has_more_local:
                 btn_text = f"👇 Mehr laden ({remaining} weitere)"
@@ -791,16 +980,35 @@ with tab_browse:
 
             if st.button(btn_text, use_container_width=True, type="secondary"):
                 if has_more_local:
-                    st.session_state.page_size += 12
+                    st.session_state.page_size += PAGE_STEP
                     st.rerun()
                 else:
+                    # Erst hier laden: requests/bs4 sollen den Kaltstart der App nicht bremsen
+                    from scraper import drain_deferred, iter_releases
+
                     max_attempts = 20
+                    deadline = time.monotonic() + ARCHIVE_SEARCH_BUDGET
                     with st.status("🔍 Durchsuche Nodata-Archiv...", expanded=True) as status:
                         found_count = 0
                         attempts = 0
                         p_bar = status.progress(0)
 
+                        # Fehlende Genres vom letzten Klick mit einem Teil des Budgets nachholen
+                        if st.session_state.deferred_details:
+                            completed, _, st.session_state.deferred_details = drain_deferred(
+                                st.session_state.deferred_details, budget_seconds=ARCHIVE_SEARCH_BUDGET / 4
+                            )
+                            if completed:
+                                if USE_SQL_STORE:
+                                    get_release_store().append(completed)
+                                st.session_state.all_releases.replace(to_releases(completed))
+                                status.write(f"🏷 Genres für {len(completed)} Releases nachgeladen.")
+
                         while found_count < 8 and attempts < max_attempts:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                status.write("⏱ Zeitbudget erreicht, weiter beim nächsten Klick.")
+                                break
                             attempts += 1
                             page_to_scrape = st.session_state.current_scrape_page + 1
 
@@ -808,19 +1016,40 @@ with tab_browse:
                             p_bar.progress(min(attempts * 5, 100))
 
                             try:
-                                items = scrape_nodata(pages=1, start_page=page_to_scrape, deep_scrape=True)
-
-                                if not items:
-                                    status.write("📭 Ende des Archivs erreicht.")
+                                current_ids = st.session_state.all_releases.keys()
+                                scrape_stats = {}
+                                items_on_page = 0
+                                new_on_page = 0
+
+                                # Releases erscheinen einzeln, sobald ihre Genres geladen sind
+                                for item in iter_releases(
+                                    pages=1, start_page=page_to_scrape, deep_scrape=True,
+                                    known_ids=current_ids, stats=scrape_stats, budget_seconds=remaining
+                                ):
+                                    items_on_page += 1
+                                    item_key = release_key(item)
+                                    if item_key in current_ids:
+                                        continue
+                                    current_ids.add(item_key)
+                                    st.session_state.all_releases.append(Release.from_dict(item))
+                                    if USE_SQL_STORE:
+                                        get_release_store().append([item])
+                                    new_on_page += 1
+                                    found_count += 1
+                                    status.write(f"🆕 {item.get('artist', 'Unknown')} – {item.get('album', '')}")
+
+                                if not items_on_page:
+                                    if scrape_stats.get('failed_page'):
+                                        status.error("⚠️ Seite konnte nicht geladen werden, bitte später erneut versuchen.")
+                                    else:
+                                        status.write("📭 Ende des Archivs erreicht.")
                                     break
 
-                                current_ids = {x['id'] for x in st.session_state.all_releases}
-                                new_items = [x for x in items if x['id'] not in current_ids]
-
-                                if new_items:
-                                    st.session_state.all_releases.extend(new_items)
-                                    found_count += len(new_items)
-                                    status.write(f"✅ {len(new_items)} neue Releases gefunden!")
+                                if new_on_page:
+                                    status.write(f"✅ {new_on_page} neue Releases gefunden!")
+                                if scrape_stats.get('deferred'):
+                                    st.session_state.deferred_details.extend(scrape_stats['deferred'])
+                                    status.write(f"⏳ Genres für {len(scrape_stats['deferred'])} Releases folgen später.")
 
                                 st.session_state.current_scrape_page += 1
 
@@ -845,7 +1074,10 @@ with tab_browse:
 # ══════════════════════════════════════════════════════
 # RADIO TAB
 # ══════════════════════════════════════════════════════
-with tab_radio:
+@fragment
+def render_radio():
+    """Radio-Player als Fragment: Navigation, Shuffle und Merken laufen ohne den Browse-Tab neu."""
+    flush_seen_cookie()
     releases = st.session_state.all_releases
 
     if not releases:
@@ -859,7 +1091,7 @@ with tab_radio:
             r_album = current.get('album', '')
             r_image = current.get('image') or 'https://placehold.co/400x400/1a1a1f/444?text=No+Cover'
             r_genres = current.get('genres', [])[:5]
-            r_is_seen = current['id'] in st.session_state.seen_releases
+            r_is_seen = current.key in st.session_state.seen_releases
 
             # ── Top controls row ──────────────────────────────────
             col_heading, col_shuffle, col_seen = st.columns([3, 1.2, 1.2])
@@ -876,20 +1108,13 @@ with tab_radio:
 
             with col_shuffle:
                 shuffle_label = "🔀 Shuffle" if st.session_state.radio_shuffle else "▶️ Sequential"
-                if st.button(shuffle_label, use_container_width=True, key="radio_shuffle_btn"):
-                    st.session_state.radio_shuffle = not st.session_state.radio_shuffle
-                    init_radio_playlist()
-                    st.rerun()
+                st.button(shuffle_label, use_container_width=True, key="radio_shuffle_btn", on_click=toggle_radio_shuffle)
 
             with col_seen:
                 seen_label = "✓ Gesehen" if r_is_seen else "○ Merken"
                 seen_type = "secondary" if r_is_seen else "primary"
-                if st.button(seen_label, use_container_width=True, key="radio_seen_btn", type=seen_type):
-                    if r_is_seen:
-                        unmark_as_seen(current['id'])
-                    else:
-                        mark_as_seen(current['id'])
-                    st.rerun()
+                st.button(seen_label, use_container_width=True, key="radio_seen_btn", type=seen_type,
+                          on_click=toggle_seen, args=(current.key,))
 
             st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
 
@@ -951,17 +1176,14 @@ with tab_radio:
             nav_prev, nav_spacer, nav_next = st.columns([1, 2, 1])
 
             with nav_prev:
-                if st.button("⏮  Vorheriger", use_container_width=True, key="radio_prev"):
-                    radio_navigate(-1)
-                    st.rerun()
+                st.button("⏮  Vorheriger", use_container_width=True, key="radio_prev", on_click=radio_navigate, args=(-1,))
 
             with nav_spacer:
                 pass  # empty center
 
             with nav_next:
-                if st.button("Nächster  ⏭", use_container_width=True, key="radio_next", type="primary"):
-                    radio_navigate(1)
-                    st.rerun()
+                st.button("Nächster  ⏭", use_container_width=True, key="radio_next", type="primary",
+                          on_click=radio_navigate, args=(1,))
 
             # ── Upcoming queue ────────────────────────────────────
             st.markdown("<div style='height:12px'></div>", unsafe_allow_html=True)
@@ -990,6 +1212,12 @@ with tab_radio:
                         f'</div></div>'
                     )
                     st.markdown(img_html, unsafe_allow_html=True)
-                    if st.button("▶", key=f"q_play_{qi}_{playlist_pos}", use_container_width=True):
-                        st.session_state.radio_index = playlist_pos
-                        st.rerun()
+                    st.button("▶", key=f"q_play_{qi}_{playlist_pos}", use_container_width=True,
+                              on_click=radio_jump, args=(playlist_pos,))
+
+
+with tab_radio:
+    render_radio()
+
+if PROFILE_RUNS:
+    print(f"⏱ Voller Lauf: {(time.perf_counter() - run_started) * 1000:.1f} ms")
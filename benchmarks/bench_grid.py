@@ -0,0 +1,104 @@
+"""
+Benchmark: Browse-Grid aus Streamlit-Elementen vs. virtuelles Grid (release_grid).
+
+Startet app.py headless in einem temporären Verzeichnis mit --releases
+synthetischen Releases (fixtures.synthetic_releases) und zeigt alle auf
+einmal an (NODATA_PAGE_SIZE). Gemessen über das Websocket-Protokoll wie in
+bench_interaction.py:
+
+- Voller Lauf: Latenz, Anzahl Deltas (Elemente) und Payload
+- --toggles Gesehen-Toggles: im Karten-Grid ein Fragment-Rerun pro Klick,
+  im virtuellen Grid ein einziger Batch (ein Rerun)
+
+Usage:
+    python benchmarks/bench_grid.py [--releases 1000] [--toggles 10]
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import websockets  # noqa: E402
+from bench_interaction import REPO_ROOT, Session, free_port, start_server  # noqa: E402
+from fixtures import synthetic_releases  # noqa: E402
+
+APP_FILES = ("app.py", "storage.py", "search.py", "seen_state.py", "release_grid.py")
+
+
+def _prepare_app_dir(count: int) -> str:
+    app_dir = tempfile.mkdtemp(prefix="nodata_grid_")
+    for name in APP_FILES:
+        shutil.copy(os.path.join(REPO_ROOT, name), app_dir)
+    shutil.copytree(os.path.join(REPO_ROOT, "components"), os.path.join(app_dir, "components"))
+    with open(os.path.join(app_dir, "releases.json"), "w", encoding="utf-8") as f:
+        json.dump(synthetic_releases(count), f, ensure_ascii=False)
+    return app_dir
+
+
+async def _measure(port: int, grid: str, toggles: int) -> dict:
+    async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream", max_size=None,
+                                  subprotocols=["streamlit"]) as ws:
+        session = Session(ws)
+        for _ in range(2):  # Cookie-Sync der App braucht bis zu drei Läufe
+            await session.rerun()
+        full_run = await session.rerun()
+
+        started = time.perf_counter()
+        received = deltas = reruns = 0
+        if grid == "cards":
+            seen_buttons = [widget_id for widget_id in session.buttons if "-seen_" in widget_id][:toggles]
+            for widget_id in seen_buttons:
+                _, batch_received, batch_deltas = await session.rerun(widget_id, session.buttons[widget_id][1])
+                received, deltas, reruns = received + batch_received, deltas + batch_deltas, reruns + 1
+        else:
+            widget_id, fragment_id = next((widget_id, fragment_id)
+                                          for widget_id, (name, fragment_id) in session.components.items()
+                                          if name.endswith("release_grid"))
+            batch = {"batch": int(time.time() * 1000),
+                     "toggles": [[200000 + i, True] for i in range(1, toggles + 1)]}
+            _, received, deltas = await session.rerun(widget_id, fragment_id, json.dumps(batch))
+            reruns = 1
+        return {"full_run": full_run, "toggles": (time.perf_counter() - started, received, deltas, reruns)}
+
+
+def bench(app_dir: str, count: int, grid: str, toggles: int) -> dict:
+    port = free_port()
+    server = start_server(port, {"NODATA_GRID": grid, "NODATA_PAGE_SIZE": str(count)}, cwd=app_dir)
+    try:
+        return asyncio.run(_measure(port, grid, toggles))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--releases", type=int, default=1000)
+    parser.add_argument("--toggles", type=int, default=10)
+    args = parser.parse_args()
+
+    app_dir = _prepare_app_dir(args.releases)
+    try:
+        results = {grid: bench(app_dir, args.releases, grid, args.toggles) for grid in ("cards", "virtual")}
+    finally:
+        shutil.rmtree(app_dir)
+
+    print(f"\n{args.releases} Releases auf einer Seite")
+    print(f"{'':<28}{'Latenz':>10}{'Deltas':>9}{'Payload':>11}{'Reruns':>8}")
+    for grid, result in results.items():
+        seconds, received, deltas = result["full_run"]
+        print(f"{grid + ': voller Lauf':<28}{seconds * 1000:>8.0f}ms{deltas:>9}{received / 1024:>9.1f}KB{1:>8}")
+    for grid, result in results.items():
+        seconds, received, deltas, reruns = result["toggles"]
+        label = f"{grid}: {args.toggles} Toggles"
+        print(f"{label:<28}{seconds * 1000:>8.0f}ms{deltas:>9}{received / 1024:>9.1f}KB{reruns:>8}")
+
+
+if __name__ == "__main__":
+    main()
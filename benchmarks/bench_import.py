@@ -0,0 +1,115 @@
+"""
+Benchmark + Regressions-Check: Import-Zeit von CLI und App-Datenschicht.
+
+Startet für jeden Fall einen frischen Interpreter mit `-X importtime` und
+summiert die kumulative Zeit aller Module, die nicht schon beim nackten
+Interpreter-Start geladen werden. Geprüft wird außerdem, dass die schweren
+Abhängigkeiten (requests, bs4, lxml, multiprocessing) dabei nicht geladen
+werden, und dass app.py auf Modulebene nichts davon importiert.
+
+Schlägt ein Check fehl (Median über dem Schwellwert oder verbotenes Modul
+geladen), endet das Skript mit Exit-Code 1, z.B. für CI.
+
+Usage:
+    python benchmarks/bench_import.py [--rounds 5] [--factor 1.0]
+"""
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("requests", "bs4", "lxml", "multiprocessing")
+
+# (Name, Interpreter-Argumente, Schwellwert in ms). Vor dem Umbau auf Lazy
+# Imports lag `import scraper` bei ~155 ms, davon ~110 ms requests und ~50 ms bs4.
+CASES = (
+    ("import storage", ["-c", "import storage"], 40),
+    ("import http_client", ["-c", "import http_client"], 40),
+    ("import scraper", ["-c", "import scraper"], 90),
+    ("scraper.py --help", ["scraper.py", "--help"], 110),
+)
+
+# Module, die app.py nicht auf Modulebene importieren darf
+APP_FORBIDDEN = ("scraper", "http_client") + HEAVY_MODULES
+
+
+def _importtime(args: list) -> dict:
+    """Startet Python mit -X importtime und gibt {Top-Level-Modul: kumulative µs} zurück."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # .pyc nutzen wie im Betrieb
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.rstrip()] = int(cumulative)
+    return modules
+
+
+def _top_level(modules: dict, baseline: set) -> int:
+    """Summe der Top-Level-Einträge (keine Einrückung), die nicht zum Interpreter-Start gehören."""
+    return sum(
+        us for name, us in modules.items()
+        if name.startswith(" ") and not name.startswith("  ") and name.strip() not in baseline
+    )
+
+
+def _app_imports() -> set:
+    """Alle Module, die app.py auf Modulebene importiert."""
+    with open(os.path.join(REPO_ROOT, "app.py"), "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    names = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--factor", type=float, default=1.0, help="Schwellwerte skalieren (langsame Runner)")
+    args = parser.parse_args()
+
+    baseline = {name.strip() for name in _importtime(["-c", "pass"])}
+    failures = []
+
+    print(f"{'Fall':<22}{'Median ms':>12}{'Limit ms':>10}  Schwere Module")
+    for name, case_args, limit_ms in CASES:
+        _importtime(case_args)  # Warm-up, schreibt .pyc
+        runs = [_importtime(case_args) for _ in range(args.rounds)]
+        median_ms = statistics.median(_top_level(run, baseline) for run in runs) / 1000
+        loaded = sorted({m for run in runs for m in run if m.strip() in HEAVY_MODULES})
+        limit = limit_ms * args.factor
+        print(f"{name:<22}{median_ms:>12.1f}{limit:>10.0f}  {', '.join(m.strip() for m in loaded) or '-'}")
+        if median_ms > limit:
+            failures.append(f"{name}: {median_ms:.1f} ms > {limit:.0f} ms")
+        if loaded:
+            failures.append(f"{name}: lädt {', '.join(m.strip() for m in loaded)}")
+
+    app_heavy = sorted(_app_imports() & set(APP_FORBIDDEN))
+    print(f"{'app.py (Modulebene)':<22}{'':>12}{'':>10}  {', '.join(app_heavy) or '-'}")
+    if app_heavy:
+        failures.append(f"app.py importiert auf Modulebene: {', '.join(app_heavy)}")
+
+    if failures:
+        print("\n❌ Import-Regression:")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print("\n✅ Alle Import-Checks bestanden.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""
+Benchmark: Latenz einer Interaktion in der App, Vollläufe vs. Fragmente.
+
+Startet app.py mit `streamlit run` (headless) und spricht das Websocket-
+Protokoll wie der Browser: Klick senden, warten bis `script_finished`.
+Gemessen wird die End-to-End-Zeit auf Serverseite (ohne Rendern im
+Browser) und die Größe der gesendeten Deltas.
+
+Das Karten-Grid (NODATA_GRID=cards, das virtuelle Grid misst
+bench_grid.py) wird zuerst per "Mehr laden" auf --cards Karten gebracht, dann
+wird abwechselnd der Gesehen-Button einer Karte und "Nächster ⏭" im Radio
+geklickt. Vorher = NODATA_FRAGMENTS=0 (jeder Klick führt das ganze Skript
+aus), nachher = Standard (nur das betroffene Fragment läuft).
+
+Benötigt streamlit und websockets (kommt mit streamlit).
+
+Usage:
+    python benchmarks/bench_interaction.py [--cards 200] [--clicks 10]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Optional
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOAD_MORE_PREFIX = "👇 Mehr laden"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, env: dict, cwd: str = REPO_ROOT) -> subprocess.Popen:
+    """Startet app.py headless mit zusätzlichen Umgebungsvariablen und wartet auf /_stcore/health."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "app.py", "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=cwd, env=dict(os.environ, **env), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("Streamlit-Server startet nicht")
+
+
+class Session:
+    """Minimaler Browser-Ersatz: merkt sich Buttons und Custom Components aus den Deltas."""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.buttons = {}  # widget_id -> (label, fragment_id)
+        self.components = {}  # widget_id -> (component_name, fragment_id)
+
+    async def rerun(self, widget_id: str = "", fragment_id: str = "", json_value: Optional[str] = None) -> tuple:
+        """
+        Sendet einen (Teil-)Lauf und gibt (Sekunden, Bytes, Deltas) bis script_finished zurück.
+
+        Ohne json_value ist widget_id ein Button-Klick, sonst der neue Wert eines Components.
+        """
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        if widget_id:
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            if json_value is None:
+                state.trigger_value = True
+            else:
+                state.json_value = json_value
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+
+        started = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        received = deltas = 0
+        while True:
+            raw = await self.ws.recv()
+            received += len(raw)
+            forward = ForwardMsg()
+            forward.ParseFromString(raw)
+            kind = forward.WhichOneof("type")
+            if kind == "delta":
+                deltas += 1
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type") if forward.delta.WhichOneof("type") == "new_element" else None
+                if element_type == "button":
+                    self.buttons[element.button.id] = (element.button.label, forward.delta.fragment_id)
+                elif element_type == "component_instance":
+                    instance = element.component_instance
+                    self.components[instance.id] = (instance.component_name, forward.delta.fragment_id)
+            elif kind == "script_finished" and forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                # Bei st.rerun() im Skript folgt direkt der nächste Lauf, erst dessen Ende zählt
+                return time.perf_counter() - started, received, deltas
+
+    def find(self, predicate) -> tuple:
+        for widget_id, (label, fragment_id) in self.buttons.items():
+            if predicate(widget_id, label):
+                return widget_id, fragment_id
+        raise LookupError("Button nicht gefunden")
+
+    async def click(self, predicate) -> tuple:
+        widget_id, fragment_id = self.find(predicate)
+        return await self.rerun(widget_id, fragment_id)
+
+
+def _card_count(session: Session) -> int:
+    return sum("-seen_" in widget_id for widget_id in session.buttons)
+
+
+async def _measure(port: int, cards: int, clicks: int) -> dict:
+    async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream", max_size=None,
+                                  subprotocols=["streamlit"]) as ws:
+        session = Session(ws)
+        for _ in range(3):  # Cookie-Sync der App braucht bis zu drei Läufe
+            await session.rerun()
+        while _card_count(session) < cards:
+            try:
+                widget_id, fragment_id = session.find(lambda _, label: label.startswith(LOAD_MORE_PREFIX))
+            except LookupError:
+                break  # weniger Releases als --cards
+            session.buttons = {}
+            await session.rerun(widget_id, fragment_id)
+
+        results = {"Gesehen-Toggle": [], "Radio ⏭": []}
+        for _ in range(clicks):
+            results["Gesehen-Toggle"].append(await session.click(lambda widget_id, _: "-seen_0_" in widget_id))
+            results["Radio ⏭"].append(await session.click(lambda widget_id, _: widget_id.endswith("-radio_next")))
+    return {"cards": _card_count(session), **results}
+
+
+def bench(cards: int, clicks: int, fragments: bool) -> dict:
+    port = free_port()
+    server = start_server(port, {"NODATA_FRAGMENTS": "1" if fragments else "0", "NODATA_GRID": "cards"})
+    try:
+        return asyncio.run(_measure(port, cards, clicks))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=200)
+    parser.add_argument("--clicks", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = {label: bench(args.cards, args.clicks, fragments)
+            for label, fragments in (("Vollläufe", False), ("Fragmente", True))}
+    print(f"\nGrid mit {runs['Fragmente']['cards']} Karten, {args.clicks} Klicks pro Interaktion")
+    print(f"{'Interaktion':<18}{'Modus':<12}{'Median':>10}{'Max':>10}{'Deltas':>9}{'Payload':>11}")
+    for interaction in ("Gesehen-Toggle", "Radio ⏭"):
+        for label, result in runs.items():
+            samples = result[interaction]
+            latencies = [seconds * 1000 for seconds, _, _ in samples]
+            payload = statistics.median(received for _, received, _ in samples)
+            deltas = statistics.median(count for _, _, count in samples)
+            print(f"{interaction:<18}{label:<12}{statistics.median(latencies):>8.1f}ms{max(latencies):>8.1f}ms"
+                  f"{deltas:>9.0f}{payload / 1024:>9.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: Speicherbedarf der Release-Liste in der App (Dicts vs. Release).
+
+Misst mit tracemalloc, wie viel Speicher die geladene Liste belegt, einmal
+als Dictionaries wie in releases.json (inkl. gespeicherter 'links') und
+einmal als kompakte storage.Release Objekte. Dazu die Dateigröße mit und
+ohne 'links' (Format von compact()).
+
+Datensätze: die aktuelle releases.json und synthetische 100k Releases.
+
+Usage:
+    python benchmarks/bench_memory.py [--sizes 100000]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import _storable, to_releases  # noqa: E402
+from fixtures import load_releases, synthetic_releases  # noqa: E402
+
+
+def _retained(build) -> tuple:
+    """Führt build() aus und gibt (Ergebnis, belegte Bytes nach gc) zurück."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def _mb(size: int) -> str:
+    return f"{size / 1024 / 1024:.2f} MB"
+
+
+def bench(name: str, releases: list) -> None:
+    text = json.dumps(releases, indent=4, ensure_ascii=False)
+    compact_text = json.dumps([_storable(r) for r in releases], indent=4, ensure_ascii=False)
+
+    as_dicts, dict_size = _retained(lambda: json.loads(text))
+    del as_dicts
+    as_releases, release_size = _retained(lambda: to_releases(json.loads(text)))
+    sample = as_releases[len(as_releases) // 2]
+    assert sample['links'] == releases[len(releases) // 2]['links']
+    del as_releases
+
+    count = len(releases)
+    print(f"\n{name} ({count} Releases)")
+    print(f"{'':<22}{'Dicts':>14}{'Release':>14}{'Faktor':>10}")
+    print(f"{'Speicher':<22}{_mb(dict_size):>14}{_mb(release_size):>14}{dict_size / release_size:>9.1f}x")
+    print(f"{'pro Release':<22}{dict_size / count:>12.0f} B{release_size / count:>12.0f} B")
+    print(f"{'Datei (indent=4)':<22}{_mb(len(text.encode())):>14}{_mb(len(compact_text.encode())):>14}"
+          f"{len(text) / len(compact_text):>9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000])
+    args = parser.parse_args()
+
+    bench("releases.json", load_releases())
+    for size in args.sizes:
+        bench("synthetisch", synthetic_releases(size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: Detail-Seiten pro Sekunde mit und ohne Parse-Prozess-Pool.
+
+Simuliert einen großen Deep Scrape (z.B. Backfill): ein Fake-Client liefert
+die aufgezeichneten Detail-Seiten aus fixtures.py mit fester Latenz, die
+Fetch-Threads laufen wie im Scraper über _deep_scrape_releases. Verglichen
+wird Parsen im Fetch-Thread (0) mit 1..N Parse-Prozessen
+(scraper.set_parse_processes). Skaliert nur, wenn mehrere Kerne frei sind.
+
+Usage:
+    python benchmarks/bench_parse_pool.py [--pages 400] [--workers 16] [--latency 0.02]
+                                          [--processes 0 1 2 4]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper  # noqa: E402
+from fixtures import detail_pages  # noqa: E402
+
+
+class _FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _FakeClient:
+    """Liefert Fixture-Seiten nach `latency` Sekunden (sleep gibt den GIL frei wie echtes I/O)."""
+
+    rate_limiter = None
+
+    def __init__(self, pages: list, latency: float):
+        self.pages = pages
+        self.latency = latency
+
+    def get(self, url: str, headers: dict = None) -> _FakeResponse:
+        time.sleep(self.latency)
+        return _FakeResponse(self.pages[int(url.rsplit('/', 1)[1]) % len(self.pages)])
+
+
+def _run(count: int, workers: int, client: _FakeClient) -> float:
+    """Scraped `count` Detail-Seiten und gibt Seiten/s zurück."""
+    releases = [{'id': str(i), 'detail_url': f"https://nodata.tv/{i}"} for i in range(count)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        done = sum(1 for r in scraper._deep_scrape_releases(releases, workers=workers, client=client) if r['genres'])
+        elapsed = time.perf_counter() - start
+    assert done == count, f"nur {done}/{count} Seiten mit Genres"
+    return count / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--processes", type=int, nargs="+", default=[0, 1, 2, 4])
+    args = parser.parse_args()
+
+    client = _FakeClient(detail_pages(24), args.latency)
+    print(f"{args.pages} Detail-Seiten, {args.workers} Fetch-Threads, {args.latency * 1000:.0f} ms Latenz, "
+          f"{os.cpu_count()} CPU(s), Parser: {scraper.HTML_PARSER}")
+    print(f"{'Parse-Prozesse':<16}{'Seiten/s':>10}{'Faktor':>10}")
+    baseline = None
+    for processes in args.processes:
+        scraper.set_parse_processes(processes)
+        try:
+            _run(min(args.pages, 20), args.workers, client)  # Warm-up
+            rate = _run(args.pages, args.workers, client)
+        finally:
+            scraper.set_parse_processes(0)
+        baseline = baseline or rate
+        print(f"{processes:<16}{rate:>10.1f}{rate / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Micro-Benchmark: Parse-Zeit pro Seite je HTML-Backend.
+
+Vergleicht html.parser und lxml (falls installiert), jeweils mit vollem
+Dokument und mit SoupStrainer auf die benötigten Teilbäume.
+
+Usage:
+    python benchmarks/bench_parser.py [--rounds 20]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper  # noqa: E402
+from fixtures import detail_pages, listing_pages  # noqa: E402
+
+
+def _available_backends() -> list:
+    backends = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        backends.append("lxml")
+    except ImportError:
+        pass
+    return backends
+
+
+@contextlib.contextmanager
+def _strainers(enabled: bool):
+    """Schaltet die SoupStrainer des Scrapers temporär ab (volles Dokument parsen)."""
+    saved = scraper.LISTING_STRAINER, scraper.DETAIL_STRAINER
+    if not enabled:
+        scraper.LISTING_STRAINER = scraper.DETAIL_STRAINER = None
+    try:
+        yield
+    finally:
+        scraper.LISTING_STRAINER, scraper.DETAIL_STRAINER = saved
+
+
+def _time_per_page(func, pages: list, rounds: int) -> float:
+    """Durchschnittliche Zeit pro Seite in Millisekunden."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        func(pages[0])  # Warm-up
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for page in pages:
+                func(page)
+        elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(pages)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    listings = listing_pages(5)
+    details = detail_pages(12)
+    print(f"Fixtures: {len(listings)} Listing-Seiten (~{len(listings[0]) // 1024} KB), "
+          f"{len(details)} Detail-Seiten (~{len(details[0]) // 1024} KB)\n")
+
+    print(f"{'Backend':<14}{'Modus':<12}{'Listing ms/Seite':>18}{'Detail ms/Seite':>18}")
+    for backend in _available_backends():
+        for mode in ("voll", "strainer"):
+            with _strainers(enabled=mode == "strainer"):
+                listing_ms = _time_per_page(lambda c: scraper._parse_listing_page(c, parser=backend),
+                                            listings, args.rounds)
+                detail_ms = _time_per_page(lambda c: scraper._parse_release_details(c, parser=backend),
+                                           details, args.rounds)
+            print(f"{backend:<14}{mode:<12}{listing_ms:>18.2f}{detail_ms:>18.2f}")
+
+    print(f"\nAktives Backend im Scraper: {scraper.HTML_PARSER}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark: Browse-Suche, linearer Scan vs. search.SearchIndex.
+
+Der lineare Scan entspricht der bisherigen Suche in app.py (Substring über
+Artist, Album und Genres für jede Release, bei jedem Rerun). Der Index wird
+einmal pro Datenstand gebaut; gemessen werden Bauzeit, Speicher und die
+Latenz pro Suche (Median über mehrere Durchläufe) für typische Anfragen:
+Artist-Präfix, Album-Wort, Genre, mehrere Wörter und zwei Tippfehler
+(vertauschte Buchstaben am Ende und vorne). Findet der Index für einen
+Tippfehler nichts, bricht der Benchmark mit einem Fehler ab.
+
+Usage:
+    python benchmarks/bench_search.py [--sizes 10000 100000] [--repeat 20]
+"""
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search import SearchIndex, tokenize  # noqa: E402
+from storage import to_releases  # noqa: E402
+from fixtures import synthetic_releases  # noqa: E402
+
+
+def linear_search(releases: list, search: str) -> list:
+    search_lower = search.lower()
+    return [
+        r for r in releases
+        if search_lower in r.get('artist', '').lower()
+        or search_lower in r.get('album', '').lower()
+        or any(search_lower in g.lower() for g in r.get('genres', []))
+    ]
+
+
+def _queries(releases: list) -> list:
+    """Anfragen aus den Daten selbst, damit es bei jeder Größe Treffer gibt."""
+    sample = releases[len(releases) // 3]
+    artist_token = tokenize(sample.artist)[0]
+    album_token = max(tokenize(sample.album), key=len)
+    genre = sample.genres[0]
+    typo = album_token[:-2] + album_token[-1] + album_token[-2] if len(album_token) > 3 else album_token
+    swapped = album_token[0] + album_token[2] + album_token[1] + album_token[3:] if len(album_token) > 3 else album_token
+    return [
+        ("Artist-Präfix", artist_token[:3]),
+        ("Album-Wort", album_token),
+        ("Genre", genre),
+        ("Artist + Album", f"{artist_token} {album_token}"),
+        ("Tippfehler", typo),
+        ("Vertauschung", swapped),
+    ]
+
+
+def _median_ms(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def bench(size: int, repeat: int) -> None:
+    releases = to_releases(synthetic_releases(size))
+
+    start = time.perf_counter()
+    index = SearchIndex(releases)
+    build_s = time.perf_counter() - start
+
+    # Speicher separat messen, tracemalloc verfälscht die Bauzeit stark
+    gc.collect()
+    tracemalloc.start()
+    measured = SearchIndex(releases)
+    gc.collect()
+    index_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del measured
+
+    print(f"\n{size} Releases — Index: {build_s:.2f} s Bauzeit, {index_size / 1024 / 1024:.1f} MB")
+    print(f"{'Anfrage':<16}{'Query':<28}{'Scan':>10}{'Treffer':>9}{'Index':>10}{'Treffer':>9}{'Faktor':>9}")
+    for label, query in _queries(releases):
+        linear_ms = _median_ms(lambda: linear_search(releases, query), repeat)
+        index_ms = _median_ms(lambda: index.search(query), repeat)
+        linear_hits = len(linear_search(releases, query))
+        index_hits = index.search(query)[1]
+        print(f"{label:<16}{query[:26]:<28}{linear_ms:>8.1f}ms{linear_hits:>9}"
+              f"{index_ms:>8.2f}ms{index_hits:>9}{linear_ms / index_ms:>8.0f}x")
+        if label in ("Tippfehler", "Vertauschung") and not index_hits:
+            raise SystemExit(f"Tippfehler-Suche findet nichts für {query!r}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        bench(size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: Gesehen-Status im Cookie und beim Rendern (vorher vs. nachher).
+
+Vorher: JSON-Liste der IDs in einem einzigen Cookie, Prüfung per
+`key in list` für jede Karte. Nachher: Menge im Speicher, Cookie-Wert aus
+seen_state (Delta-Varints über Post-IDs, zlib, base64url), verteilt auf
+Stücke unter dem Browser-Limit von ~4 KB.
+
+Gemessen werden Cookie-Größe und Anzahl Cookies sowie die Zeit für die
+Gesehen-Prüfung von 48 Karten bei 50 bis 20000 gesehenen Releases.
+
+Usage:
+    python benchmarks/bench_seen_state.py [--counts 50 500 5000 20000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from seen_state import decode_seen, join_chunks, to_cookie_chunks  # noqa: E402
+
+BROWSER_COOKIE_LIMIT = 4096
+CARDS = 48
+
+
+def _check_us(seen, keys: list) -> float:
+    start = time.perf_counter()
+    for _ in range(20):
+        for key in keys:
+            key in seen  # noqa: B015
+    return (time.perf_counter() - start) / 20 * 1e6
+
+
+def bench(count: int, rng: random.Random) -> None:
+    # Gesehene Releases konzentrieren sich auf die neueren Post-IDs
+    seen = set(rng.sample(range(150000, 200000), count))
+    cards = rng.sample(range(150000, 200000), CARDS)
+
+    legacy = json.dumps(list(seen))
+    chunks = to_cookie_chunks(seen, "nodata_seen_v2")
+    cookies = dict(chunks)
+    assert decode_seen(join_chunks(cookies.get, "nodata_seen_v2")) == seen
+    compact_size = sum(len(value) for value in cookies.values())
+    largest = max(len(name) + 1 + len(value) for name, value in chunks)
+
+    legacy_note = "" if len(legacy) < BROWSER_COOKIE_LIMIT else " (über Limit)"
+    print(f"{count:>7}{len(legacy):>11} B{legacy_note:<13}{compact_size:>10} B{len(chunks):>8}{largest:>10} B"
+          f"{_check_us(list(seen), cards):>12.0f} µs{_check_us(seen, cards):>9.1f} µs")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 500, 5000, 20000])
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'gesehen':>7}{'JSON-Cookie':>13}{'':<13}{'kompakt':>12}{'Cookies':>8}{'größtes':>12}"
+          f"{'list-Check':>15}{'set-Check':>12}")
+    for count in args.counts:
+        bench(count, rng)
+
+
+if __name__ == "__main__":
+    main()
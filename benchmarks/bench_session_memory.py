@@ -0,0 +1,95 @@
+"""
+Benchmark: Speicher pro Browser-Session in der App (vorher vs. nachher).
+
+Vorher: load_initial_data() mit st.cache_data gibt jedem Aufrufer eine
+deserialisierte Kopie (pickle) der ganzen Release-Liste, die Session hält
+sie als eigene Liste, dazu die Radio-Playlist als Liste von ints.
+
+Nachher: alle Sessions teilen sich ein Tuple aus st.cache_resource, jede
+Session hält nur einen storage.ReleaseOverlay mit ihren Ergänzungen aus der
+Archivsuche und die Playlist als array('I').
+
+Gemessen wird mit tracemalloc, was eine zusätzliche Session belegt
+(Durchschnitt über mehrere simulierte Sessions, je 16 Releases aus der
+Archivsuche ergänzt).
+
+Usage:
+    python benchmarks/bench_session_memory.py [--sizes 100000] [--sessions 5]
+"""
+import argparse
+import gc
+import os
+import pickle
+import random
+import sys
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import Release, ReleaseOverlay, to_releases  # noqa: E402
+from fixtures import load_releases, synthetic_releases  # noqa: E402
+
+ADDED_PER_SESSION = 16
+
+
+def _archive_finds(count: int) -> list:
+    return [Release.from_dict({'id': f"Archiv {i}", 'artist': "Archiv", 'album': str(i),
+                               'detail_url': f"https://nodata.tv/{i + 1}"}) for i in range(count)]
+
+
+def session_before(cached: bytes) -> dict:
+    all_releases = pickle.loads(cached)  # st.cache_data: Kopie pro Aufruf
+    all_releases.extend(_archive_finds(ADDED_PER_SESSION))
+    playlist = list(range(len(all_releases)))
+    random.shuffle(playlist)
+    return {'all_releases': all_releases, 'radio_playlist': playlist}
+
+
+def session_after(shared: tuple) -> dict:
+    all_releases = ReleaseOverlay(shared)
+    for release in _archive_finds(ADDED_PER_SESSION):
+        all_releases.append(release)
+    playlist = array('I', range(len(all_releases)))
+    random.shuffle(playlist)
+    return {'all_releases': all_releases, 'radio_playlist': playlist}
+
+
+def _per_session(build, sessions: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    states = [build() for _ in range(sessions)]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del states
+    return size / sessions
+
+
+def bench(name: str, releases: list, sessions: int) -> None:
+    shared = tuple(to_releases(releases))
+    cached = pickle.dumps(list(shared))
+    before = _per_session(lambda: session_before(cached), sessions)
+    after = _per_session(lambda: session_after(shared), sessions)
+
+    print(f"\n{name} ({len(releases)} Releases, {sessions} Sessions)")
+    print(f"{'pro Session vorher':<24}{before / 1024 / 1024:>10.2f} MB")
+    print(f"{'pro Session nachher':<24}{after / 1024 / 1024:>10.2f} MB")
+    print(f"{'Faktor':<24}{before / after:>10.0f}x")
+    print(f"{'bei 50 Sessions':<24}{50 * before / 1024 / 1024:>7.1f} MB -> {50 * after / 1024 / 1024:.1f} MB"
+          " (+ einmal die geteilte Liste)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000])
+    parser.add_argument("--sessions", type=int, default=5)
+    args = parser.parse_args()
+
+    bench("releases.json", load_releases(), args.sessions)
+    for size in args.sizes:
+        bench("synthetisch", synthetic_releases(size), args.sessions)
+
+
+if __name__ == "__main__":
+    main()
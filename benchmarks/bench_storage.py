@@ -0,0 +1,100 @@
+"""
+Benchmark: Lade- und Suchlatenz JSON-Store vs. SQLite-Store.
+
+Erzeugt 10k und 100k synthetische Releases in einem Temp-Verzeichnis und
+misst je Backend:
+    ids       Alle IDs laden (Abgleich im Scraper)
+    seite     Erste Browse-Seite (12 Releases)
+    suche     Suche nach einem Artist-Präfix (max. 200 Treffer)
+
+Der JSON-Store muss für jede Abfrage alles laden und in Python filtern;
+"suche (warm)" misst nur den Listen-Scan, wie in der App mit st.cache_data.
+
+Usage:
+    python benchmarks/bench_storage.py [--sizes 10000 100000] [--rounds 5]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import JsonlReleaseStore, SqliteReleaseStore, release_sort_key  # noqa: E402
+from fixtures import synthetic_releases  # noqa: E402
+
+PAGE_SIZE = 12
+SEARCH_LIMIT = 200
+
+
+def _ms(func, rounds: int) -> float:
+    """Durchschnittliche Laufzeit in Millisekunden."""
+    func()  # Warm-up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def _scan(releases: list, term: str) -> list:
+    """Suche wie in app.py ohne SQLite: Substring über Artist, Album, Genres."""
+    term = term.lower()
+    return [
+        r for r in releases
+        if term in r.get('artist', '').lower()
+        or term in r.get('album', '').lower()
+        or any(term in g.lower() for g in r.get('genres', []))
+    ][:SEARCH_LIMIT]
+
+
+def bench_size(size: int, rounds: int, workdir: str) -> None:
+    releases = synthetic_releases(size)
+    releases.sort(key=release_sort_key, reverse=True)
+    term = releases[size // 2]['artist'].split()[0]
+
+    json_store = JsonlReleaseStore(os.path.join(workdir, f"{size}.json"), os.path.join(workdir, f"{size}.jsonl"))
+    json_store.append(releases)
+    json_store.compact()
+
+    start = time.perf_counter()
+    sql_store = SqliteReleaseStore(os.path.join(workdir, f"{size}.db"))
+    sql_store.append(releases)
+    import_s = time.perf_counter() - start
+
+    cached = json_store.load()
+    results = {
+        'json': {
+            'ids': _ms(json_store.ids, rounds),
+            'seite': _ms(lambda: json_store.load()[:PAGE_SIZE], rounds),
+            'suche': _ms(lambda: _scan(json_store.load(), term), rounds),
+            'suche (warm)': _ms(lambda: _scan(cached, term), rounds),
+        },
+        'sqlite': {
+            'ids': _ms(sql_store.ids, rounds),
+            'seite': _ms(lambda: sql_store.query(limit=PAGE_SIZE), rounds),
+            'suche': _ms(lambda: sql_store.query(search=term, limit=SEARCH_LIMIT), rounds),
+            'suche (warm)': _ms(lambda: sql_store.query(search=term, limit=SEARCH_LIMIT), rounds),
+        },
+    }
+
+    print(f"\n{size} Releases (Suchbegriff {term!r}, SQLite-Import {import_s:.1f}s, FTS5: {sql_store.has_fts})")
+    print(f"{'Abfrage':<16}{'JSON ms':>12}{'SQLite ms':>12}{'Faktor':>10}")
+    for name in results['json']:
+        json_ms, sql_ms = results['json'][name], results['sqlite'][name]
+        print(f"{name:<16}{json_ms:>12.2f}{sql_ms:>12.2f}{json_ms / sql_ms:>9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            bench_size(size, args.rounds, workdir)
+
+
+if __name__ == "__main__":
+    main()
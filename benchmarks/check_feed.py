@@ -0,0 +1,74 @@
+"""
+Regressions-Check: WordPress REST Feed vs. HTML-Listing.
+
+Normalisiert eine aufgezeichnete Feed-Seite (data/feed_page.json, Antwort
+von /wp-json/wp/v2/posts?_embed, auf die gelesenen Felder gekürzt) mit
+scraper._parse_feed_page und die Blog-Seite mit denselben Posts
+(data/blog_page.html) mit scraper._parse_listing_page. Beide Quellen
+müssen pro Post dieselben Release-Dictionaries liefern: Titel, Artist,
+Album, post_id, Datum, Bild, detail_url und Genres (ohne
+IGNORED_CATEGORIES, Reihenfolge egal).
+
+Bei Abweichungen endet das Skript mit Exit-Code 1, z.B. für CI.
+
+Usage:
+    python benchmarks/check_feed.py
+"""
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+FIELDS = ("id", "post_id", "artist", "album", "date_found", "image", "detail_url", "genres")
+
+
+def _parse(parser, filename: str) -> list:
+    with open(os.path.join(DATA_DIR, filename), "rb") as f:
+        content = f.read()
+    with contextlib.redirect_stdout(io.StringIO()):
+        return parser(content)
+
+
+def _value(release: dict, field: str):
+    value = release.get(field)
+    return sorted(value) if field == "genres" and value is not None else value
+
+
+def main() -> None:
+    feed = _parse(scraper._parse_feed_page, "feed_page.json")
+    listing = {release["post_id"]: release for release in _parse(scraper._parse_listing_page, "blog_page.html")}
+
+    errors = []
+    if len(feed) != len(listing):
+        errors.append(f"{len(feed)} Posts im Feed, {len(listing)} im Listing")
+    for release in feed:
+        expected = listing.get(release["post_id"])
+        if expected is None:
+            errors.append(f"Post {release['post_id']}: fehlt im Listing")
+            continue
+        if release["genres"] is None:
+            errors.append(f"Post {release['post_id']}: Feed liefert keine Genres")
+        for field in FIELDS:
+            if _value(release, field) != _value(expected, field):
+                errors.append(f"Post {release['post_id']} {field}: Feed {release.get(field)!r}, "
+                              f"Listing {expected.get(field)!r}")
+
+    print(f"{'Post':<8}{'Artist':<30}{'Album':<28}{'Datum':<12}Genres")
+    for release in feed:
+        print(f"{release['post_id']!s:<8}{release['artist'][:28]:<30}{release['album'][:26]:<28}"
+              f"{release['date_found']:<12}{', '.join(release['genres'] or [])}")
+    if errors:
+        print(f"\n✗ {len(errors)} Abweichungen zwischen Feed und Listing:")
+        for error in errors:
+            print(f"   {error}")
+        sys.exit(1)
+    print(f"\n✓ Feed und Listing liefern für {len(feed)} Posts dieselben Felder ({', '.join(FIELDS)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Aufgezeichnete Fixtures für die Benchmarks.
+
+Die Seiten werden deterministisch aus releases.json im Markup des
+Nodata-Themes gerendert (Header, Navigation, Sidebar und Footer inklusive),
+damit Parser-Benchmarks ohne Netzwerk und mit realistischem Seitengewicht
+laufen.
+"""
+import html
+import json
+import os
+import random
+
+from storage import generate_search_links
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RELEASES_FILE = os.path.join(REPO_ROOT, "releases.json")
+ARTICLES_PER_PAGE = 12
+
+
+def load_releases() -> list:
+    with open(RELEASES_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _chrome(body: str) -> str:
+    """Umgibt den Inhalt mit Head, Navigation, Sidebar und Footer wie im Theme."""
+    rng = random.Random(42)
+    scripts = "".join(
+        f'<script src="https://nodata.tv/wp-includes/js/lib-{i}.js?ver=6.{i}"></script>' for i in range(15)
+    )
+    inline_css = "<style>" + "".join(f".c{i}{{margin:{i}px;padding:{i}px}}" for i in range(300)) + "</style>"
+    nav = "".join(
+        f'<li class="menu-item menu-item-{i}"><a href="https://nodata.tv/category/genre-{i}">Genre {i}</a></li>'
+        for i in range(60)
+    )
+    sidebar = "".join(
+        f'<li><a href="https://nodata.tv/{190000 + rng.randint(0, 9999)}">Recent post {i}</a></li>'
+        for i in range(40)
+    )
+    return (
+        '<!DOCTYPE html><html lang="en-US"><head><meta charset="UTF-8"><title>Nodata.tv</title>'
+        f'{inline_css}{scripts}</head><body class="blog">'
+        f'<header id="header"><nav><ul class="menu">{nav}</ul></nav></header>'
+        f'<div id="content"><div class="container">{body}</div>'
+        f'<aside id="sidebar"><ul>{sidebar}</ul><div class="tagcloud">{nav}</div></aside></div>'
+        '<footer id="footer"><p>© Nodata.tv</p></footer></body></html>'
+    )
+
+
+def _slug(name: str) -> str:
+    return name.lower().replace(' ', '-')
+
+
+def render_listing_page(releases: list, category_classes: bool = False) -> bytes:
+    """Rendert eine Blog-Seite mit article.project-box Einträgen."""
+    articles = []
+    for release in releases:
+        categories = ""
+        if category_classes:
+            categories = " " + " ".join(f"category-{_slug(g)}" for g in release.get('genres', []))
+        articles.append(
+            f'<article class="project-box post type-post status-publish hentry{categories}">'
+            '<div class="visual"><div class="hover3"><div class="inside"><div class="area"><div class="object">'
+            f'<a class="title" href="{release.get("detail_url") or "#"}">{html.escape(release["id"])}</a>'
+            f'<p>{release["date_found"]}</p>'
+            '</div></div></div></div>'
+            f'<img src="{release.get("image") or ""}" alt="" width="400" height="400">'
+            '</div></article>'
+        )
+    return _chrome("".join(articles)).encode("utf-8")
+
+
+def render_detail_page(release: dict) -> bytes:
+    """Rendert eine Detail-Seite mit Tracklist und <ul class="meta">."""
+    tracklist = "".join(f"<li>{i:02d}. Track {i}</li>" for i in range(1, 15))
+    genres = ", ".join(
+        f'<a href="https://nodata.tv/category/{_slug(g)}" rel="category tag">{html.escape(g)}</a>'
+        for g in release.get('genres', []) + ['Album']
+    )
+    body = (
+        f'<article class="post"><h1 class="entry-title">{html.escape(release["id"])}</h1>'
+        f'<img src="{release.get("image") or ""}">'
+        f'<div class="entry-content"><p>{"Lorem ipsum dolor sit amet. " * 40}</p><ol>{tracklist}</ol></div>'
+        f'<ul class="meta"><li>Published on {release["date_found"]}</li><li>Posted in {genres}</li></ul>'
+        '</article>'
+    )
+    return _chrome(body).encode("utf-8")
+
+
+def listing_pages(count: int = 5, category_classes: bool = False) -> list:
+    """Gibt `count` Listing-Seiten (bytes) aus releases.json zurück."""
+    releases = load_releases()
+    pages = []
+    for i in range(count):
+        chunk = releases[(i * ARTICLES_PER_PAGE) % len(releases):][:ARTICLES_PER_PAGE]
+        pages.append(render_listing_page(chunk, category_classes=category_classes))
+    return pages
+
+
+def detail_pages(count: int = 12) -> list:
+    """Gibt `count` Detail-Seiten (bytes) aus releases.json zurück."""
+    releases = load_releases()
+    return [render_detail_page(releases[i % len(releases)]) for i in range(count)]
+
+
+def synthetic_releases(count: int, seed: int = 42) -> list:
+    """
+    Erzeugt `count` Releases im Format von releases.json.
+
+    Artists, Alben und Genres werden aus den echten Daten neu kombiniert,
+    Post-IDs und Datumswerte sind eindeutig und absteigend (neueste zuerst).
+    """
+    rng = random.Random(seed)
+    real = load_releases()
+    artists = [r['artist'] for r in real]
+    albums = [r['album'] for r in real]
+    genres = sorted({g for r in real for g in r.get('genres', [])})
+
+    releases = []
+    for i in range(count):
+        post_id = 200000 + count - i
+        artist = f"{rng.choice(artists)} {i % 997}"
+        album = rng.choice(albums)
+        day = i // 8  # ~8 Releases pro Tag
+        releases.append({
+            'id': f"{artist} / {album} #{post_id}",
+            'artist': artist,
+            'album': album,
+            'image': f"https://nodata.tv/wp-content/uploads/{post_id}.jpg",
+            'genres': rng.sample(genres, k=min(len(genres), rng.randint(1, 4))),
+            'date_found': f"{2026 - day // 365:04d}-{(day // 28) % 12 + 1:02d}-{day % 28 + 1:02d}",
+            'detail_url': f"https://nodata.tv/{post_id}",
+            'links': generate_search_links(artist, album),
+        })
+    return releases
@@ -0,0 +1,470 @@
+import copy
+import email.utils
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def lazy_import(name: str):
+    """
+    Gibt ein Modul zurück, das erst beim ersten Attributzugriff geladen wird.
+
+    requests und Co. kosten beim Import über 100 ms. So zahlen nur Aufrufe,
+    die wirklich HTTP brauchen, nicht schon `scraper.py --help` oder der
+    Start der App. Ist das Modul schon geladen, wird es direkt zurückgegeben.
+
+    Der erste Zugriff sollte nicht aus mehreren Threads gleichzeitig
+    passieren (LazyLoader ist vor Python 3.12 nicht threadsicher); hier
+    passiert er in HttpClient.__init__.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+requests = lazy_import("requests")
+
+# --- Configuration ---
+DEFAULT_TIMEOUT = 15
+DEFAULT_POOL_SIZE = 8  # Max. offene Verbindungen pro Host (>= Anzahl Worker)
+DEFAULT_POOL_HOSTS = 4  # nodata.tv, api.telegram.org, ...
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5  # 0.5s, 1s, 2s, ...
+MAX_BACKOFF = 30.0  # Obergrenze für Backoff und Retry-After
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+# Nur diese Methoden dürfen nach Timeouts und 5xx wiederholt werden (wie urllib3)
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"])
+DEFAULT_CACHE_MAX_BYTES = 5 * 1024 * 1024  # Obergrenze für den On-Disk Cache
+
+# Adaptiver Rate-Limiter (AIMD)
+DEFAULT_START_RPS = 2.0  # Startrate ohne gespeicherten Zustand
+DEFAULT_MIN_RPS = 0.5  # Untergrenze nach Backoffs
+LIMITER_MAX_RPS = 8.0  # Obergrenze ohne max_rate (der Scraper übergibt scraper.DEFAULT_MAX_RPS)
+AIMD_INCREASE = 0.5  # Additiver Anstieg: ca. +0.5 req/s pro Sekunde ohne Probleme
+AIMD_DECREASE = 0.5  # Multiplikativer Rückgang bei 429/503, Fehlern oder Latenzspitzen
+LATENCY_SPIKE_FACTOR = 3.0  # Spitze = Latenz > Faktor * gleitender Mittelwert ...
+MIN_SPIKE_LATENCY = 1.0  # ... und mindestens so viele Sekunden
+BACKOFF_COOLDOWN = 1.0  # Höchstens ein Rückgang pro Sekunde (parallele Antworten)
+BACKOFF_STATUS_CODES = frozenset([429, 503])
+
+
+class AdaptiveRateLimiter:
+    """
+    Thread-sicherer AIMD-Rate-Limiter (Additive Increase, Multiplicative Decrease).
+
+    Jeder Aufruf von wait() reserviert den nächsten freien Zeitslot gemäß der
+    aktuellen Rate, auch über parallele Worker hinweg. record() passt die
+    Rate nach jeder Antwort an: schnelle 2xx/3xx-Antworten erhöhen sie
+    langsam, 429/503, Verbindungsfehler und Latenzspitzen halbieren sie.
+    Der Zustand (Rate, Latenz-Mittelwert) lässt sich mit to_state() /
+    from_state() zwischen Läufen speichern.
+
+    Args:
+        rate: Startrate in Requests pro Sekunde
+        min_rate: Untergrenze
+        max_rate: Obergrenze
+        latency: Gleitender Latenz-Mittelwert in Sekunden (None = unbekannt)
+    """
+
+    def __init__(self, rate: float = DEFAULT_START_RPS, min_rate: float = DEFAULT_MIN_RPS,
+                 max_rate: float = LIMITER_MAX_RPS, latency: Optional[float] = None):
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        self.latency = latency
+        self.requests = 0
+        self.backoffs = 0
+        self.wait_seconds = 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._last_decrease = float('-inf')
+
+    @classmethod
+    def from_state(cls, state: Optional[dict], max_rate: float = LIMITER_MAX_RPS) -> "AdaptiveRateLimiter":
+        """Erstellt einen Limiter aus einem gespeicherten Zustand (siehe to_state)."""
+        state = state or {}
+        return cls(rate=state.get('rate', DEFAULT_START_RPS), max_rate=max_rate,
+                   latency=state.get('latency'))
+
+    def to_state(self) -> dict:
+        with self._lock:
+            latency = round(self.latency, 3) if self.latency is not None else None
+            return {'rate': round(self.rate, 3), 'latency': latency}
+
+    def set_max_rate(self, max_rate: float) -> None:
+        """Setzt eine neue Obergrenze (die aktuelle Rate wird ggf. gekappt)."""
+        with self._lock:
+            self.max_rate = max(max_rate, self.min_rate)
+            self.rate = min(self.rate, self.max_rate)
+
+    def wait(self) -> None:
+        """Blockiert, bis der nächste Request gesendet werden darf."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate
+
+        self.sleep(slot - now)
+
+    def sleep(self, seconds: float) -> None:
+        """Schläft und zählt die Zeit als Wartezeit (auch für Retry-After)."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self.wait_seconds += seconds
+        time.sleep(seconds)
+
+    def record(self, status_code: Optional[int], latency: float) -> None:
+        """
+        Passt die Rate an eine Antwort an.
+
+        Args:
+            status_code: HTTP-Status oder None bei Verbindungsfehler / Timeout
+            latency: Dauer des Requests in Sekunden
+        """
+        with self._lock:
+            self.requests += 1
+            spike = (
+                self.latency is not None
+                and latency > max(LATENCY_SPIKE_FACTOR * self.latency, MIN_SPIKE_LATENCY)
+            )
+            if status_code is None or status_code in BACKOFF_STATUS_CODES or spike:
+                self._decrease()
+            elif status_code < 400:
+                # +AIMD_INCREASE / rate pro Antwort = ca. +AIMD_INCREASE req/s pro Sekunde
+                self.rate = min(self.max_rate, self.rate + AIMD_INCREASE / self.rate)
+                self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'requests': self.requests,
+                'backoffs': self.backoffs,
+                'wait_seconds': self.wait_seconds,
+            }
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < BACKOFF_COOLDOWN:
+            return
+        self._last_decrease = now
+        self.rate = max(self.min_rate, self.rate * AIMD_DECREASE)
+        self.backoffs += 1
+
+
+class HttpClient:
+    """
+    Gemeinsamer HTTP-Client für alle Requests des Scrapers.
+
+    Basiert auf einer requests.Session mit Keep-Alive und Connection-Pool,
+    damit nicht jeder Request einen neuen TCP/TLS-Handshake bezahlt.
+    Antworten mit 429/5xx und Verbindungsfehler werden mit exponentiellem
+    Backoff wiederholt; ein Retry-After Header hat dabei Vorrang. Andere
+    Methoden als IDEMPOTENT_METHODS (z.B. POST an Telegram) werden nur
+    wiederholt, wenn die Verbindung gar nicht zustande kam oder der Server
+    mit 429 und Retry-After ablehnt, sonst käme der Request evtl. doppelt an.
+    Mit rate_limiter werden alle Requests an den Host von base_url
+    darüber getaktet (andere Hosts, z.B. Telegram, nicht).
+
+    Args:
+        base_url: Basis für relative URLs (z.B. lokaler Stub-Server in Tests)
+        headers: Default-Header für alle Requests
+        timeout: Default-Timeout in Sekunden
+        pool_size: Maximale Verbindungen pro Host
+        max_retries: Anzahl Wiederholungen nach dem ersten Versuch
+        backoff_factor: Basis-Wartezeit für den exponentiellen Backoff
+        rate_limiter: Optionaler AdaptiveRateLimiter für den Host von base_url
+    """
+
+    def __init__(self, base_url: str = "", headers: Optional[dict] = None,
+                 timeout: float = DEFAULT_TIMEOUT, pool_size: int = DEFAULT_POOL_SIZE,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter
+        self._limited_host = urllib.parse.urlsplit(self.base_url).netloc
+
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+
+        # Retries passieren in request(), nicht im Adapter
+        adapter = requests.adapters.HTTPAdapter(pool_connections=DEFAULT_POOL_HOSTS, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def url(self, path: str) -> str:
+        """Macht aus einem Pfad eine absolute URL relativ zu base_url."""
+        if urllib.parse.urlsplit(path).scheme:
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        """
+        Sendet einen Request mit Retry/Backoff.
+
+        Returns:
+            Die letzte Response (auch wenn sie nach allen Retries noch 429/5xx ist)
+
+        Raises:
+            requests.RequestException: Wenn auch der letzte Versuch fehlschlägt
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        url = self.url(url)
+        limiter = self._limiter_for(url)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        for attempt in range(self.max_retries):
+            try:
+                response = self._send(method, url, limiter, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not idempotent and not _is_connect_error(e):
+                    raise
+                self._sleep(self._backoff(attempt), limiter)
+                continue
+
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+
+            delay = _parse_retry_after(response.headers.get('Retry-After'))
+            if not idempotent and (response.status_code != 429 or delay is None):
+                return response
+            if delay is None:
+                delay = self._backoff(attempt)
+            print(f"    ↻ HTTP {response.status_code} für {url}, neuer Versuch in {delay:.1f}s")
+            response.close()
+            self._sleep(delay, limiter)
+
+        # Letzter Versuch: Fehler und Status gehen unverändert an den Aufrufer
+        return self._send(method, url, limiter, **kwargs)
+
+    def get(self, url: str, **kwargs) -> "requests.Response":
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> "requests.Response":
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self.backoff_factor * (2 ** attempt), MAX_BACKOFF)
+
+    def _limiter_for(self, url: str) -> Optional[AdaptiveRateLimiter]:
+        if self.rate_limiter is None:
+            return None
+        if self._limited_host and urllib.parse.urlsplit(url).netloc != self._limited_host:
+            return None
+        return self.rate_limiter
+
+    def _send(self, method: str, url: str, limiter: Optional[AdaptiveRateLimiter],
+              **kwargs) -> "requests.Response":
+        """Ein einzelner Versuch; mit Limiter getaktet und mit Latenz/Status gemeldet."""
+        if limiter is None:
+            return self.session.request(method, url, **kwargs)
+
+        limiter.wait()
+        start = time.monotonic()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            limiter.record(None, time.monotonic() - start)
+            raise
+        limiter.record(response.status_code, time.monotonic() - start)
+        return response
+
+    @staticmethod
+    def _sleep(seconds: float, limiter: Optional[AdaptiveRateLimiter]) -> None:
+        if limiter is not None:
+            limiter.sleep(seconds)
+        else:
+            time.sleep(seconds)
+
+
+def _is_connect_error(error: Exception) -> bool:
+    """True, wenn die Verbindung nicht zustande kam (der Request also nie gesendet wurde)."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, requests.adapters.NewConnectionError)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parst einen Retry-After Header (Sekunden oder HTTP-Datum).
+
+    Returns:
+        Wartezeit in Sekunden (begrenzt auf MAX_BACKOFF) oder None
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), MAX_BACKOFF)
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), MAX_BACKOFF)
+
+
+class ResponseCache:
+    """
+    Persistenter Cache für Conditional Requests (ETag / Last-Modified).
+
+    Pro URL werden die Validatoren der letzten 200-Antwort und das daraus
+    extrahierte Ergebnis gespeichert (nicht der HTML-Body). Antwortet der
+    Server mit 304, kann der Aufrufer das Ergebnis ohne erneutes Parsen
+    wiederverwenden. Die Größe ist begrenzt; verdrängt wird nach LRU.
+
+    Args:
+        path: JSON-Datei für die Persistenz (None = nur im Speicher)
+        max_bytes: Maximale Größe aller Einträge (serialisiert)
+        version: Format-Version der gespeicherten Ergebnisse. Eine Datei mit
+                 anderer Version wird verworfen (z.B. nach Parser-Änderungen).
+    """
+
+    def __init__(self, path: Optional[str] = None, max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+                 version: int = 1):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self._load()
+
+    def validators(self, url: str) -> dict:
+        """Gibt die Header für einen Conditional Request zurück (leer ohne Eintrag)."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if not entry:
+                return {}
+            headers = {}
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            return headers
+
+    def get(self, url: str):
+        """
+        Gibt eine Kopie des gespeicherten Ergebnisses zurück und zählt einen Treffer.
+
+        Returns:
+            Das Ergebnis oder None, wenn kein Eintrag (mehr) existiert
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            self._entries.move_to_end(url)
+            self.hits += 1
+            return copy.deepcopy(entry['result'])
+
+    def put(self, url: str, headers, result) -> None:
+        """Speichert Validatoren und Ergebnis einer 200-Antwort (zählt als Miss)."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+
+        with self._lock:
+            self.misses += 1
+            self._remove(url)
+
+            # Ohne Validatoren kann der Server nie mit 304 antworten
+            if not etag and not last_modified:
+                return
+
+            entry = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'result': copy.deepcopy(result),
+            }
+            entry['size'] = len(json.dumps(entry, ensure_ascii=False))
+            self._entries[url] = entry
+            self._size += entry['size']
+            self._evict()
+
+    def save(self) -> None:
+        """Schreibt den Cache atomar in die JSON-Datei (LRU-Reihenfolge bleibt erhalten)."""
+        if not self.path:
+            return
+        with self._lock:
+            data = {'version': self.version, 'entries': list(self._entries.items())}
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._size,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ Cache {self.path} nicht lesbar, starte leer: {e}")
+            return
+
+        if data.get('version', 1) != self.version:
+            print(f"♻️ Cache {self.path} hat altes Format, starte leer.")
+            return
+
+        for url, entry in data.get('entries', []):
+            self._entries[url] = entry
+            self._size += entry.get('size', 0)
+        self._evict()
+
+    def _remove(self, url: str) -> None:
+        entry = self._entries.pop(url, None)
+        if entry:
+            self._size -= entry.get('size', 0)
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.get('size', 0)
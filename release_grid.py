@@ -0,0 +1,70 @@
+import os
+from typing import Callable, Optional
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from storage import release_key
+
+# --- Configuration ---
+COMPONENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "components", "release_grid")
+GRID_HEIGHT = 900  # Höhe des Viewports in Pixeln, gescrollt wird innerhalb des Grids
+MAX_GENRES = 4  # Wie render_release_card: höchstens 4 Genre-Pills pro Karte
+
+_component = components.declare_component("release_grid", path=COMPONENT_DIR)
+
+
+def _grid_row(release) -> list:
+    """Kompakte Zeile für das Frontend: [key, artist, album, image, genres, detail_url]."""
+    return [
+        release_key(release),
+        release.get('artist') or "",
+        release.get('album') or "",
+        release.get('image'),
+        list(release.get('genres') or ())[:MAX_GENRES],
+        release.get('detail_url'),
+    ]
+
+
+def release_grid(releases: list, seen: set, key: str,
+                 on_change: Optional[Callable] = None, height: int = GRID_HEIGHT) -> None:
+    """
+    Rendert Releases als ein virtualisiertes Grid (ein Element statt ~10 pro Karte).
+
+    Das Frontend (components/release_grid/index.html) zeichnet nur die
+    sichtbaren Zeilen und sammelt Gesehen-Toggles, bevor es sie als ein
+    Batch zurückschickt. Jeder Batch löst genau einen Rerun aus; on_change
+    läuft davor und kann die Toggles mit grid_toggles(st.session_state[key])
+    übernehmen.
+
+    Args:
+        releases: Releases (storage.Release oder Dicts) in Anzeige-Reihenfolge
+        seen: Schlüssel der gesehenen Releases (siehe storage.release_key)
+        key: Widget-Key; unter st.session_state[key] liegt der letzte Batch
+        on_change: Callback, wenn ein neuer Batch ankommt
+        height: Höhe des Grids in Pixeln
+    """
+    rows = [_grid_row(release) for release in releases]
+    last_batch = st.session_state.get(key) or {}
+    _component(
+        rows=rows,
+        seen=[row[0] for row in rows if row[0] in seen],
+        # Bestätigt dem Frontend, dass der Batch übernommen ist und `seen` ihn enthält
+        applied_batch=last_batch.get('batch'),
+        height=height,
+        key=key,
+        default=None,
+        on_change=on_change,
+    )
+
+
+def grid_toggles(value: Optional[dict]) -> list:
+    """
+    Liest die Gesehen-Toggles aus einem Batch des Grids.
+
+    Returns:
+        Liste von (Release-Schlüssel, gesehen) Tupeln
+    """
+    if not value:
+        return []
+    return [(release_id, bool(seen)) for release_id, seen in value.get('toggles', [])]
@@ -1,18 +1,50 @@
-import requests
-from bs4 import BeautifulSoup
+import argparse
+import html
+import importlib.util
 import json
 import os
 import re
 from datetime import datetime
 import time
-import urllib.parse
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Optional
+
+from http_client import AdaptiveRateLimiter, HttpClient, ResponseCache, lazy_import
+from storage import (
+    COMPACT_THRESHOLD, DATA_FILE, LOG_FILE, SQLITE_FILE, STORE_BACKEND, STORE_BACKENDS,
+    extract_post_id, migrate_json_to_sqlite, open_store, release_key
+)
+
+# requests, bs4 und multiprocessing erst bei Bedarf laden: --help,
+# compact/migrate und der App-Start brauchen sie nicht (bs4 wird in
+# _make_soup, ProcessPoolExecutor in den Pool-Funktionen importiert)
+requests = lazy_import("requests")
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from bs4 import BeautifulSoup
+
+# lxml ist deutlich schneller als der eingebaute html.parser, aber optional
+# (hier nur prüfen, ob installiert; geladen wird es beim ersten Parsen)
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
 
 # --- Configuration ---
-DATA_FILE = "releases.json"
+CACHE_FILE = ".http_cache.json"  # Validatoren + extrahierte Ergebnisse für Conditional Requests
+CACHE_VERSION = 3  # Erhöhen, wenn sich das Format der extrahierten Ergebnisse ändert
+STATE_FILE = "scraper_state.json"  # Persistenter Scraper-Zustand (verschobene Details, ...)
+LIMITER_FILE = ".limiter_state.json"  # Gelernte Rate/Latenz, nicht im Git (ändert sich jeden Lauf)
+NODATA_BASE_URL = "https://nodata.tv"
 REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
 REQUEST_TIMEOUT = 15
-DEEP_SCRAPE_DELAY = 0.5  # Delay between detail page requests to avoid rate limiting
+DEFAULT_WORKERS = 4  # Parallele Detail-Requests pro Seite
+DEFAULT_PARSE_PROCESSES = 0  # Prozesse fürs HTML-Parsing (0 = im Fetch-Thread parsen)
+DEFAULT_MAX_RPS = 4.0  # Obergrenze für den adaptiven Rate-Limiter (alle Requests an Nodata)
+INCREMENTAL_MAX_PAGES = 10  # Sicherheitslimit für --incremental
+FEED_PAGE_SIZE = 100  # Posts pro Request über die WordPress REST API (Maximum: 100)
+SOURCES = ("html", "feed")  # html = Blog-Seiten parsen, feed = WordPress REST API
+REPAIR_MAX_ATTEMPTS = 3  # Danach landet ein Release im Dead-Letter (repair)
+BACKFILL_FILE = "backfill_state.json"  # Checkpoint für --backfill (erledigte Seiten)
+DEFAULT_BACKFILL_PROCESSES = 4  # Worker-Prozesse für --backfill
 
 # Telegram Configuration (via Environment Variables for security)
 TELEGRAM_TOKEN = os.environ.get("TELEGRAM_TOKEN")
@@ -25,18 +57,128 @@ IGNORED_CATEGORIES = frozenset([
     'Uncategorized', 'LP', 'Compilation', 'VA'
 ])
 
+# WordPress Kategorie-Slugs, deren Anzeigename nicht per Title-Case ableitbar ist
+CATEGORY_SLUG_NAMES = {
+    'ep': 'EP',
+    'lp': 'LP',
+    'va': 'VA',
+    'idm': 'IDM',
+    'drum-n-bass': 'Drum n Bass',
+    'lo-fi': 'Lo-Fi',
+    'synth-pop': 'Synth-pop',
+    'musique-concrete': 'Musique Concrète',
+}
+
+
+# =============================================================================
+# HTTP CLIENT
+# =============================================================================
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def create_client(base_url: str = NODATA_BASE_URL, workers: int = DEFAULT_WORKERS,
+                  rate_limiter: Optional[AdaptiveRateLimiter] = None) -> HttpClient:
+    """
+    Erstellt einen HttpClient mit den Scraper-Defaults.
+    
+    Alle Requests an base_url laufen über einen adaptiven Rate-Limiter
+    (AIMD), der sich an Antwortzeiten und 429/503 des Servers anpasst.
+    
+    Args:
+        base_url: Basis-URL der Seite (für Tests z.B. ein lokaler Stub-Server)
+        workers: Anzahl paralleler Worker, bestimmt die Größe des Connection-Pools
+        rate_limiter: Limiter, z.B. aus gespeichertem Zustand (default: neuer
+                      Limiter mit DEFAULT_MAX_RPS als Obergrenze)
+    """
+    return HttpClient(
+        base_url=base_url,
+        headers=REQUEST_HEADERS,
+        timeout=REQUEST_TIMEOUT,
+        pool_size=max(workers, 1) * 2,
+        rate_limiter=rate_limiter or AdaptiveRateLimiter(max_rate=DEFAULT_MAX_RPS),
+    )
+
+
+def get_default_client() -> HttpClient:
+    """Gibt den prozessweit geteilten HttpClient zurück (lazy erstellt)."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = create_client()
+        return _default_client
+
+
+# =============================================================================
+# PARSE POOL
+# =============================================================================
+
+_parse_pool: Optional["ProcessPoolExecutor"] = None
+_parse_pool_lock = threading.Lock()
+
+
+def set_parse_processes(processes: int) -> None:
+    """
+    Verlagert das HTML-Parsing in einen Prozess-Pool (0 = im Fetch-Thread parsen).
+    
+    BeautifulSoup hält beim Parsen den GIL, mehr Fetch-Threads helfen ab
+    einem Punkt also nicht mehr. Mit Pool laden die Threads nur noch (I/O)
+    und schicken die rohen Bytes an den Pool, der die extrahierten
+    Dictionaries zurückgibt; der Thread wartet dabei ohne GIL.
+    
+    Die Worker werden sofort gestartet, solange noch keine Fetch-Threads
+    laufen (fork aus einem Prozess mit aktiven Threads ist unsicher).
+    
+    Args:
+        processes: Anzahl Parse-Prozesse, z.B. os.cpu_count()
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(cancel_futures=True)
+            _parse_pool = None
+        if processes > 0:
+            _parse_pool = ProcessPoolExecutor(max_workers=processes)
+            _parse_pool.submit(int).result()
+
+
+def _extract_in_worker(extract, content: bytes) -> tuple:
+    """
+    Läuft im Parse-Prozess: Ergebnis plus Selektor-Pläne und die dabei
+    angefallenen Treffer/Detections, die sonst in der Kopie des Workers bleiben.
+    """
+    hits, detections = SELECTOR_PLANS.hits, SELECTOR_PLANS.detections
+    result = extract(content)
+    return (result, dict(SELECTOR_PLANS._plans),
+            SELECTOR_PLANS.hits - hits, SELECTOR_PLANS.detections - detections)
+
+
+def _run_extract(extract, content: bytes):
+    """Wendet `extract` an: im Parse-Pool, falls konfiguriert, sonst direkt."""
+    pool = _parse_pool
+    if pool is None:
+        return extract(content)
+    result, plans, hits, detections = pool.submit(_extract_in_worker, extract, content).result()
+    SELECTOR_PLANS.merge(plans, hits, detections)
+    return result
+
 
 # =============================================================================
 # TELEGRAM NOTIFICATIONS
 # =============================================================================
 
-def send_telegram_alert(new_releases: list, notify_enabled: bool = True) -> bool:
+def send_telegram_alert(new_releases: list, notify_enabled: bool = True,
+                        client: Optional[HttpClient] = None) -> bool:
     """
     Sendet eine Telegram-Benachrichtigung über neue Releases.
     
     Args:
         new_releases: Liste der neu gefundenen Release-Dictionaries
         notify_enabled: Wenn False, wird keine Nachricht gesendet (für Tests)
+        client: HttpClient für den Request (default: geteilter Client)
         
     Returns:
         True wenn erfolgreich, False bei Fehler oder fehlenden Credentials
@@ -115,7 +257,8 @@ def send_telegram_alert(new_releases: list, notify_enabled: bool = True) -> bool
     
     try:
         print(f"📤 Sende Telegram-Benachrichtigung ({count} Releases)...")
-        response = requests.post(api_url, json=payload, timeout=10)
+        client = client or get_default_client()
+        response = client.post(api_url, json=payload, timeout=10)
         
         if response.status_code == 200:
             result = response.json()
@@ -152,23 +295,40 @@ def _escape_html(text: str) -> str:
     )
 
 
-def get_existing_data() -> list:
-    """Lädt bestehende Release-Daten aus der JSON-Datei."""
-    if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
+def load_state() -> dict:
+    """Lädt den persistenten Scraper-Zustand (leer, wenn nicht vorhanden)."""
+    if os.path.exists(STATE_FILE):
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
             return json.load(f)
-    return []
+    return {}
 
 
-def generate_search_links(artist: str, title: str) -> dict:
-    """Generiert Such-Links für verschiedene Musik-Plattformen."""
-    query = urllib.parse.quote_plus(f"{artist} {title}")
-    return {
-        "youtube": f"https://www.youtube.com/results?search_query={query}",
-        "bandcamp": f"https://bandcamp.com/search?q={query}",
-        "soundcloud": f"https://soundcloud.com/search?q={query}",
-        "apple": f"https://music.apple.com/de/search?term={query}"
-    }
+def save_state(state: dict) -> None:
+    """Speichert den Scraper-Zustand."""
+    with open(STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=4, ensure_ascii=False)
+
+
+def load_limiter_state() -> Optional[dict]:
+    """Lädt den Zustand des Rate-Limiters vom letzten Lauf (None, wenn nicht vorhanden)."""
+    if os.path.exists(LIMITER_FILE):
+        with open(LIMITER_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return None
+
+
+def save_limiter_state(client: HttpClient) -> None:
+    """
+    Speichert den Zustand des Rate-Limiters von `client` (falls vorhanden).
+    
+    Getrennt von STATE_FILE, weil sich Rate und Latenz bei jedem Lauf
+    ändern; STATE_FILE wird vom Workflow committet, LIMITER_FILE nur
+    über den Actions-Cache behalten.
+    """
+    if client.rate_limiter is None:
+        return
+    with open(LIMITER_FILE, "w", encoding="utf-8") as f:
+        json.dump(client.rate_limiter.to_state(), f)
 
 
 def _parse_date_from_text(text: str) -> str:
@@ -243,7 +403,116 @@ def _parse_artist_album(full_text: str) -> tuple[str, str]:
     return (clean_text, "")
 
 
-def fetch_release_details(url: str) -> dict:
+def _fetch_and_extract(url: str, extract, client: HttpClient, cache: Optional[ResponseCache] = None):
+    """
+    Lädt eine Seite und wendet `extract` auf den Body an.
+    
+    Mit Cache werden die gespeicherten Validatoren (ETag / Last-Modified) als
+    Conditional Request mitgeschickt. Bei 304 wird das zuvor extrahierte
+    Ergebnis wiederverwendet, ohne die Seite erneut zu parsen.
+    
+    Args:
+        url: Absolute URL der Seite
+        extract: Modul-Funktion bytes -> Ergebnis (JSON-serialisierbar und
+                 picklebar, siehe set_parse_processes)
+        client: HttpClient für den Request
+        cache: Optionaler ResponseCache
+        
+    Returns:
+        Das extrahierte Ergebnis
+        
+    Raises:
+        requests.RequestException: Bei Netzwerkfehlern oder HTTP-Fehlerstatus
+    """
+    headers = cache.validators(url) if cache is not None else {}
+    response = client.get(url, headers=headers)
+    
+    if response.status_code == 304 and cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            print(f"   ↺ Unverändert (304), nutze Cache: {url}")
+            return cached
+        # Eintrag wurde zwischenzeitlich verdrängt -> ohne Validatoren neu laden
+        response = client.get(url)
+    
+    response.raise_for_status()
+    result = _run_extract(extract, response.content)
+    
+    if cache is not None:
+        cache.put(url, response.headers, result)
+    
+    return result
+
+
+# Nur die benötigten Teilbäume parsen: Artikel im Listing, <ul> (class="meta")
+# auf der Detail-Seite. Der Rest des Dokuments wird gar nicht erst aufgebaut.
+# Tag-Namen für SoupStrainer (None = volles Dokument).
+LISTING_STRAINER = 'article'
+DETAIL_STRAINER = 'ul'
+
+
+def _make_soup(content: bytes, parse_only: Optional[str] = None,
+               parser: Optional[str] = None) -> "BeautifulSoup":
+    """
+    Parst HTML mit dem schnellsten verfügbaren Backend.
+    
+    Args:
+        content: Roher HTML-Body
+        parse_only: Optionaler Tag-Name für einen SoupStrainer, um nur Teilbäume aufzubauen
+        parser: Backend überschreiben ("lxml", "html.parser"); default HTML_PARSER
+    """
+    from bs4 import BeautifulSoup, SoupStrainer
+    
+    strainer = SoupStrainer(parse_only) if parse_only else None
+    return BeautifulSoup(content, parser or HTML_PARSER, parse_only=strainer)
+
+
+def _parse_release_details(content: bytes, parser: Optional[str] = None) -> dict:
+    """
+    Extrahiert die Metadaten aus dem HTML einer Detail-Seite.
+    
+    Returns:
+        Dict mit extrahierten Details, mindestens {'genres': [...]}
+    """
+    details = {
+        'genres': [],
+        'label': None,
+        'catalog_number': None,
+    }
+    
+    soup = _make_soup(content, parse_only=DETAIL_STRAINER, parser=parser)
+    
+    # --- GENRES EXTRACTION ---
+    # Suche nach <ul class="meta"> welches die "Posted in: Genre1, Genre2" Info enthält
+    meta_section = soup.find('ul', class_='meta')
+    
+    if meta_section:
+        # Methode 1: Suche nach Links mit rel="category tag" (WordPress Standard)
+        genre_tags = meta_section.find_all('a', rel='category tag')
+        
+        if genre_tags:
+            raw_genres = [tag.get_text(strip=True) for tag in genre_tags]
+            # Filtere nicht-Genre Kategorien heraus
+            details['genres'] = [g for g in raw_genres if g not in IGNORED_CATEGORIES]
+        else:
+            # Methode 2: Fallback - Suche nach "Posted in" Text und extrahiere Links
+            for li in meta_section.find_all('li'):
+                li_text = li.get_text()
+                if 'Posted in' in li_text or 'Category' in li_text:
+                    links = li.find_all('a')
+                    raw_genres = [link.get_text(strip=True) for link in links]
+                    details['genres'] = [g for g in raw_genres if g not in IGNORED_CATEGORIES]
+                    break
+    
+    # --- OPTIONAL: Weitere Metadaten extrahieren ---
+    # Label Info (falls vorhanden in der Detail-Seite)
+    # Diese können später erweitert werden
+    
+    return details
+
+
+def fetch_release_details(url: str, client: Optional[HttpClient] = None,
+                          cache: Optional[ResponseCache] = None) -> dict:
     """
     Besucht die Detail-Seite eines Releases und extrahiert zusätzliche Metadaten.
     
@@ -253,9 +522,12 @@ def fetch_release_details(url: str) -> dict:
     
     Args:
         url: Die URL zur Nodata Detail-Seite
+        client: HttpClient für den Request (default: geteilter Client)
+        cache: Optionaler ResponseCache für Conditional Requests
         
     Returns:
-        Dict mit extrahierten Details, mindestens {'genres': [...]}
+        Dict mit extrahierten Details, mindestens {'genres': [...]}. Schlägt
+        der Request fehl, enthält es zusätzlich 'error' (Fehlerbeschreibung).
     """
     details = {
         'genres': [],
@@ -265,272 +537,1303 @@ def fetch_release_details(url: str) -> dict:
     
     try:
         print(f"  → Fetching details: {url}")
-        response = requests.get(url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT)
-        
-        if response.status_code != 200:
-            print(f"    ⚠ HTTP {response.status_code} für {url}")
-            return details
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # --- GENRES EXTRACTION ---
-        # Suche nach <ul class="meta"> welches die "Posted in: Genre1, Genre2" Info enthält
-        meta_section = soup.find('ul', class_='meta')
-        
-        if meta_section:
-            # Methode 1: Suche nach Links mit rel="category tag" (WordPress Standard)
-            genre_tags = meta_section.find_all('a', rel='category tag')
-            
-            if genre_tags:
-                raw_genres = [tag.get_text(strip=True) for tag in genre_tags]
-                # Filtere nicht-Genre Kategorien heraus
-                details['genres'] = [g for g in raw_genres if g not in IGNORED_CATEGORIES]
-            else:
-                # Methode 2: Fallback - Suche nach "Posted in" Text und extrahiere Links
-                for li in meta_section.find_all('li'):
-                    li_text = li.get_text()
-                    if 'Posted in' in li_text or 'Category' in li_text:
-                        links = li.find_all('a')
-                        raw_genres = [link.get_text(strip=True) for link in links]
-                        details['genres'] = [g for g in raw_genres if g not in IGNORED_CATEGORIES]
-                        break
-        
-        # --- OPTIONAL: Weitere Metadaten extrahieren ---
-        # Label Info (falls vorhanden in der Detail-Seite)
-        # Diese können später erweitert werden
+        client = client or get_default_client()
+        details = _fetch_and_extract(url, _parse_release_details, client, cache)
         
         if details['genres']:
             print(f"    ✓ Found genres: {', '.join(details['genres'][:3])}{'...' if len(details['genres']) > 3 else ''}")
         
     except requests.Timeout:
         print(f"    ⚠ Timeout für {url}")
+        details['error'] = "Timeout"
+    except requests.HTTPError as e:
+        print(f"    ⚠ HTTP {e.response.status_code} für {url}")
+        details['error'] = f"HTTP {e.response.status_code}"
     except requests.RequestException as e:
         print(f"    ⚠ Request error für {url}: {e}")
+        details['error'] = f"Request error: {e}"
     except Exception as e:
         print(f"    ⚠ Unerwarteter Fehler für {url}: {e}")
+        details['error'] = f"Unerwarteter Fehler: {e}"
     
     return details
 
-def _scrape_single_page(url: str, deep_scrape: bool = True) -> list:
+def _deep_scrape_releases(releases: list, workers: int = DEFAULT_WORKERS,
+                          client: Optional[HttpClient] = None,
+                          cache: Optional[ResponseCache] = None,
+                          deadline: Optional[float] = None,
+                          deferred: Optional[list] = None):
+    """
+    Holt die Genres für Releases einer Seite von den Detail-Seiten.
+    
+    Generator: liefert jedes Release, sobald seine Genres da sind. Die
+    Reihenfolge bleibt erhalten; Releases ohne detail_url kommen unverändert
+    zurück. Die Requests laufen in einem Thread-Pool mit höchstens `workers`
+    parallelen Verbindungen; der Rate-Limiter des Clients taktet sie über
+    alle Worker. Bricht der Aufrufer ab, werden offene Requests verworfen.
+    
+    Ist die Deadline erreicht, wird kein Detail-Request mehr gestartet: das
+    Release kommt ohne Genres zurück und landet in `deferred`. Schlägt ein
+    Request fehl, bekommt das Release die Markierung 'fetch_failed' (mit
+    Fehlerbeschreibung), damit `repair` es später findet.
+    
+    Args:
+        releases: Release-Dictionaries einer Listing-Seite (werden in-place ergänzt)
+        workers: Anzahl paralleler Detail-Requests (1 = sequentiell)
+        client: HttpClient für die Requests (default: geteilter Client)
+        cache: Optionaler ResponseCache für Conditional Requests
+        deadline: Zeitpunkt (time.monotonic) für den letzten Detail-Request
+        deferred: Liste, an die verschobene Releases angehängt werden
+        
+    Yields:
+        Die Releases aus `releases`, jeweils nach dem Detail-Request
+    """
+    if not releases:
+        return
+    
+    def enrich(release: dict) -> dict:
+        if deadline is not None and time.monotonic() >= deadline:
+            if deferred is not None:
+                deferred.append(release)
+            return release
+        if release.get('detail_url'):
+            details = fetch_release_details(release['detail_url'], client=client, cache=cache)
+            release['genres'] = details.get('genres', [])
+            if details.get('error'):
+                release['fetch_failed'] = details['error']
+            else:
+                release.pop('fetch_failed', None)
+        return release
+    
+    if workers <= 1:
+        for release in releases:
+            yield enrich(release)
+        return
+    
+    executor = ThreadPoolExecutor(max_workers=min(workers, len(releases)))
+    try:
+        # executor.map liefert die Ergebnisse in Eingabe-Reihenfolge, sobald sie fertig sind
+        yield from executor.map(enrich, releases)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Selektor-Ketten für Listing-Artikel (in Prioritätsreihenfolge)
+TITLE_SELECTORS = (
+    ('.visual .hover3 .inside .area .object a.title', lambda a: a.select_one('.visual .hover3 .inside .area .object a.title')),
+    ('h2.entry-title a', lambda a: a.select_one('h2.entry-title a')),
+    ('a.title', lambda a: a.select_one('a.title')),
+    ("find('a', class_='title')", lambda a: a.find('a', class_='title')),
+)
+DATE_SELECTORS = (
+    ('.visual .hover3 .inside .area .object p:last-of-type',
+     lambda a: a.select_one('.visual .hover3 .inside .area .object p:last-of-type')),
+    ('time.entry-date', lambda a: a.select_one('time.entry-date')),
+    ('.entry-meta', lambda a: a.select_one('.entry-meta')),
+)
+
+
+class SelectorPlanCache:
+    """
+    Merkt sich pro Seiten-Layout, welcher Selektor einer Kette trifft.
+    
+    Beim ersten Artikel eines Layouts wird die Kette der Reihe nach probiert
+    (Detection). Danach wird direkt der gemerkte Selektor verwendet; nur wenn
+    er nicht trifft, wird die Kette erneut durchsucht und der Plan ersetzt.
+    Die Pläne gelten seitenübergreifend für die Lebensdauer des Prozesses.
+    """
+    
+    def __init__(self):
+        self._plans = {}
+        self.hits = 0
+        self.detections = 0
+    
+    def select(self, layout: str, kind: str, chain: tuple, element):
+        """
+        Wendet den Plan für (layout, kind) auf element an.
+        
+        Returns:
+            Das gefundene Tag oder None, wenn kein Selektor der Kette trifft
+        """
+        key = (layout, kind)
+        planned = self._plans.get(key)
+        
+        if planned is not None:
+            result = chain[planned][1](element)
+            if result is not None:
+                self.hits += 1
+                return result
+        
+        self.detections += 1
+        for index, (_, select) in enumerate(chain):
+            if index == planned:
+                continue
+            result = select(element)
+            if result is not None:
+                self._plans[key] = index
+                return result
+        return None
+    
+    def merge(self, plans: dict, hits: int, detections: int) -> None:
+        """Übernimmt Pläne und Zähler aus einem Parse-Prozess (siehe _run_extract)."""
+        self._plans.update(plans)
+        self.hits += hits
+        self.detections += detections
+    
+    def stats(self) -> dict:
+        plans = {}
+        for (layout, kind), index in self._plans.items():
+            chain = TITLE_SELECTORS if kind == 'title' else DATE_SELECTORS
+            plans.setdefault(layout, {})[kind] = chain[index][0]
+        return {'plans': plans, 'hits': self.hits, 'detections': self.detections}
+
+
+# Prozessweiter Plan-Cache, damit Pläne auch über einzelne Seitenaufrufe
+# (z.B. die Archivsuche der App) hinweg erhalten bleiben
+SELECTOR_PLANS = SelectorPlanCache()
+
+
+def _category_name(slug: str) -> str:
+    """Wandelt einen WordPress Kategorie-Slug in den Anzeigenamen um ('deep-house' -> 'Deep House')."""
+    return CATEGORY_SLUG_NAMES.get(slug) or slug.replace('-', ' ').title()
+
+
+def _genres_from_listing(article) -> Optional[list]:
     """
-    Scraped eine einzelne Blog-Seite von Nodata.tv.
+    Liest die Genres aus den `category-<slug>` Klassen eines Listing-Artikels.
+    
+    WordPress setzt über post_class() für jede Kategorie eine CSS-Klasse auf
+    das <article>, dadurch ist meist kein Detail-Request nötig.
+    
+    Returns:
+        Liste der Genres (ohne IGNORED_CATEGORIES) oder None, wenn das
+        Markup keine Kategorie-Informationen enthält
+    """
+    slugs = [c[len('category-'):] for c in article.get('class', []) if c.startswith('category-')]
+    if not slugs:
+        return None
+    names = [_category_name(slug) for slug in slugs]
+    return [name for name in names if name not in IGNORED_CATEGORIES]
+
+
+def _parse_listing_page(content: bytes, parser: Optional[str] = None) -> list:
+    """
+    Extrahiert die Releases aus dem HTML einer Blog-Seite (ohne Detail-Infos).
+    
+    Returns:
+        Liste von Release-Dictionaries. 'genres' ist None, wenn das Listing
+        keine Kategorie-Informationen enthält (Detail-Seite nötig).
+    """
+    soup = _make_soup(content, parse_only=LISTING_STRAINER, parser=parser)
+    
+    page_releases = []
+    
+    # Im Blog View sind die Items in 'article.project-box'
+    layout = 'project-box'
+    articles = soup.find_all('article', class_='project-box')
+    
+    if not articles:
+        # Fallback: Versuche alternative Selektoren
+        layout = 'post'
+        articles = soup.find_all('article', class_='post')
+    
+    print(f"   Gefunden: {len(articles)} Artikel")
+    
+    for idx, article in enumerate(articles):
+        # --- TITEL & URL ---
+        # Selektor-Plan des Layouts, Fallback-Kette nur bei Fehlschlag
+        title_tag = SELECTOR_PLANS.select(layout, 'title', TITLE_SELECTORS, article)
+        
+        if not title_tag:
+            print(f"   ⚠ Artikel {idx+1}: Kein Titel gefunden, überspringe...")
+            continue
+        
+        full_text = title_tag.get_text(strip=True)
+        detail_url = title_tag.get('href', '')
+        
+        if not full_text:
+            continue
+        
+        # --- ARTIST / ALBUM PARSING ---
+        artist, album = _parse_artist_album(full_text)
+        
+        # --- BILD ---
+        img_tag = article.find('img')
+        img_url = None
+        if img_tag:
+            # Prüfe verschiedene Bild-Attribute (src, data-src für lazy loading)
+            img_url = img_tag.get('src') or img_tag.get('data-src') or img_tag.get('data-lazy-src')
+        
+        # --- DATUM ---
+        meta_p = SELECTOR_PLANS.select(layout, 'date', DATE_SELECTORS, article)
+        
+        pub_date = datetime.now().strftime("%Y-%m-%d")
+        if meta_p:
+            pub_date = _parse_date_from_text(meta_p.get_text())
+        
+        # --- GENRES (aus den Kategorie-Klassen, falls vorhanden) ---
+        genres = _genres_from_listing(article)
+        
+        # --- RELEASE DATA ---
+        release_data = {
+            "id": full_text,  # Titel-String, bleibt als Alias erhalten
+            "post_id": extract_post_id(detail_url),  # Kanonischer Schlüssel (release_key)
+            "artist": artist,
+            "album": album,
+            "image": img_url,
+            "date_found": pub_date,
+            "genres": genres,
+            "detail_url": detail_url,
+        }
+        page_releases.append(release_data)
+        
+        print(f"   ✓ {artist} - {album or '(Single)'}")
+    
+    return page_releases
+
+
+def _feed_terms(post: dict, taxonomy: str) -> Optional[list]:
+    """
+    Liest die Term-Namen einer Taxonomie aus `_embedded['wp:term']`.
+    
+    Returns:
+        Liste der Namen oder None, wenn der Post keine eingebetteten Terms hat
+    """
+    term_groups = post.get('_embedded', {}).get('wp:term')
+    if not term_groups:
+        return None
+    return [
+        html.unescape(term.get('name', ''))
+        for group in term_groups
+        for term in group
+        if term.get('taxonomy') == taxonomy
+    ]
+
+
+def _parse_feed_page(content: bytes) -> list:
+    """
+    Normalisiert eine Seite der WordPress REST API (/wp-json/wp/v2/posts?_embed)
+    in dieselben Release-Dictionaries wie _parse_listing_page.
+    
+    Returns:
+        Liste von Release-Dictionaries. 'genres' ist None, wenn die Antwort
+        keine eingebetteten Kategorien enthält (Detail-Seite nötig).
+    """
+    posts = json.loads(content)
+    print(f"   Gefunden: {len(posts)} Posts")
+    
+    page_releases = []
+    for post in posts:
+        # Titel kommt als gerendertes HTML (Entities, evtl. Tags)
+        rendered_title = post.get('title', {}).get('rendered', '')
+        full_text = html.unescape(re.sub(r'<[^>]+>', '', rendered_title)).strip()
+        if not full_text:
+            continue
+        
+        artist, album = _parse_artist_album(full_text)
+        
+        img_url = None
+        media = post.get('_embedded', {}).get('wp:featuredmedia') or []
+        if media and isinstance(media[0], dict):
+            img_url = media[0].get('source_url')
+        
+        pub_date = (post.get('date') or '')[:10] or datetime.now().strftime("%Y-%m-%d")
+        
+        categories = _feed_terms(post, 'category')
+        genres = None
+        if categories is not None:
+            genres = [c for c in categories if c not in IGNORED_CATEGORIES]
+        
+        page_releases.append({
+            "id": full_text,
+            "post_id": post.get('id') or extract_post_id(post.get('link')),
+            "artist": artist,
+            "album": album,
+            "image": img_url,
+            "date_found": pub_date,
+            "genres": genres,
+            "detail_url": post.get('link', ''),
+        })
+        
+        print(f"   ✓ {artist} - {album or '(Single)'}")
+    
+    return page_releases
+
+
+# Parser pro Quelle: bytes -> Liste von Release-Dictionaries
+_LISTING_PARSERS = {
+    "html": _parse_listing_page,
+    "feed": _parse_feed_page,
+}
+
+
+def _listing_url(client: HttpClient, page: int, source: str = "html") -> str:
+    """Baut die URL einer Listing-Seite für die gewählte Quelle."""
+    if source == "feed":
+        return client.url(f"/wp-json/wp/v2/posts?_embed&per_page={FEED_PAGE_SIZE}&page={page}")
+    # Seite 1 hat keine /page/1/ URL
+    if page == 1:
+        return client.url("/blog")
+    return client.url(f"/blog/page/{page}/")
+
+
+class EndOfArchive(Exception):
+    """Die angefragte Listing-Seite existiert nicht (hinter der letzten Seite)."""
+
+
+# WordPress antwortet hinter der letzten Seite mit 404 (Blog) bzw. 400 (REST API)
+END_OF_ARCHIVE_STATUS = {
+    "html": frozenset([404]),
+    "feed": frozenset([400, 404]),
+}
+
+
+def _iter_page(url: str, deep_scrape: bool = True, workers: int = DEFAULT_WORKERS,
+               client: Optional[HttpClient] = None,
+               cache: Optional[ResponseCache] = None,
+               known_ids: Optional[set] = None,
+               source: str = "html",
+               deadline: Optional[float] = None,
+               deferred: Optional[list] = None):
+    """
+    Scraped eine einzelne Blog-Seite (oder Feed-Seite) von Nodata.tv.
+    
+    Generator: jedes Release wird geliefert, sobald es geparst und (falls
+    nötig) mit Genres von der Detail-Seite ergänzt ist, in Listing-Reihenfolge.
+    Fehler werden nicht verschluckt: der Aufrufer muss zwischen Ende des
+    Archivs und vorübergehenden Fehlern unterscheiden können. Fehler beim
+    Laden der Listing-Seite treten beim ersten next() auf.
     
     Args:
         url: Die URL der Blog-Seite
         deep_scrape: Wenn True, werden Detail-Seiten für Genres besucht
+        workers: Anzahl paralleler Detail-Requests
+        client: HttpClient für alle Requests (default: geteilter Client)
+        cache: Optionaler ResponseCache für Conditional Requests
+        known_ids: Schlüssel (release_key) gespeicherter Releases; für diese wird keine
+                   Detail-Seite geladen (Genres bleiben leer)
+        source: "html" (Blog-Seite) oder "feed" (WordPress REST API)
+        deadline: Nach diesem Zeitpunkt (time.monotonic) keine Detail-Requests mehr
+        deferred: Liste für Releases, deren Detail-Request verschoben wurde
         
+    Yields:
+        Release-Dictionaries (keine, wenn die Seite keine Releases enthält)
+        
+    Raises:
+        EndOfArchive: Wenn die Seite nicht existiert (404 bzw. 400 beim Feed)
+        requests.RequestException: Bei Netzwerkfehlern oder anderem HTTP-Fehlerstatus
+    """
+    client = client or get_default_client()
+    page_releases = _fetch_listing(url, client, cache, source)
+    yield from _enrich_page(
+        page_releases, deep_scrape=deep_scrape, workers=workers, client=client, cache=cache,
+        known_ids=known_ids, deadline=deadline, deferred=deferred
+    )
+
+
+def _fetch_listing(url: str, client: HttpClient, cache: Optional[ResponseCache] = None,
+                   source: str = "html") -> list:
+    """
+    Lädt und parst eine Listing-Seite (ohne Detail-Requests).
+    
     Returns:
-        Liste von Release-Dictionaries
+        Release-Dictionaries; genres ist None, wenn das Listing keine Kategorien enthält
+        
+    Raises:
+        EndOfArchive: Wenn die Seite nicht existiert (404 bzw. 400 beim Feed)
+        requests.RequestException: Bei Netzwerkfehlern oder anderem HTTP-Fehlerstatus
     """
+    print(f"📄 Lade Seite: {url}")
     try:
-        print(f"📄 Lade Seite: {url}")
-        response = requests.get(url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        return _fetch_and_extract(url, _LISTING_PARSERS[source], client, cache)
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code in END_OF_ARCHIVE_STATUS[source]:
+            raise EndOfArchive(url) from e
+        raise
+
+
+def _enrich_page(page_releases: list, deep_scrape: bool = True, workers: int = DEFAULT_WORKERS,
+                 client: Optional[HttpClient] = None,
+                 cache: Optional[ResponseCache] = None,
+                 known_ids: Optional[set] = None,
+                 deadline: Optional[float] = None,
+                 deferred: Optional[list] = None):
+    """Ergänzt die Releases einer Listing-Seite um Genres und liefert sie einzeln (siehe _iter_page)."""
+    # --- DEEP SCRAPE: Genres von Detail-Seiten (parallel, rate-limited) ---
+    # Nur für Releases ohne Kategorie-Info im Listing. Bekannte Releases
+    # überspringen, sie werden vom Aufrufer ohnehin verworfen.
+    to_enrich = []
+    if deep_scrape:
+        to_enrich = [r for r in page_releases if r['genres'] is None]
+        from_listing = len(page_releases) - len(to_enrich)
+        if from_listing:
+            print(f"   🏷 {from_listing} Releases mit Genres aus dem Listing")
+        if known_ids:
+            unknown = [r for r in to_enrich if release_key(r) not in known_ids]
+            skipped = len(to_enrich) - len(unknown)
+            to_enrich = unknown
+            if skipped:
+                print(f"   ⏭ {skipped} bekannte Releases, keine Detail-Requests")
+    
+    # to_enrich ist eine Teilfolge von page_releases: die Detail-Ergebnisse
+    # kommen in derselben Reihenfolge, in der sie unten gebraucht werden
+    pending = {id(r) for r in to_enrich}
+    enriched = _deep_scrape_releases(
+        to_enrich, workers=workers, client=client, cache=cache,
+        deadline=deadline, deferred=deferred
+    )
+    try:
+        for release in page_releases:
+            if id(release) in pending:
+                next(enriched)
+            if release['genres'] is None:
+                release['genres'] = []
+            yield release
+    finally:
+        enriched.close()
+
+
+def _scrape_single_page(url: str, **kwargs) -> list:
+    """
+    Scraped eine Seite vollständig (siehe _iter_page für Argumente und Fehler).
+    
+    Returns:
+        Liste von Release-Dictionaries
+    """
+    return list(_iter_page(url, **kwargs))
+
+
+def _page_error_message(url: str, error: Exception) -> str:
+    """Beschreibt einen Fehler beim Laden einer Listing-Seite."""
+    if isinstance(error, requests.Timeout):
+        return f"Timeout beim Laden von {url}"
+    if isinstance(error, requests.RequestException):
+        return f"Netzwerkfehler für {url}: {error}"
+    return f"Unerwarteter Fehler beim Scrapen von {url}: {error}"
+
+
+class ScrapeResult(list):
+    """
+    Ergebnis von scrape_nodata: die Release-Liste plus Laufstatistiken.
+    
+    Verhält sich wie eine normale Liste, bestehender Code bleibt kompatibel.
+    
+    Attributes:
+        stats: Dict mit Kennzahlen des Laufs (z.B. Cache-Treffer)
+    """
+    
+    def __init__(self, releases=(), stats: Optional[dict] = None):
+        super().__init__(releases)
+        self.stats = stats or {}
+    
+    @property
+    def deferred(self) -> list:
+        """Releases, deren Detail-Request wegen des Zeitbudgets verschoben wurde."""
+        return self.stats.get('deferred', [])
+
+
+def _listing_pages(client: HttpClient, pages: int, start_page: int,
+                   cache: Optional[ResponseCache], stop_known: Optional[set],
+                   source: str, stats: dict, deadline: Optional[float] = None):
+    """
+    Lädt Listing-Seiten nacheinander und wertet die Abbruchbedingungen aus.
+    
+    Ende des Archivs, Fehler, leere Seiten, eine Seite nur mit bekannten
+    Releases und abgelaufenes Zeitbudget beenden den Generator und stehen
+    in `stats`.
+    
+    Yields:
+        (Seitennummer, Release-Dictionaries der Seite ohne Detail-Infos)
+    """
+    for i in range(pages):
+        current_page = start_page + i
         
-        page_releases = []
+        # Die erste Seite wird immer geladen, sonst gäbe es gar kein Ergebnis
+        if deadline is not None and i > 0 and time.monotonic() >= deadline:
+            print(f"⏱ Zeitbudget aufgebraucht, keine weiteren Seiten nach Seite {current_page - 1}.")
+            stats['budget_exhausted'] = True
+            break
         
-        # Im Blog View sind die Items in 'article.project-box'
-        articles = soup.find_all('article', class_='project-box')
+        url = _listing_url(client, current_page, source)
         
-        if not articles:
-            # Fallback: Versuche alternative Selektoren
-            articles = soup.find_all('article', class_='post')
+        print(f"\n[Seite {current_page}/{start_page + pages - 1}]")
         
-        print(f"   Gefunden: {len(articles)} Artikel")
+        try:
+            page_releases = _fetch_listing(url, client, cache, source)
+        except EndOfArchive:
+            print(f"📭 Seite {current_page} existiert nicht. Ende des Archivs erreicht.")
+            stats['end_of_archive'] = current_page
+            break
+        except Exception as e:
+            # Vorübergehender Fehler, nicht das Ende des Archivs
+            print(f"⚠ {_page_error_message(url, e)}")
+            stats['failed_page'] = current_page
+            break
         
-        for idx, article in enumerate(articles):
-            # --- TITEL & URL ---
-            # Primärer Selektor für Blog View
-            title_tag = article.select_one('.visual .hover3 .inside .area .object a.title')
-            
-            # Fallback Selektoren für verschiedene Themes/Layouts
-            if not title_tag:
-                title_tag = article.select_one('h2.entry-title a')
-            if not title_tag:
-                title_tag = article.select_one('a.title')
-            if not title_tag:
-                title_tag = article.find('a', class_='title')
-            
-            if not title_tag:
-                print(f"   ⚠ Artikel {idx+1}: Kein Titel gefunden, überspringe...")
-                continue
-            
-            full_text = title_tag.get_text(strip=True)
-            detail_url = title_tag.get('href', '')
-            
-            if not full_text:
-                continue
-            
-            # --- ARTIST / ALBUM PARSING ---
-            artist, album = _parse_artist_album(full_text)
-            
-            # --- BILD ---
-            img_tag = article.find('img')
-            img_url = None
-            if img_tag:
-                # Prüfe verschiedene Bild-Attribute (src, data-src für lazy loading)
-                img_url = img_tag.get('src') or img_tag.get('data-src') or img_tag.get('data-lazy-src')
-            
-            # --- DATUM ---
-            meta_p = article.select_one('.visual .hover3 .inside .area .object p:last-of-type')
-            if not meta_p:
-                meta_p = article.select_one('time.entry-date')
-            if not meta_p:
-                meta_p = article.select_one('.entry-meta')
-            
-            pub_date = datetime.now().strftime("%Y-%m-%d")
-            if meta_p:
-                pub_date = _parse_date_from_text(meta_p.get_text())
-            
-            # --- SEARCH LINKS ---
-            links = generate_search_links(artist, album)
-            
-            # --- DEEP SCRAPE: Genres von Detail-Seite ---
-            genres = []
-            if deep_scrape and detail_url:
-                time.sleep(DEEP_SCRAPE_DELAY)  # Rate limiting
-                details = fetch_release_details(detail_url)
-                genres = details.get('genres', [])
-            
-            # --- RELEASE DATA ---
-            release_data = {
-                "id": full_text,  # Unique ID bleibt der volle Original-String
-                "artist": artist,
-                "album": album,
-                "image": img_url,
-                "date_found": pub_date,
-                "genres": genres,
-                "detail_url": detail_url,
-                "links": links
-            }
-            page_releases.append(release_data)
-            
-            print(f"   ✓ {artist} - {album or '(Single)'}")
+        if not page_releases:
+            print(f"⚠ Keine Releases auf Seite {current_page} erkannt.")
+            break
         
-        return page_releases
+        stats['pages_scraped'] = i + 1
+        yield current_page, page_releases
         
-    except requests.Timeout:
-        print(f"⚠ Timeout beim Laden von {url}")
-        return []
-    except requests.RequestException as e:
-        print(f"⚠ Netzwerkfehler für {url}: {e}")
-        return []
-    except Exception as e:
-        print(f"⚠ Unerwarteter Fehler beim Scrapen von {url}: {e}")
-        return []
+        # Post-IDs steigen nicht in Listing-Reihenfolge, daher zählt nur, ob
+        # die Seite noch unbekannte Releases enthält
+        if stop_known is not None and all(release_key(r) in stop_known for r in page_releases):
+            print(f"✓ Seite {current_page} enthält nur bekannte Releases.")
+            stats['reached_known'] = True
+            break
 
 
-def scrape_nodata(pages: int = 1, start_page: int = 1, deep_scrape: bool = True) -> list:
+def iter_releases(pages: int = 1, start_page: int = 1, deep_scrape: bool = True,
+                  workers: int = DEFAULT_WORKERS, max_rps: float = DEFAULT_MAX_RPS,
+                  client: Optional[HttpClient] = None,
+                  cache: Optional[ResponseCache] = None,
+                  known_ids: Optional[set] = None,
+                  stop_known: Optional[set] = None,
+                  source: str = "html",
+                  stats: Optional[dict] = None,
+                  budget_seconds: Optional[float] = None):
     """
-    Hauptfunktion zum Scrapen von Nodata.tv Releases.
+    Streamt Nodata.tv Releases Seite für Seite.
+    
+    Jedes Release wird geliefert, sobald es geparst und mit Genres ergänzt
+    ist; es wird nie mehr als eine Seite im Speicher gehalten. Bricht der
+    Aufrufer die Iteration ab, werden keine weiteren Seiten geladen.
+    
+    Mit Zeitbudget werden zuerst die Listing-Seiten geladen (ein Request pro
+    Seite, bestimmt Reihenfolge und Abbruch), danach die Detail-Seiten von
+    neu nach alt. Was nach Ablauf des Budgets noch fehlt, wird nicht mehr
+    angefragt: die Releases kommen ohne Genres und stehen in stats['deferred'].
     
     Args:
         pages: Anzahl der zu scrapenden Seiten
         start_page: Startseite (1-basiert)
         deep_scrape: Wenn True, werden Detail-Seiten für Genres besucht.
-                     Setzt DEEP_SCRAPE_DELAY (0.5s) zwischen Requests.
+                     Die Detail-Requests laufen parallel, sind aber über den
+                     adaptiven Rate-Limiter des Clients getaktet.
                      Wenn False, schnelleres Scraping ohne Genre-Info.
+        workers: Anzahl paralleler Detail-Requests (1 = sequentiell)
+        max_rps: Obergrenze für den Rate-Limiter des Clients (alle Requests)
+        client: HttpClient für alle Requests (default: geteilter Client).
+                Die Listing-URLs werden relativ zu client.base_url gebildet.
+        cache: Optionaler ResponseCache. Unveränderte Seiten (304) werden
+               nicht erneut geparst; Treffer/Misses stehen in stats.
+        known_ids: Schlüssel (release_key) gespeicherter Releases. Für sie wird beim Deep
+                   Scrape keine Detail-Seite geladen; sie erscheinen trotzdem
+                   (ohne Genres) im Ergebnis.
+        stop_known: Schlüssel (release_key) vollständig erfasster Releases.
+                    Wenn gesetzt, wird nach der ersten Seite abgebrochen, deren
+                    Releases alle darin stehen; `pages` ist dann nur noch das
+                    Sicherheitslimit.
+        source: "html" parst die Blog-Seiten (~12 Posts pro Seite), "feed"
+                nutzt die WordPress REST API mit FEED_PAGE_SIZE Posts pro
+                Seite inkl. Kategorien. `pages` zählt Seiten der Quelle.
+        stats: Optionales Dict, das mit Kennzahlen des Laufs befüllt wird
+               (pages_scraped, cache_hits, rate_limit, end_of_archive, ...).
+               Vollständig, sobald der Generator erschöpft oder geschlossen ist.
+        budget_seconds: Zeitbudget für den Lauf (None = unbegrenzt)
     
-    Returns:
-        Liste aller gefundenen Releases
+    Yields:
+        Release-Dictionaries, neueste zuerst
         
     Example:
-        # Schnelles Scraping ohne Genres
-        releases = scrape_nodata(pages=5, deep_scrape=False)
-        
-        # Vollständiges Scraping mit Genres (langsamer)
-        releases = scrape_nodata(pages=5, deep_scrape=True)
+        for release in iter_releases(pages=3):
+            print(release['artist'], release['genres'])
     """
-    base_url = "https://nodata.tv/blog/page/{}/"
-    all_releases = []
+    client = client or get_default_client()
+    stats = stats if stats is not None else {}
+    cache_before = cache.stats() if cache is not None else None
+    plans_before = SELECTOR_PLANS.stats()
+    limiter = client.rate_limiter
+    if limiter is not None:
+        limiter.set_max_rate(max_rps)
+        limiter_before = limiter.stats()
+    started = time.monotonic()
+    deadline = started + budget_seconds if budget_seconds is not None else None
+    stats['pages_scraped'] = 0
+    stats['deferred'] = []
+    releases_found = 0
     
     mode = "Deep Scrape" if deep_scrape else "Fast Scrape"
     print(f"\n{'='*50}")
     print(f"🎵 Nodata.tv Scraper - {mode}")
+    if source == "feed":
+        print(f"   Quelle: WordPress REST API ({FEED_PAGE_SIZE} Posts pro Seite)")
     print(f"   Seiten: {start_page} bis {start_page + pages - 1}")
+    if stop_known is not None:
+        print(f"   Inkrementell bis zur ersten Seite ohne neue Releases ({len(stop_known)} bekannt)")
     if deep_scrape:
-        print(f"   Detail-Delay: {DEEP_SCRAPE_DELAY}s pro Release")
+        print(f"   Detail-Worker: {workers}")
+    if limiter is not None:
+        print(f"   Rate-Limit: adaptiv ab {limiter.rate:.1f} Requests/s (max. {max_rps})")
+    if deadline is not None:
+        print(f"   Zeitbudget: {budget_seconds:.0f}s (erst Listings, dann Details)")
     print(f"{'='*50}\n")
     
-    for i in range(pages):
-        current_page = start_page + i
-        
-        # Seite 1 hat keine /page/1/ URL
-        if current_page == 1:
-            url = "https://nodata.tv/blog"
-        else:
-            url = base_url.format(current_page)
-        
-        print(f"\n[Seite {current_page}/{start_page + pages - 1}]")
+    listing = _listing_pages(client, pages, start_page, cache, stop_known, source, stats, deadline)
+    try:
+        if deadline is not None:
+            # Listing-Seiten zuerst: billig und sie legen fest, was neu ist
+            listing = list(listing)
+        for _, page_releases in listing:
+            for release in _enrich_page(
+                page_releases, deep_scrape=deep_scrape, workers=workers, client=client,
+                cache=cache, known_ids=known_ids, deadline=deadline, deferred=stats['deferred']
+            ):
+                releases_found += 1
+                yield release
+    finally:
+        # Auch bei vorzeitigem Abbruch durch den Aufrufer vollständige Stats
+        print(f"\n{'='*50}")
+        print(f"✅ Scraping abgeschlossen: {releases_found} Releases gefunden")
+        print(f"   Seiten benötigt: {stats['pages_scraped']} (Limit {pages})")
+        if stats['deferred']:
+            print(f"   ⏳ {len(stats['deferred'])} Detail-Requests ins nächste Budget verschoben")
+        plans_after = SELECTOR_PLANS.stats()
+        stats['selector_plans'] = {
+            'plans': plans_after['plans'],
+            'hits': plans_after['hits'] - plans_before['hits'],
+            'detections': plans_after['detections'] - plans_before['detections'],
+        }
+        print(f"   Selektor-Pläne: {stats['selector_plans']['hits']} Treffer, "
+              f"{stats['selector_plans']['detections']} Detections")
+        if cache is not None:
+            cache_after = cache.stats()
+            stats['cache_hits'] = cache_after['hits'] - cache_before['hits']
+            stats['cache_misses'] = cache_after['misses'] - cache_before['misses']
+            print(f"   Cache: {stats['cache_hits']} Treffer (304), "
+                  f"{stats['cache_misses']} Misses")
+        if limiter is not None:
+            limiter_after = limiter.stats()
+            elapsed = time.monotonic() - started
+            requests_sent = limiter_after['requests'] - limiter_before['requests']
+            stats['rate_limit'] = {
+                'rate': round(limiter_after['rate'], 2),
+                'effective_rps': round(requests_sent / elapsed, 2) if elapsed > 0 else 0.0,
+                'requests': requests_sent,
+                'backoffs': limiter_after['backoffs'] - limiter_before['backoffs'],
+                'wait_seconds': round(limiter_after['wait_seconds'] - limiter_before['wait_seconds'], 2),
+            }
+            print(f"   Rate-Limit: {stats['rate_limit']['effective_rps']} Requests/s effektiv "
+                  f"(jetzt {stats['rate_limit']['rate']}), {stats['rate_limit']['backoffs']} Backoffs, "
+                  f"{stats['rate_limit']['wait_seconds']}s gewartet (summiert über Worker)")
+        print(f"{'='*50}\n")
+
+
+def scrape_nodata(pages: int = 1, start_page: int = 1, deep_scrape: bool = True,
+                  workers: int = DEFAULT_WORKERS, max_rps: float = DEFAULT_MAX_RPS,
+                  client: Optional[HttpClient] = None,
+                  cache: Optional[ResponseCache] = None,
+                  known_ids: Optional[set] = None,
+                  stop_known: Optional[set] = None,
+                  source: str = "html",
+                  budget_seconds: Optional[float] = None) -> ScrapeResult:
+    """
+    Hauptfunktion zum Scrapen von Nodata.tv Releases.
+    
+    Sammelt iter_releases() in einer Liste; Argumente siehe dort.
+    
+    Returns:
+        ScrapeResult (Liste aller gefundenen Releases, mit .stats und
+        .deferred: Releases, deren Genres wegen budget_seconds noch fehlen)
         
-        releases_on_page = _scrape_single_page(url, deep_scrape=deep_scrape)
+    Example:
+        # Schnelles Scraping ohne Genres
+        releases = scrape_nodata(pages=5, deep_scrape=False)
         
-        if not releases_on_page:
-            print(f"⚠ Keine Releases auf Seite {current_page}. Ende des Archivs?")
-            break
+        # Vollständiges Scraping mit Genres (langsamer)
+        releases = scrape_nodata(pages=5, deep_scrape=True)
+    """
+    stats = {}
+    releases = iter_releases(
+        pages=pages, start_page=start_page, deep_scrape=deep_scrape, workers=workers,
+        max_rps=max_rps, client=client, cache=cache, known_ids=known_ids,
+        stop_known=stop_known, source=source, stats=stats, budget_seconds=budget_seconds
+    )
+    return ScrapeResult(releases, stats=stats)
+
+
+def drain_deferred(queue: list, workers: int = DEFAULT_WORKERS,
+                   client: Optional[HttpClient] = None,
+                   cache: Optional[ResponseCache] = None,
+                   budget_seconds: Optional[float] = None) -> tuple:
+    """
+    Holt die Genres für verschobene Releases nach (neueste zuerst).
+    
+    Args:
+        queue: Verschobene Releases (z.B. ScrapeResult.deferred), werden in-place ergänzt
+        workers: Anzahl paralleler Detail-Requests
+        client: HttpClient für die Requests (default: geteilter Client)
+        cache: Optionaler ResponseCache für Conditional Requests
+        budget_seconds: Zeitbudget (None = unbegrenzt)
         
-        all_releases.extend(releases_on_page)
+    Returns:
+        (fertige Releases, fehlgeschlagene Releases mit 'fetch_failed',
+        weiterhin verschobene Releases)
+    """
+    client = client or get_default_client()
+    deadline = time.monotonic() + budget_seconds if budget_seconds is not None else None
+    still_deferred = []
+    processed = list(_deep_scrape_releases(
+        queue, workers=workers, client=client, cache=cache,
+        deadline=deadline, deferred=still_deferred
+    ))
+    pending = {id(r) for r in still_deferred}
+    done = [r for r in processed if id(r) not in pending]
+    completed = [r for r in done if not r.get('fetch_failed')]
+    failed = [r for r in done if r.get('fetch_failed')]
+    return completed, failed, still_deferred
+
+# --- Archiv-Backfill (mehrere Prozesse, mit Checkpoint) ---
+
+_backfill_worker = {}  # Pro Worker-Prozess: Client, Rate-Limiter, bekannte IDs
+
+
+def _init_backfill_worker(base_url: str, workers: int, limiter_state: dict,
+                          max_rps: float, known_ids: set) -> None:
+    """Initializer für die Worker-Prozesse (ein Client mit eigenem Limiter pro Prozess)."""
+    global _parse_pool
+    _parse_pool = None  # Ein per fork geerbter Pool ist im Kindprozess nicht nutzbar
+    limiter = AdaptiveRateLimiter.from_state(limiter_state, max_rate=max_rps)
+    _backfill_worker['client'] = create_client(base_url=base_url, workers=workers, rate_limiter=limiter)
+    _backfill_worker['known_ids'] = known_ids
+
+
+def _backfill_page(page: int, deep_scrape: bool, workers: int, source: str) -> tuple:
+    """
+    Scraped eine Seite im Worker-Prozess.
+    
+    Returns:
+        ("ok", releases), ("end", None) hinter der letzten Seite oder
+        ("error", Meldung) bei vorübergehenden Fehlern
+    """
+    client = _backfill_worker['client']
+    url = _listing_url(client, page, source)
+    try:
+        releases = _scrape_single_page(
+            url, deep_scrape=deep_scrape, workers=workers,
+            client=client,
+            known_ids=_backfill_worker['known_ids'], source=source
+        )
+    except EndOfArchive:
+        return ("end", None)
+    except Exception as e:
+        return ("error", _page_error_message(url, e))
+    
+    if not releases:
+        # Eine existierende, aber leere Seite ist verdächtig (Layout?) -> erneut versuchen
+        return ("error", f"Keine Releases auf {url} erkannt")
+    return ("ok", releases)
+
+
+def _load_backfill_checkpoint(path: str, source: str) -> dict:
+    """Lädt den Backfill-Checkpoint (neu, wenn nicht vorhanden oder andere Quelle)."""
+    empty = {'source': source, 'pages': {}, 'merged': [], 'end_of_archive': None, 'failed': {}}
+    if not os.path.exists(path):
+        return empty
+    with open(path, "r", encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    if checkpoint.get('source') != source:
+        print(f"♻️ Checkpoint {path} gehört zu Quelle {checkpoint.get('source')!r}, starte neu.")
+        return empty
+    return checkpoint
+
+
+def _save_backfill_checkpoint(path: str, checkpoint: dict) -> None:
+    """Schreibt den Checkpoint atomar (ein Abbruch hinterlässt nie eine halbe Datei)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _merge_backfill_pages(checkpoint: dict, pages: list, store, known_ids: set) -> int:
+    """
+    Übernimmt fertige Seiten (in der gegebenen Reihenfolge) in den Store.
+    
+    Die Releases werden danach aus dem Checkpoint entfernt, nur die
+    Seitennummer bleibt in 'merged'. So wächst der Speicher nicht mit dem
+    Seitenbereich, sondern nur mit den noch nicht übernommenen Seiten.
+    
+    Returns:
+        Anzahl neuer Releases
+    """
+    new_releases = []
+    for page in pages:
+        for release in checkpoint['pages'].pop(str(page)):
+            key = release_key(release)
+            if key not in known_ids:
+                known_ids.add(key)
+                new_releases.append(release)
+        checkpoint['merged'].append(page)
+    store.append(new_releases)
+    return len(new_releases)
+
+
+def backfill(start_page: int, end_page: int, processes: int = DEFAULT_BACKFILL_PROCESSES,
+             deep_scrape: bool = True, workers: int = DEFAULT_WORKERS,
+             max_rps: float = DEFAULT_MAX_RPS, base_url: str = NODATA_BASE_URL,
+             source: str = "html", store_backend: Optional[str] = None,
+             checkpoint_file: str = BACKFILL_FILE) -> dict:
+    """
+    Lädt einen Seitenbereich des Archivs parallel in mehreren Prozessen.
+    
+    Jede fertige Seite wird sofort im Checkpoint gespeichert; ein
+    abgebrochener Lauf setzt beim nächsten Aufruf bei den fehlenden Seiten
+    fort. Eine 404 (bzw. 400 beim Feed) markiert das Ende des Archivs, alle
+    Seiten dahinter werden verworfen. Andere Fehler gelten als vorübergehend:
+    die Seite bleibt offen und wird beim nächsten Lauf erneut versucht.
+    
+    Fertige Seiten werden in Seitenreihenfolge (unabhängig von der
+    Reihenfolge, in der die Prozesse fertig wurden) mit dem Store abgeglichen,
+    sobald alle Seiten davor fertig sind; Releases werden per id dedupliziert.
+    Im Speicher liegen so nur Seiten, die auf eine langsamere Seite warten.
+    Seiten hinter einer fehlgeschlagenen Seite werden am Ende übernommen.
+    
+    Args:
+        start_page: Erste Seite (1-basiert)
+        end_page: Letzte Seite (inklusive)
+        processes: Anzahl Worker-Prozesse
+        deep_scrape: Wenn True, werden Genres von Detail-Seiten geholt
+        workers: Parallele Detail-Requests pro Prozess
+        max_rps: Obergrenze für alle Requests, wird auf die Prozesse aufgeteilt
+        base_url: Basis-URL von Nodata (z.B. Stub-Server in Tests)
+        source: "html" (Blog-Seiten) oder "feed" (WordPress REST API)
+        store_backend: "jsonl" oder "sqlite" (default: $NODATA_STORE bzw. jsonl)
+        checkpoint_file: Pfad zum Checkpoint
         
-        # Kurze Pause zwischen Seiten
-        if i < pages - 1:
-            time.sleep(0.3)
+    Returns:
+        Dict mit 'pages' (übernommen), 'new', 'failed' (Seitenliste) und 'end_of_archive'
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    store = open_store(store_backend)
+    known_ids = store.ids()
+    checkpoint = _load_backfill_checkpoint(checkpoint_file, source)
+    
+    end_of_archive = checkpoint.get('end_of_archive')
+    merged = set(checkpoint['merged'])
+    todo = [
+        page for page in range(start_page, end_page + 1)
+        if str(page) not in checkpoint['pages'] and page not in merged
+        and (end_of_archive is None or page < end_of_archive)
+    ]
+    new_count = 0
+    next_todo = 0  # Index der ersten noch nicht übernommenen Seite in todo
+    # Fehlgeschlagene Seiten werden in diesem Lauf erneut versucht
+    checkpoint['failed'] = {}
     
     print(f"\n{'='*50}")
-    print(f"✅ Scraping abgeschlossen: {len(all_releases)} Releases gefunden")
+    print(f"🗄 Nodata.tv Backfill - Seiten {start_page} bis {end_page}")
+    print(f"   Offen: {len(todo)} Seiten, übersprungen (Checkpoint / Archiv-Ende): "
+          f"{end_page - start_page + 1 - len(todo)}")
+    print(f"   Prozesse: {processes} x {workers} Detail-Worker (adaptiv, max. {max_rps} Requests/s gesamt)")
     print(f"{'='*50}\n")
     
-    return all_releases
+    if todo:
+        # Jeder Prozess startet mit seinem Anteil an der gespeicherten Rate
+        limiter_state = dict(load_limiter_state() or {})
+        if 'rate' in limiter_state:
+            limiter_state['rate'] /= processes
+        initargs = (base_url, workers, limiter_state, max_rps / processes, known_ids)
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_backfill_worker,
+                                 initargs=initargs) as executor:
+            futures = {
+                executor.submit(_backfill_page, page, deep_scrape, workers, source): page
+                for page in todo
+            }
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                page = futures[future]
+                status, payload = future.result()
+                
+                if status == "ok":
+                    checkpoint['pages'][str(page)] = payload
+                    print(f"✓ Seite {page}: {len(payload)} Releases")
+                    ready = []
+                    while next_todo < len(todo) and str(todo[next_todo]) in checkpoint['pages']:
+                        ready.append(todo[next_todo])
+                        next_todo += 1
+                    new_count += _merge_backfill_pages(checkpoint, ready, store, known_ids)
+                elif status == "end":
+                    if end_of_archive is None or page < end_of_archive:
+                        end_of_archive = page
+                        checkpoint['end_of_archive'] = page
+                        print(f"📭 Seite {page} existiert nicht. Ende des Archivs.")
+                    # Seiten hinter dem Ende gar nicht erst anfragen
+                    for other, other_page in futures.items():
+                        if other_page > page:
+                            other.cancel()
+                else:
+                    checkpoint['failed'][str(page)] = payload
+                    print(f"⚠ Seite {page} fehlgeschlagen: {payload}")
+                
+                _save_backfill_checkpoint(checkpoint_file, checkpoint)
+    
+    # Rest (Seiten hinter Lücken, Seiten aus einem früheren Lauf) in Seitenreihenfolge
+    leftover = sorted(
+        page for page in map(int, checkpoint['pages'])
+        if start_page <= page <= end_page and (end_of_archive is None or page < end_of_archive)
+    )
+    new_count += _merge_backfill_pages(checkpoint, leftover, store, known_ids)
+    
+    if new_count:
+        print(f"\n💾 {new_count} neue Releases in {store.location} gespeichert.")
+        if store.log_size() >= COMPACT_THRESHOLD:
+            print(f"🗜 {LOG_FILE} hat {COMPACT_THRESHOLD}+ Einträge, kompaktiere...")
+            compact()
+    else:
+        print(f"\n✓ Keine neuen Releases. {store.location} unverändert.")
+    
+    failed = sorted(map(int, checkpoint['failed']))
+    merged_in_range = [page for page in checkpoint['merged'] if start_page <= page <= end_page]
+    if failed:
+        _save_backfill_checkpoint(checkpoint_file, checkpoint)
+        print(f"⚠ {len(failed)} Seiten fehlgeschlagen ({', '.join(map(str, failed))}). "
+              f"Erneut starten, um mit {checkpoint_file} fortzusetzen.")
+    elif os.path.exists(checkpoint_file):
+        # Bereich vollständig übernommen -> Checkpoint wird nicht mehr gebraucht
+        os.remove(checkpoint_file)
+    
+    return {
+        'pages': len(merged_in_range),
+        'new': new_count,
+        'failed': failed,
+        'end_of_archive': end_of_archive,
+    }
+
+
+def _page_range(value: str) -> tuple:
+    """argparse-Typ für START:END (z.B. 2:150)."""
+    match = re.fullmatch(r'(\d+):(\d+)', value.strip())
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise argparse.ArgumentTypeError(f"Erwartet START:END mit 1 <= START <= END, nicht {value!r}")
+    return int(match.group(1)), int(match.group(2))
 
-def main(history_pages: int = 1, deep_scrape: bool = True, notify: bool = True):
+
+def main(history_pages: int = 1, deep_scrape: bool = True, notify: bool = True,
+         workers: int = DEFAULT_WORKERS, max_rps: float = DEFAULT_MAX_RPS,
+         client: Optional[HttpClient] = None, use_cache: bool = True,
+         incremental: bool = False, max_pages: int = INCREMENTAL_MAX_PAGES,
+         source: str = "html", store_backend: Optional[str] = None,
+         budget_seconds: Optional[float] = None):
     """
     Hauptfunktion für GitHub Actions / CLI Nutzung.
     
+    Mit Zeitbudget werden Detail-Requests, die nicht mehr hineinpassen, in
+    STATE_FILE ('deferred') gespeichert und im nächsten Lauf nach den neuen
+    Releases mit dem restlichen Budget nachgeholt.
+    
     Args:
         history_pages: Anzahl der zu scrapenden Seiten
         deep_scrape: Wenn True, werden Genres von Detail-Seiten geholt
         notify: Wenn True, wird eine Telegram-Benachrichtigung bei neuen Releases gesendet
+        workers: Anzahl paralleler Detail-Requests
+        max_rps: Obergrenze für den adaptiven Rate-Limiter
+        client: HttpClient für Scraping und Telegram (default: neuer Client passend
+                zu workers, Rate-Limiter mit dem Zustand aus LIMITER_FILE)
+        use_cache: Wenn True, werden Conditional Requests über CACHE_FILE genutzt
+        incremental: Wenn True, wird bis zur ersten Seite geblättert, die nur
+                     bekannte Releases enthält (statt fester Seitenzahl),
+                     höchstens max_pages Seiten
+        max_pages: Sicherheitslimit für den inkrementellen Modus
+        source: "html" (Blog-Seiten) oder "feed" (WordPress REST API)
+        store_backend: "jsonl" oder "sqlite" (default: $NODATA_STORE bzw. jsonl)
+        budget_seconds: Zeitbudget für den gesamten Lauf (None = unbegrenzt)
     """
-    existing_data = get_existing_data()
-    existing_ids = {item['id'] for item in existing_data}
+    started = time.monotonic()
+    state = load_state()
+    if client is None:
+        # Gelernte Rate vom letzten Lauf übernehmen statt wieder langsam anzufangen
+        # (früher in STATE_FILE gespeichert)
+        limiter = AdaptiveRateLimiter.from_state(load_limiter_state() or state.get('limiter'),
+                                                 max_rate=max_rps)
+        client = create_client(workers=workers, rate_limiter=limiter)
+    cache = ResponseCache(CACHE_FILE, version=CACHE_VERSION) if use_cache else None
+    store = open_store(store_backend)
+    existing_ids = store.ids()
     
-    print(f"📦 Bestehende Releases: {len(existing_data)}")
+    print(f"📦 Bestehende Releases: {len(existing_ids)}")
     
-    scraped = scrape_nodata(pages=history_pages, deep_scrape=deep_scrape)
+    # Die frühere Watermark (höchste Post-ID) taugt nicht als Abbruch, weil
+    # Post-IDs in der Listing-Reihenfolge nicht steigen
+    state.pop('watermark', None)
+    state.pop('limiter', None)  # Liegt jetzt in LIMITER_FILE
+    stop_known = None
+    if incremental:
+        # Releases aus einem abgebrochenen Lauf zählen nicht als erfasst: die
+        # Seiten dahinter wurden noch nicht gelesen
+        unconfirmed = state.get('unconfirmed', [])
+        stop_known = set(existing_ids).difference(unconfirmed)
+        if stop_known:
+            history_pages = max_pages
+        else:
+            stop_known = None
+            print("⚠ Keine bekannten Releases vorhanden, scrape feste Seitenzahl.")
     
-    # Sammle neue Releases
+    # Neue Releases direkt beim Eintreffen speichern (Append ans Log bzw.
+    # Upsert, kein Rewrite). Der Stream ist Seite 1..N, also Neueste zuerst.
+    stats = {}
     new_releases = []
-    
-    # Neue Items vorne einfügen (scraped ist Seite 1..N, also Neueste zuerst)
-    # Wir iterieren REVERSE, damit die ältesten Neuen zuerst in die Liste kommen
-    # und die allerneuesten ganz oben landen.
-    for release in reversed(scraped):
-        if release['id'] not in existing_ids:
-            existing_data.insert(0, release)
-            existing_ids.add(release['id'])
+    for release in iter_releases(
+        pages=history_pages, deep_scrape=deep_scrape, workers=workers, max_rps=max_rps,
+        client=client, cache=cache, known_ids=existing_ids, stop_known=stop_known,
+        source=source, stats=stats, budget_seconds=budget_seconds
+    ):
+        key = release_key(release)
+        if key not in existing_ids:
+            existing_ids.add(key)
+            store.append([release])
             new_releases.append(release)
             print(f"   🆕 Neu: {release['artist']} - {release['album']}")
     
+    # Verschobene Detail-Requests aus früheren Läufen mit dem Restbudget nachholen
+    queue = state.get('deferred', [])
+    if queue:
+        remaining = None if budget_seconds is None else budget_seconds - (time.monotonic() - started)
+        if remaining is None or remaining > 0:
+            print(f"\n⏳ Hole {len(queue)} verschobene Detail-Requests nach...")
+            completed, failed, queue = drain_deferred(
+                queue, workers=workers, client=client, cache=cache, budget_seconds=remaining
+            )
+            # Fehlgeschlagene mit Markierung speichern, damit `repair` sie findet
+            store.append(completed + failed)
+            print(f"   ✓ {len(completed)} Releases ergänzt, {len(queue)} bleiben in der Queue")
+            if failed:
+                print(f"   ⚠ {len(failed)} Detail-Requests fehlgeschlagen (nachholen mit `python scraper.py repair`)")
+    # Neu verschobene (neuere) Releases kommen vor die alte Queue
+    deferred_ids = set()
+    state['deferred'] = []
+    for release in stats['deferred'] + queue:
+        key = release_key(release)
+        if key not in deferred_ids:
+            deferred_ids.add(key)
+            state['deferred'].append(release)
+    if state['deferred']:
+        print(f"⏳ {len(state['deferred'])} Detail-Requests für den nächsten Lauf in {STATE_FILE}")
+    else:
+        # Leere Queue nicht speichern, damit STATE_FILE ohne Änderungen gleich bleibt
+        del state['deferred']
+    
+    if cache is not None:
+        cache.save()
+    
+    if incremental:
+        # Ohne bekannte Releases war es ein Lauf mit fester Seitenzahl: es gibt
+        # keine Lücke zu älteren Releases, die ein späterer Lauf schließen müsste
+        if stop_known is None or stats.get('reached_known') or stats.get('end_of_archive'):
+            state.pop('unconfirmed', None)
+        else:
+            # Fehler, Zeitbudget, Seitenlimit oder leere Seite: zwischen der
+            # letzten gelesenen Seite und den bekannten Releases können noch
+            # neue liegen. Der nächste Lauf darf an den jetzt gespeicherten
+            # nicht anhalten, sonst gingen die übersprungenen Seiten verloren.
+            if stats.get('failed_page'):
+                reason = f"Seite {stats['failed_page']} fehlgeschlagen"
+            elif stats.get('budget_exhausted'):
+                reason = "Zeitbudget aufgebraucht"
+            elif stats.get('pages_scraped', 0) >= history_pages:
+                reason = f"Limit {history_pages} erreicht"
+            else:
+                reason = "leere Seite"
+            print(f"⚠ Nach {stats.get('pages_scraped', 0)} Seiten keine Seite nur mit bekannten "
+                  f"Releases ({reason}), der nächste Lauf blättert weiter.")
+            state['unconfirmed'] = list(dict.fromkeys(
+                state.get('unconfirmed', []) + [release_key(r) for r in new_releases]
+            ))
+    
+    save_limiter_state(client)
+    save_state(state)
+    
     new_found_count = len(new_releases)
     
-    # Speichere nur wenn es Änderungen gab
     if new_found_count > 0:
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(existing_data, f, indent=4, ensure_ascii=False)
-        print(f"\n💾 {new_found_count} neue Releases in {DATA_FILE} gespeichert.")
+        print(f"\n💾 {new_found_count} neue Releases in {store.location} gespeichert.")
+        
+        if store.log_size() >= COMPACT_THRESHOLD:
+            print(f"🗜 {LOG_FILE} hat {COMPACT_THRESHOLD}+ Einträge, kompaktiere...")
+            compact()
         
         # --- TELEGRAM NOTIFICATION ---
         # Nur wenn neue Releases gefunden UND notify aktiviert
         if notify:
-            # Sortiere neue Releases (neueste zuerst für die Notification)
-            send_telegram_alert(list(reversed(new_releases)), notify_enabled=True)
+            send_telegram_alert(new_releases, notify_enabled=True, client=client)
     else:
-        print(f"\n✓ Keine neuen Releases gefunden. {DATA_FILE} unverändert.")
+        print(f"\n✓ Keine neuen Releases gefunden. {store.location} unverändert.")
 
 
-if __name__ == "__main__":
-    import argparse
+def compact() -> int:
+    """
+    Führt releases.jsonl in einen neuen sortierten releases.json Snapshot zusammen.
+    
+    Returns:
+        Anzahl der Releases im Snapshot
+    """
+    count = open_store("jsonl").compact()
+    print(f"🗜 {DATA_FILE} neu geschrieben ({count} Releases), {LOG_FILE} geleert.")
+    return count
+
+
+def migrate() -> int:
+    """
+    Einmalige Migration: überträgt releases.json + releases.jsonl nach releases.db.
+    
+    Kann gefahrlos wiederholt werden (Upsert per id).
+    
+    Returns:
+        Anzahl der übertragenen Releases
+    """
+    count = migrate_json_to_sqlite()
+    print(f"🗄 {count} Releases nach {SQLITE_FILE} übertragen.")
+    print(f"   Aktivieren mit --store sqlite bzw. NODATA_STORE=sqlite")
+    return count
+
+
+def migrate_ids(store_backend: Optional[str] = None) -> int:
+    """
+    Einmalige Migration auf numerische Post-IDs als Schlüssel.
+    
+    Ergänzt 'post_id' in allen gespeicherten Releases (der Titel-String
+    bleibt als 'id' erhalten) und stellt die Reparatur-Versuche in
+    STATE_FILE von Titel-IDs auf Post-IDs um. Kann gefahrlos wiederholt werden.
+    
+    Args:
+        store_backend: "jsonl" oder "sqlite" (default: $NODATA_STORE bzw. jsonl)
+        
+    Returns:
+        Anzahl der ergänzten Releases
+    """
+    store = open_store(store_backend)
+    count = store.backfill_post_ids()
+    
+    state = load_state()
+    if state.get('repair_attempts'):
+        aliases = {release['id']: str(release_key(release)) for release in store.load()}
+        state['repair_attempts'] = {
+            aliases.get(key, key): tries for key, tries in state['repair_attempts'].items()
+        }
+        save_state(state)
+    
+    print(f"🔑 Post-ID für {count} Releases ergänzt, Titel bleiben als Alias in 'id'.")
+    return count
+
+
+def repair(dry_run: bool = False, workers: int = DEFAULT_WORKERS,
+           max_rps: float = DEFAULT_MAX_RPS, client: Optional[HttpClient] = None,
+           store_backend: Optional[str] = None,
+           max_attempts: int = REPAIR_MAX_ATTEMPTS) -> dict:
+    """
+    Lädt fehlende Genres für bereits gespeicherte Releases nach.
+    
+    Kandidaten sind Releases mit detail_url und leeren Genres oder der
+    Markierung 'fetch_failed'. Die Detail-Seiten werden parallel (höchstens
+    `workers` gleichzeitig, getaktet über den Rate-Limiter) neu geladen,
+    reparierte Releases sofort gespeichert. Wer nach `max_attempts` Läufen
+    noch keine Genres hat, landet im Dead-Letter ('dead_letter' in
+    STATE_FILE) und wird nicht mehr versucht.
+    
+    Args:
+        dry_run: Nur auflisten, keine Requests und keine Änderungen
+        workers: Parallele Detail-Requests
+        max_rps: Obergrenze für den adaptiven Rate-Limiter
+        client: HttpClient (default: neuer Client mit gespeichertem Limiter-Zustand)
+        store_backend: "jsonl" oder "sqlite" (default: $NODATA_STORE bzw. jsonl)
+        max_attempts: Versuche bis zum Dead-Letter
+        
+    Returns:
+        Dict mit 'candidates', 'repaired', 'failed', 'dead_letter' und 'per_second'
+    """
+    state = load_state()
+    store = open_store(store_backend)
+    # JSON-Objekte haben nur String-Keys, daher str(release_key(...))
+    attempts = state.get('repair_attempts', {})
+    dead_letter = {str(release_key(entry)): entry for entry in state.get('dead_letter', [])}
+    
+    missing = [r for r in store.load() if not r.get('genres') or r.get('fetch_failed')]
+    no_url = [r for r in missing if not r.get('detail_url')]
+    candidates = [r for r in missing
+                  if r.get('detail_url') and str(release_key(r)) not in dead_letter]
+    
+    print(f"\n{'='*50}")
+    print(f"🩹 Genre-Reparatur{' (Dry Run)' if dry_run else ''}")
+    print(f"   Ohne Genres: {len(missing)} Releases")
+    print(f"   Ohne detail_url (nicht reparierbar): {len(no_url)}")
+    print(f"   Im Dead-Letter (übersprungen): {len(missing) - len(no_url) - len(candidates)}")
+    print(f"   Zu reparieren: {len(candidates)} (Worker: {workers})")
+    print(f"{'='*50}\n")
+    
+    result = {'candidates': len(candidates), 'repaired': 0, 'failed': 0,
+              'dead_letter': len(dead_letter), 'per_second': 0.0}
+    if dry_run:
+        for release in candidates:
+            print(f"   • {release['artist']} - {release['album']} ({release['detail_url']}, "
+                  f"{attempts.get(str(release_key(release)), 0)} Versuche)")
+        return result
+    if not candidates:
+        return result
+    
+    if client is None:
+        limiter = AdaptiveRateLimiter.from_state(load_limiter_state(), max_rate=max_rps)
+        client = create_client(workers=workers, rate_limiter=limiter)
     
+    started = time.monotonic()
+    repaired_keys = set()
+    for release in _deep_scrape_releases(candidates, workers=workers, client=client):
+        key = str(release_key(release))
+        if release['genres'] and not release.get('fetch_failed'):
+            store.append([release])
+            repaired_keys.add(key)
+            attempts.pop(key, None)
+            result['repaired'] += 1
+            print(f"   ✓ {release['artist']} - {release['album']}: {', '.join(release['genres'][:3])}")
+            continue
+        
+        result['failed'] += 1
+        tries = attempts.get(key, 0) + 1
+        error = release.get('fetch_failed') or "Keine Genres auf der Detail-Seite"
+        if release.get('fetch_failed'):
+            # Markierung mitspeichern, damit der Fehler im Store sichtbar bleibt
+            store.append([release])
+        if tries >= max_attempts:
+            attempts.pop(key, None)
+            dead_letter[key] = {
+                'id': release['id'],
+                'post_id': release.get('post_id'),
+                'detail_url': release['detail_url'],
+                'attempts': tries,
+                'last_error': error,
+            }
+            print(f"   ☠ {release['artist']} - {release['album']}: {error} (Dead-Letter nach {tries} Versuchen)")
+        else:
+            attempts[key] = tries
+            print(f"   ✗ {release['artist']} - {release['album']}: {error} (Versuch {tries}/{max_attempts})")
+    elapsed = time.monotonic() - started
+    
+    state['repair_attempts'] = attempts
+    state['dead_letter'] = list(dead_letter.values())
+    # Reparierte Releases nicht nochmal über die Budget-Queue nachladen
+    state['deferred'] = [r for r in state.get('deferred', []) if str(release_key(r)) not in repaired_keys]
+    save_limiter_state(client)
+    save_state(state)
+    
+    if store.log_size() >= COMPACT_THRESHOLD:
+        print(f"🗜 {LOG_FILE} hat {COMPACT_THRESHOLD}+ Einträge, kompaktiere...")
+        compact()
+    
+    result['dead_letter'] = len(dead_letter)
+    result['per_second'] = round(len(candidates) / elapsed, 2) if elapsed > 0 else 0.0
+    print(f"\n{'='*50}")
+    print(f"✅ Reparatur in {elapsed:.1f}s: {result['repaired']} repariert, "
+          f"{result['failed']} fehlgeschlagen")
+    print(f"   Durchsatz: {result['per_second']} Releases/s")
+    print(f"   Dead-Letter: {result['dead_letter']} Releases ({STATE_FILE})")
+    print(f"{'='*50}\n")
+    return result
+
+
+if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Nodata.tv Release Scraper mit Telegram Notifications",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -539,14 +1842,41 @@ Environment Variables:
   TELEGRAM_TOKEN      Bot Token von @BotFather
   TELEGRAM_CHAT_ID    Chat/Channel ID für Benachrichtigungen
   STREAMLIT_APP_URL   URL zur Streamlit App (optional)
+  NODATA_STORE        Store-Backend für Scraper und App: jsonl (default) oder sqlite
+
+Commands:
+  scrape (default)    Neue Releases scrapen und an releases.jsonl anhängen
+  compact             releases.jsonl in einen sortierten releases.json Snapshot übernehmen
+  migrate             releases.json + releases.jsonl einmalig nach releases.db übertragen
+  migrate-ids         Post-IDs als Schlüssel in bestehende Releases übernehmen (Titel bleibt als Alias)
+  repair              Fehlende Genres gespeicherter Releases nachladen (Dead-Letter nach 3 Versuchen)
 
 Examples:
   python scraper.py                    # 1 Seite scrapen, mit Notification
   python scraper.py -p 5               # 5 Seiten scrapen
   python scraper.py -p 3 --fast        # Schnell ohne Genres
   python scraper.py --no-notify        # Ohne Telegram-Benachrichtigung
+  python scraper.py -p 5 --workers 8 --max-rps 6   # Mehr parallele Detail-Requests
+  python scraper.py -p 20 --workers 16 --parse-processes 4   # Parsen auf 4 Kerne verteilen
+  python scraper.py --no-cache         # Ohne Conditional Requests / HTTP-Cache
+  python scraper.py --incremental      # Blättern bis zur ersten Seite ohne neue Releases
+  python scraper.py --source feed -p 3 # 300 Posts über die WordPress REST API
+  python scraper.py compact            # Log in den Snapshot übernehmen
+  python scraper.py migrate            # JSON-Daten nach SQLite übertragen
+  python scraper.py migrate-ids --store sqlite   # releases.db auf Post-IDs umschlüsseln
+  python scraper.py repair --dry-run   # Releases ohne Genres nur auflisten
+  python scraper.py --store sqlite     # Neue Releases direkt in releases.db speichern
+  python scraper.py --backfill 2:400 --processes 4   # Archiv parallel nachladen (fortsetzbar)
+  python scraper.py --incremental --budget-seconds 300  # Höchstens 5 Minuten, Rest im nächsten Lauf
         """
     )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=("scrape", "compact", "migrate", "migrate-ids", "repair"),
+        default="scrape",
+        help="Auszuführender Befehl (default: scrape)"
+    )
     parser.add_argument(
         "-p", "--pages", 
         type=int, 
@@ -563,11 +1893,115 @@ Examples:
         action="store_true", 
         help="Keine Telegram-Benachrichtigung senden"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Parallele Detail-Requests pro Seite (default: {DEFAULT_WORKERS}, 1 = sequentiell)"
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=DEFAULT_PARSE_PROCESSES,
+        help="HTML-Parsing in so vielen Prozessen statt im Fetch-Thread, für scrape und repair "
+             f"(default: {DEFAULT_PARSE_PROCESSES}; --backfill parst bereits in den --processes Workern)"
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=DEFAULT_MAX_RPS,
+        help=f"Obergrenze für den adaptiven Rate-Limiter in Requests/s (default: {DEFAULT_MAX_RPS})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"HTTP-Cache ({CACHE_FILE}) nicht verwenden"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Seiten laden, bis eine Seite nur noch bekannte Releases enthält"
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=INCREMENTAL_MAX_PAGES,
+        help=f"Sicherheitslimit für --incremental (default: {INCREMENTAL_MAX_PAGES})"
+    )
+    parser.add_argument(
+        "--source",
+        choices=SOURCES,
+        default="html",
+        help=f"Datenquelle: html = Blog-Seiten, feed = WordPress REST API mit {FEED_PAGE_SIZE} Posts/Seite (default: html)"
+    )
+    parser.add_argument(
+        "--store",
+        choices=STORE_BACKENDS,
+        default=STORE_BACKEND,
+        help=f"Store-Backend: jsonl = {DATA_FILE} + {LOG_FILE}, sqlite = {SQLITE_FILE} (default: {STORE_BACKEND})"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Nur für repair: Kandidaten auflisten, nichts laden oder ändern"
+    )
+    parser.add_argument(
+        "--budget-seconds",
+        type=float,
+        default=None,
+        help=f"Zeitbudget für den Lauf; übrige Detail-Requests werden in {STATE_FILE} verschoben"
+    )
+    parser.add_argument(
+        "--backfill",
+        type=_page_range,
+        metavar="START:END",
+        help=f"Seitenbereich des Archivs parallel laden, mit Checkpoint in {BACKFILL_FILE} (kein Telegram)"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=DEFAULT_BACKFILL_PROCESSES,
+        help=f"Worker-Prozesse für --backfill (default: {DEFAULT_BACKFILL_PROCESSES})"
+    )
     
     args = parser.parse_args()
     
-    main(
-        history_pages=args.pages, 
-        deep_scrape=not args.fast,
-        notify=not args.no_notify
-    )
+    if args.command == "compact":
+        compact()
+    elif args.command == "migrate":
+        migrate()
+    elif args.command == "migrate-ids":
+        migrate_ids(store_backend=args.store)
+    elif args.command == "repair":
+        set_parse_processes(args.parse_processes)
+        repair(
+            dry_run=args.dry_run,
+            workers=args.workers,
+            max_rps=args.max_rps,
+            store_backend=args.store
+        )
+    elif args.backfill:
+        backfill(
+            *args.backfill,
+            processes=args.processes,
+            deep_scrape=not args.fast,
+            workers=args.workers,
+            max_rps=args.max_rps,
+            source=args.source,
+            store_backend=args.store
+        )
+    else:
+        set_parse_processes(args.parse_processes)
+        main(
+            history_pages=args.pages, 
+            deep_scrape=not args.fast,
+            notify=not args.no_notify,
+            workers=args.workers,
+            max_rps=args.max_rps,
+            use_cache=not args.no_cache,
+            incremental=args.incremental,
+            max_pages=args.max_pages,
+            source=args.source,
+            store_backend=args.store,
+            budget_seconds=args.budget_seconds
+        )
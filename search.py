@@ -0,0 +1,205 @@
+import heapq
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Optional
+
+from storage import release_key
+
+# --- Configuration ---
+FIELD_WEIGHTS = (('artist', 3), ('album', 2), ('genres', 1))  # Gewicht pro Feld (max. 3, 2 Bit)
+PREFIX_FACTOR = 0.7  # Präfix-Treffer ('vak' -> 'vakula') zählen weniger als exakte Tokens
+TYPO_FACTOR = 0.5  # Tippfehler-Treffer über Trigramme zählen noch weniger
+MIN_PREFIX_LEN = 2  # Kürzere Suchwörter nur exakt suchen (sonst matcht fast alles)
+MAX_PREFIX_TOKENS = 256  # Obergrenze für die Präfix-Expansion pro Suchwort
+MIN_TYPO_LEN = 3  # Tippfehler-Suche erst ab 3 Zeichen (ein Trigramm)
+TYPO_SIMILARITY = 0.5  # Mindest-Ähnlichkeit (Dice über Trigramme)
+TYPO_MAX_EDITS = 1  # Sonst reicht ein Vertauschen/Ersetzen/Einfügen/Löschen ('solra' -> 'solar')
+TYPO_TWO_EDITS_LEN = 8  # Ab dieser Länge sind zwei Änderungen erlaubt
+MAX_TYPO_TOKENS = 5  # Höchstens so viele ähnliche Tokens pro Suchwort
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text: Optional[str]) -> list:
+    """
+    Zerlegt Text in normalisierte Such-Tokens.
+
+    Kleinschreibung, Akzente entfernt ('Musique Concrète' -> ['musique', 'concrete']).
+    """
+    if not text:
+        return []
+    text = text.casefold()
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    return _TOKEN_RE.findall(text)
+
+
+def _trigrams(token: str) -> set:
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Damerau-Levenshtein-Distanz (Vertauschen benachbarter Zeichen zählt 1).
+
+    Bricht ab, sobald `limit` sicher überschritten ist, und gibt dann limit + 1 zurück.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and j > 1 and a[i - 1] == b[j - 2]
+                    and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class SearchIndex:
+    """
+    Invertierter Index über Artist, Album und Genres für die Browse-Suche.
+
+    Wird einmal pro Datenstand gebaut und ist danach unveränderlich, kann
+    also von allen Sessions gemeinsam genutzt werden (st.cache_resource).
+
+    Pro Token speichert der Index eine kompakte Posting-Liste
+    (array, Eintrag = Position << 2 | Feldgewicht). Suchwörter matchen
+    exakt, als Präfix (über das sortierte Vokabular per bisect) und, wenn
+    beides nichts findet, auch mit Tippfehlern (Trigramme als Kandidaten,
+    dazu eine begrenzte Editierdistanz für kurze Wörter). Alle
+    Suchwörter müssen matchen; sortiert wird nach Relevanz, bei Gleichstand
+    nach Position (neueste zuerst, wie im Store).
+
+    Args:
+        releases: Releases (Dicts oder storage.Release), neueste zuerst
+    """
+
+    def __init__(self, releases: list):
+        self.releases = list(releases)
+        postings = {}
+        for position, release in enumerate(self.releases):
+            weights = {}
+            for field, weight in FIELD_WEIGHTS:
+                value = release.get(field)
+                tokens = tokenize(" ".join(value) if field == 'genres' and value else value)
+                for token in tokens:
+                    if weight > weights.get(token, 0):
+                        weights[token] = weight
+            for token, weight in weights.items():
+                postings.setdefault(token, array('I')).append(position << 2 | weight)
+
+        self._postings = postings
+        self._vocabulary = sorted(postings)
+        self._trigram_index = {}
+        for token in self._vocabulary:
+            if len(token) >= MIN_TYPO_LEN:
+                for trigram in _trigrams(token):
+                    self._trigram_index.setdefault(trigram, []).append(token)
+
+    def __len__(self) -> int:
+        return len(self.releases)
+
+    def search(self, query: str, limit: int = 24, offset: int = 0,
+               extra: Optional[list] = None) -> tuple:
+        """
+        Sucht Releases, sortiert nach Relevanz.
+
+        Args:
+            query: Freitext, z.B. 'vakula tim' oder 'ambiant' (Tippfehler)
+            limit: Treffer pro Seite
+            offset: Anzahl zu überspringender Treffer (Paginierung)
+            extra: Zusätzliche Releases, die nicht im Index sind (z.B. in der
+                   Session nachgeladene); sie werden on the fly indexiert und
+                   bei gleicher Relevanz hinter den Index-Treffern einsortiert
+
+        Returns:
+            (Releases der angefragten Seite, Gesamtzahl der Treffer)
+        """
+        scored = [(score, position, self.releases[position])
+                  for position, score in self._match(query).items()]
+        if extra:
+            known = {release_key(release) for _, _, release in scored}
+            extra_index = SearchIndex(extra)
+            scored.extend(
+                (score, len(self) + position, extra_index.releases[position])
+                for position, score in extra_index._match(query).items()
+                if release_key(extra_index.releases[position]) not in known
+            )
+        top = heapq.nsmallest(offset + limit, scored, key=lambda hit: (-hit[0], hit[1]))
+        return [release for _, _, release in top[offset:]], len(scored)
+
+    def _match(self, query: str) -> dict:
+        """Position -> Relevanz für alle Releases, die jedes Suchwort enthalten."""
+        per_token = [self._token_scores(token) for token in dict.fromkeys(tokenize(query))]
+        if not per_token:
+            return {}
+        per_token.sort(key=len)
+        result = per_token[0]
+        for scores in per_token[1:]:
+            result = {position: score + scores[position]
+                      for position, score in result.items() if position in scores}
+            if not result:
+                break
+        return result
+
+    def _token_scores(self, token: str) -> dict:
+        scores = {}
+
+        def add(vocabulary_token: str, factor: float) -> None:
+            for packed in self._postings[vocabulary_token]:
+                position, score = packed >> 2, (packed & 3) * factor
+                if score > scores.get(position, 0):
+                    scores[position] = score
+
+        if token in self._postings:
+            add(token, 1.0)
+        if len(token) >= MIN_PREFIX_LEN:
+            start = bisect_left(self._vocabulary, token)
+            for vocabulary_token in self._vocabulary[start:start + MAX_PREFIX_TOKENS + 1]:
+                if not vocabulary_token.startswith(token):
+                    break
+                if vocabulary_token != token:
+                    add(vocabulary_token, PREFIX_FACTOR)
+        if not scores and len(token) >= MIN_TYPO_LEN:
+            for vocabulary_token, similarity in self._similar(token):
+                add(vocabulary_token, TYPO_FACTOR * similarity)
+        return scores
+
+    def _similar(self, token: str) -> list:
+        """
+        Ähnlichste Vokabular-Tokens.
+
+        Kandidaten teilen mindestens ein Trigramm mit dem Suchwort. Sie
+        passen, wenn der Dice-Koeffizient über die Trigramme reicht oder
+        die Editierdistanz höchstens TYPO_MAX_EDITS ist. Das Zweite fängt
+        Vertauschungen in kurzen Wörtern ab, die die Hälfte der Trigramme
+        zerstören ('solra' teilt nur 2 von 5 mit 'solar').
+        """
+        trigrams = _trigrams(token)
+        max_edits = TYPO_MAX_EDITS + (len(token) >= TYPO_TWO_EDITS_LEN)
+        shared = Counter()
+        for trigram in trigrams:
+            shared.update(self._trigram_index.get(trigram, ()))
+        candidates = []
+        for candidate, count in shared.items():
+            similarity = 2 * count / (len(trigrams) + len(candidate))
+            if similarity < TYPO_SIMILARITY:
+                distance = _edit_distance(token, candidate, max_edits)
+                if distance > max_edits:
+                    continue
+                similarity = 1 - distance / max(len(token), len(candidate))
+            candidates.append((candidate, similarity))
+        candidates.sort(key=lambda item: -item[1])
+        return candidates[:MAX_TYPO_TOKENS]
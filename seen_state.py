@@ -0,0 +1,157 @@
+import base64
+import json
+import zlib
+from typing import Optional
+
+# --- Configuration ---
+FORMAT_PREFIX = "s2."  # Kennzeichnet das kompakte Format (alte Cookies sind JSON-Listen)
+COOKIE_CHUNK_SIZE = 3800  # Zeichen pro Cookie, Browser erlauben ~4096 Bytes inkl. Name/Attributen
+MAX_COOKIE_CHUNKS = 20  # Obergrenze, damit ein kaputtes Cookie keine Endlosschleife auslöst
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode_seen(keys) -> str:
+    """
+    Kodiert gesehene Release-Schlüssel kompakt und cookie-tauglich.
+
+    Post-IDs (int) werden sortiert als Delta-Varints gespeichert, übrige
+    Schlüssel (Titel-IDs von Releases ohne Post-ID) als UTF-8 dahinter. Das
+    Ganze wird mit zlib komprimiert und base64url-kodiert.
+
+    Args:
+        keys: Release-Schlüssel (siehe storage.release_key)
+
+    Returns:
+        String mit FORMAT_PREFIX, z.B. 's2.eNpj...'
+    """
+    post_ids = sorted(key for key in keys if isinstance(key, int))
+    titles = sorted(key for key in keys if not isinstance(key, int))
+
+    payload = bytearray()
+    _write_varint(payload, len(post_ids))
+    previous = 0
+    for post_id in post_ids:
+        _write_varint(payload, post_id - previous)
+        previous = post_id
+    payload += "\0".join(titles).encode("utf-8")
+
+    packed = base64.urlsafe_b64encode(zlib.compress(bytes(payload), 9)).rstrip(b"=")
+    return FORMAT_PREFIX + packed.decode("ascii")
+
+
+def decode_seen(value) -> set:
+    """
+    Liest gesehene Release-Schlüssel aus einem Cookie-Wert.
+
+    Versteht das kompakte Format (encode_seen) und das alte Format (JSON-Liste
+    von IDs, als String oder von der Cookie-Komponente bereits geparst).
+    Unlesbare Werte ergeben eine leere Menge.
+
+    Returns:
+        Menge von Release-Schlüsseln (Post-IDs als int, sonst Titel-IDs)
+    """
+    if isinstance(value, list):
+        return set(value)
+    if not value or not isinstance(value, str):
+        return set()
+    if not value.startswith(FORMAT_PREFIX):
+        try:
+            legacy = json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return set()
+        return set(legacy) if isinstance(legacy, list) else set()
+
+    try:
+        packed = value[len(FORMAT_PREFIX):]
+        payload = zlib.decompress(base64.urlsafe_b64decode(packed + "=" * (-len(packed) % 4)))
+        count, pos = _read_varint(payload, 0)
+        keys = set()
+        post_id = 0
+        for _ in range(count):
+            delta, pos = _read_varint(payload, pos)
+            post_id += delta
+            keys.add(post_id)
+    except (ValueError, IndexError, zlib.error):
+        return set()
+    titles = payload[pos:].decode("utf-8", errors="replace")
+    if titles:
+        keys.update(titles.split("\0"))
+    return keys
+
+
+def split_chunks(value: str, size: int = COOKIE_CHUNK_SIZE) -> list:
+    """Teilt einen Cookie-Wert in Stücke, die einzeln unter das Browser-Limit passen."""
+    return [value[i:i + size] for i in range(0, len(value), size)] or [""]
+
+
+def chunk_cookie_name(name: str, index: int) -> str:
+    """Cookie-Name für Stück `index` (das erste Stück behält den Basisnamen)."""
+    return name if index == 0 else f"{name}_{index}"
+
+
+def _chunk_count(first) -> int:
+    count = str(first).partition("|")[0]
+    return int(count) if count.isdigit() and 1 <= int(count) <= MAX_COOKIE_CHUNKS else 0
+
+
+def stored_chunk_count(get_cookie, name: str) -> int:
+    """Anzahl der Stücke laut erstem Cookie (0, wenn es fehlt oder unlesbar ist)."""
+    first = get_cookie(name)
+    return _chunk_count(first) if first is not None else 0
+
+
+def join_chunks(get_cookie, name: str) -> Optional[str]:
+    """
+    Setzt einen auf mehrere Cookies verteilten Wert wieder zusammen.
+
+    Das erste Cookie beginnt mit der Anzahl der Stücke ('3|...').
+
+    Args:
+        get_cookie: Funktion Name -> Wert oder None (z.B. cookie_manager.get)
+        name: Basisname des Cookies
+
+    Returns:
+        Zusammengesetzter Wert, oder None wenn das erste Cookie fehlt.
+        Fehlt ein späteres Stück, wird ein leerer String zurückgegeben.
+    """
+    first = get_cookie(name)
+    if first is None:
+        return None
+    count = _chunk_count(first)
+    if not count:
+        return ""
+    parts = [str(first).partition("|")[2]]
+    for index in range(1, count):
+        part = get_cookie(chunk_cookie_name(name, index))
+        if part is None:
+            return ""
+        parts.append(str(part))
+    return "".join(parts)
+
+
+def to_cookie_chunks(keys, name: str) -> list:
+    """
+    Kodiert gesehene Schlüssel als Liste von (Cookie-Name, Wert).
+
+    Gegenstück zu join_chunks; das erste Stück trägt die Anzahl als Präfix.
+    """
+    chunks = split_chunks(encode_seen(keys))
+    chunks[0] = f"{len(chunks)}|{chunks[0]}"
+    return [(chunk_cookie_name(name, index), chunk) for index, chunk in enumerate(chunks)]
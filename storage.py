@@ -0,0 +1,629 @@
+import json
+import os
+import re
+import sqlite3
+import sys
+import urllib.parse
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+# --- Configuration ---
+DATA_FILE = "releases.json"  # Sortierter Snapshot (wird nur beim Kompaktieren neu geschrieben)
+LOG_FILE = "releases.jsonl"  # Append-only Log: eine Zeile pro neuem/aktualisiertem Release
+COMPACT_THRESHOLD = 500  # Ab so vielen Log-Zeilen kompaktiert der Scraper automatisch
+SQLITE_FILE = "releases.db"  # Optionaler SQLite-Store
+STORE_BACKENDS = ("jsonl", "sqlite")
+STORE_BACKEND = os.environ.get("NODATA_STORE", "jsonl")  # Standard-Backend für Scraper und App
+
+
+def extract_post_id(detail_url: Optional[str]) -> Optional[int]:
+    """
+    Extrahiert die numerische WordPress Post-ID aus einer Detail-URL.
+
+    Example:
+        'https://nodata.tv/197491' -> 197491
+    """
+    if not detail_url:
+        return None
+    match = re.search(r'/(\d+)/?$', urllib.parse.urlsplit(detail_url).path)
+    return int(match.group(1)) if match else None
+
+
+def _post_id(release) -> Optional[int]:
+    """Post-ID eines Releases: gespeichertes Feld oder aus der detail_url abgeleitet (Altdaten)."""
+    post_id = release.get('post_id')
+    return post_id if post_id is not None else extract_post_id(release.get('detail_url'))
+
+
+def release_key(release) -> "int | str":
+    """
+    Kanonischer Schlüssel eines Releases für Store, Seen-State und Abgleich.
+
+    Das ist die numerische Post-ID, die auch nach einer Titeländerung auf
+    Nodata gleich bleibt. Nur Altdaten ohne detail_url behalten den
+    Titel-String ('id') als Schlüssel; für alle anderen ist 'id' ein Alias.
+    """
+    post_id = _post_id(release)
+    return post_id if post_id is not None else release['id']
+
+
+def _sort_date(date_found: str) -> str:
+    """
+    Normalisiert date_found für die Sortierung auf YYYY-MM-DD.
+
+    Ältere Einträge haben Freitext wie 'Published on November 17, 2025'.
+    """
+    if re.fullmatch(r'\d{4}-\d{2}-\d{2}', date_found or ''):
+        return date_found
+    match = re.search(r'([A-Za-z]{3,9}) (\d{1,2}), (\d{4})', date_found or '')
+    if match:
+        for date_format in ("%B %d %Y", "%b %d %Y"):
+            try:
+                return datetime.strptime(" ".join(match.groups()), date_format).strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+    return ""
+
+
+def release_sort_key(release: dict) -> str:
+    """Sortierschlüssel für die Store-Reihenfolge: Datum als YYYY-MM-DD ('' wenn unbekannt)."""
+    return _sort_date(release.get('date_found', ''))
+
+
+def generate_search_links(artist: str, title: str) -> dict:
+    """Generiert Such-Links für verschiedene Musik-Plattformen."""
+    query = urllib.parse.quote_plus(f"{artist} {title}")
+    return {
+        "youtube": f"https://www.youtube.com/results?search_query={query}",
+        "bandcamp": f"https://bandcamp.com/search?q={query}",
+        "soundcloud": f"https://soundcloud.com/search?q={query}",
+        "apple": f"https://music.apple.com/de/search?term={query}"
+    }
+
+
+def _storable(release: dict) -> dict:
+    """Release ohne abgeleitete Felder: 'links' wird beim Lesen neu erzeugt."""
+    if 'links' not in release:
+        return release
+    return {key: value for key, value in release.items() if key != 'links'}
+
+
+_RELEASE_FIELDS = ('id', 'artist', 'album', 'image', 'date_found', 'genres', 'detail_url', 'post_id')
+
+
+@dataclass(slots=True)
+class Release:
+    """
+    Kompakte Darstellung eines Releases für die App (ein Objekt pro Release im Speicher).
+
+    Gegenüber dem Dictionary aus releases.json entfallen das Instanz-Dict
+    und die vier gespeicherten Such-Links: `links` wird bei Bedarf aus
+    Artist und Album erzeugt. Genres und Datum sind internierte Strings,
+    die sich alle Releases teilen. Unbekannte Felder landen in `extra`.
+
+    Lesender Code kann ein Release wie ein Dict verwenden
+    (release['artist'], release.get('links', {})). `key` ist der
+    kanonische Schlüssel (siehe release_key).
+    """
+
+    id: str
+    artist: str = ""
+    album: str = ""
+    image: Optional[str] = None
+    date_found: str = ""
+    genres: tuple = ()
+    detail_url: Optional[str] = None
+    post_id: Optional[int] = None
+    extra: Optional[dict] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Release":
+        """Erzeugt ein Release aus einem gespeicherten Dict (mit oder ohne 'links')."""
+        extra = {key: value for key, value in data.items()
+                 if key not in _RELEASE_FIELDS and key != 'links'}
+        return cls(
+            id=data['id'],
+            artist=data.get('artist') or "",
+            album=data.get('album') or "",
+            image=data.get('image'),
+            date_found=sys.intern(data.get('date_found') or ""),
+            genres=tuple(sys.intern(genre) for genre in data.get('genres') or ()),
+            detail_url=data.get('detail_url'),
+            post_id=_post_id(data),
+            extra=extra or None,
+        )
+
+    @property
+    def key(self) -> "int | str":
+        return self.post_id if self.post_id is not None else self.id
+
+    @property
+    def links(self) -> dict:
+        return generate_search_links(self.artist, self.album)
+
+    def to_dict(self) -> dict:
+        """Speicherformat (ohne 'links'), kompatibel mit releases.json."""
+        data = {field: getattr(self, field) for field in _RELEASE_FIELDS}
+        data['genres'] = list(self.genres)
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __getitem__(self, key: str):
+        if key in _RELEASE_FIELDS:
+            return getattr(self, key)
+        if key == 'links':
+            return self.links
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _RELEASE_FIELDS or key == 'links' or bool(self.extra and key in self.extra)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def to_releases(releases: list) -> list:
+    """Wandelt Release-Dictionaries in kompakte Release-Objekte um."""
+    return [Release.from_dict(release) for release in releases]
+
+
+class ReleaseOverlay:
+    """
+    Session-Sicht auf eine prozessweit geteilte, unveränderliche Release-Liste.
+
+    Die Basis (ein Tuple, z.B. aus st.cache_resource) wird nie verändert und
+    nicht kopiert. Die Session hält nur, was sie selbst ergänzt hat
+    (append, z.B. aus der Archivsuche) oder ersetzt (replace, z.B. Releases
+    mit nachgeladenen Genres). Verhält sich beim Lesen wie eine Liste:
+    len(), Index, Slice, Iteration; ergänzte Releases stehen hinten.
+
+    Args:
+        base: Geteilte Releases (neueste zuerst), wird nur gelesen
+    """
+
+    def __init__(self, base: tuple):
+        self.base = base
+        self.added = []
+        self._replaced = {}  # release_key -> Release, nur für Einträge aus der Basis
+
+    def __len__(self) -> int:
+        return len(self.base) + len(self.added)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index >= len(self.base):
+            return self.added[index - len(self.base)]
+        return self.resolve(self.base[index])
+
+    def __iter__(self):
+        for release in self.base:
+            yield self.resolve(release)
+        yield from self.added
+
+    def resolve(self, release: "Release") -> "Release":
+        """Gibt die Session-Version eines Basis-Releases zurück (ggf. ersetzt)."""
+        if self._replaced:
+            return self._replaced.get(release.key, release)
+        return release
+
+    def append(self, release: "Release") -> None:
+        self.added.append(release)
+
+    def replace(self, releases: list) -> None:
+        """Ersetzt Releases mit gleichem Schlüssel (ergänzte direkt, Basis per Overlay)."""
+        updated = {release.key: release for release in releases}
+        for position, release in enumerate(self.added):
+            if release.key in updated:
+                self.added[position] = updated.pop(release.key)
+        self._replaced.update(updated)
+
+    def keys(self) -> set:
+        """Schlüssel aller Releases dieser Session (Basis und ergänzte)."""
+        return {release.key for release in self.base} | {release.key for release in self.added}
+
+
+def _file_version(path: str) -> tuple:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class JsonlReleaseStore:
+    """
+    Release-Store aus sortiertem JSON-Snapshot plus Append-only JSONL-Log.
+
+    Neue oder aktualisierte Releases werden als einzelne Zeilen an das Log
+    angehängt, ein Schreibvorgang kostet also O(neue Releases) statt eines
+    kompletten Rewrites. compact() führt Log und Snapshot zusammen, schreibt
+    einen neuen sortierten Snapshot und leert das Log.
+
+    Beim Laden gewinnt pro Schlüssel (release_key, also Post-ID) der jeweils
+    letzte Eintrag (Log vor Snapshot). Die Reihenfolge ist die von früher
+    (releases.json mit insert(0, ...)): der Snapshot bleibt, wie er ist,
+    neue Releases aus dem Log kommen davor, zuletzt angehängte zuerst. Nur
+    Releases mit älterem Datum (z.B. aus dem Backfill) werden nach Datum
+    einsortiert (siehe release_sort_key). Post-IDs spielen dabei keine
+    Rolle, sie folgen nicht der Listing-Reihenfolge.
+
+    Args:
+        snapshot_path: Pfad zum JSON-Snapshot
+        log_path: Pfad zum JSONL-Log
+    """
+
+    def __init__(self, snapshot_path: str = DATA_FILE, log_path: str = LOG_FILE):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.location = log_path  # Ziel von append() für Log-Ausgaben
+
+    def load(self) -> list:
+        """Lädt alle Releases (Snapshot + Log), neueste zuerst."""
+        releases = {}
+        for release in self._read_snapshot():
+            releases[release_key(release)] = release
+        snapshot_keys = list(releases)
+        new_keys = []
+        for release in self._read_log():
+            key = release_key(release)
+            if key not in releases:
+                new_keys.append(key)
+            releases[key] = release
+
+        # Aktualisierte Releases behalten ihren Platz. Neue stabil nach Datum
+        # sortieren und vor dem ersten Snapshot-Eintrag einfügen, der nicht
+        # neuer ist, damit der Snapshot selbst unverändert bleibt.
+        new = sorted((releases[key] for key in reversed(new_keys)), key=release_sort_key, reverse=True)
+        ordered = []
+        index = 0
+        for key in snapshot_keys:
+            release = releases[key]
+            while index < len(new) and release_sort_key(new[index]) >= release_sort_key(release):
+                ordered.append(new[index])
+                index += 1
+            ordered.append(release)
+        ordered.extend(new[index:])
+        return ordered
+
+    def ids(self) -> set:
+        """Alle Release-Schlüssel (release_key, für den Abgleich im Scraper)."""
+        return {release_key(release) for release in self._read_snapshot() + self._read_log()}
+
+    def append(self, releases: list) -> None:
+        """Hängt neue oder aktualisierte Releases an das Log an."""
+        if not releases:
+            return
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            for release in releases:
+                f.write(json.dumps(_storable(release), ensure_ascii=False) + "\n")
+
+    def version(self) -> tuple:
+        """Datenstand (mtime + Größe von Snapshot und Log), z.B. als Cache-Schlüssel."""
+        return _file_version(self.snapshot_path) + _file_version(self.log_path)
+
+    def log_size(self) -> int:
+        """Anzahl der noch nicht kompaktierten Log-Einträge."""
+        if not os.path.exists(self.log_path):
+            return 0
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            return sum(1 for line in f if line.strip())
+
+    def compact(self) -> int:
+        """
+        Schreibt einen neuen sortierten Snapshot aus Snapshot + Log und leert das Log.
+
+        Returns:
+            Anzahl der Releases im neuen Snapshot
+        """
+        releases = self.load()
+        self._write_snapshot(releases)
+        return len(releases)
+
+    def backfill_post_ids(self) -> int:
+        """
+        Migration: ergänzt 'post_id' in allen Releases und kompaktiert dabei.
+
+        Der Titel-String bleibt als 'id' (Alias) erhalten.
+
+        Returns:
+            Anzahl der ergänzten Releases
+        """
+        releases = self.load()
+        updated = 0
+        for release in releases:
+            post_id = _post_id(release)
+            if post_id is not None and release.get('post_id') != post_id:
+                release['post_id'] = post_id
+                updated += 1
+        self._write_snapshot(releases)
+        return updated
+
+    def _write_snapshot(self, releases: list) -> None:
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump([_storable(release) for release in releases], f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, self.snapshot_path)
+
+        # Erst nach erfolgreichem Snapshot das Log leeren
+        if os.path.exists(self.log_path):
+            open(self.log_path, "w", encoding="utf-8").close()
+
+    def _read_snapshot(self) -> list:
+        if not os.path.exists(self.snapshot_path):
+            return []
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _read_log(self) -> list:
+        if not os.path.exists(self.log_path):
+            return []
+        releases = []
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    releases.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Abgebrochener Schreibvorgang (z.B. letzte Zeile) -> überspringen
+                    print(f"⚠️ {self.log_path}:{line_no} ist kein gültiges JSON, übersprungen.")
+        return releases
+
+
+class SqliteReleaseStore:
+    """
+    Release-Store auf SQLite-Basis mit Indizes und FTS5-Volltextsuche.
+
+    Schema:
+        releases        Primärschlüssel id (= release_key: Post-ID, sonst Titel),
+                        Indizes auf date_found (bei Gleichstand gilt die Einfügereihenfolge,
+                        neueste zuerst wie im JSONL-Store) und post_id
+        release_genres  Join-Tabelle (release_id, genre), Index auf genre
+        releases_fts    FTS5 über artist, album und genres
+
+    Das vollständige Release wird zusätzlich als JSON gespeichert, damit
+    load()/query() exakt die gleichen Dictionaries liefern wie der JSONL-Store.
+    Ohne FTS5 (selten, je nach SQLite-Build) fällt search auf LIKE zurück.
+
+    Args:
+        path: Pfad zur Datenbank
+    """
+
+    def __init__(self, path: str = SQLITE_FILE):
+        self.path = path
+        self.location = path
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SQLITE_SCHEMA)
+            try:
+                conn.execute(_SQLITE_FTS_SCHEMA)
+                self.has_fts = True
+            except sqlite3.OperationalError:
+                self.has_fts = False
+
+    def load(self) -> list:
+        """Lädt alle Releases, neueste zuerst."""
+        return self.query(limit=-1)
+
+    def append(self, releases: list) -> None:
+        """Fügt Releases ein oder aktualisiert sie (Upsert per id)."""
+        if not releases:
+            return
+        with closing(self._connect()) as conn, conn:
+            for release in releases:
+                self._upsert(conn, release)
+
+    def query(self, search: Optional[str] = None, genre: Optional[str] = None,
+              limit: int = 12, offset: int = 0) -> list:
+        """
+        Gibt eine Seite von Releases zurück, neueste zuerst.
+
+        Args:
+            search: Suchbegriff für Artist/Album/Genres (Präfix-Suche)
+            genre: Nur Releases mit diesem Genre
+            limit: Maximale Anzahl (-1 = alle)
+            offset: Anzahl zu überspringender Releases
+        """
+        where, params = self._filters(search, genre)
+        sql = (
+            f"SELECT r.data FROM releases r {where} "
+            "ORDER BY r.date_found DESC, r.rowid DESC LIMIT ? OFFSET ?"
+        )
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params + [limit, offset]).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, search: Optional[str] = None, genre: Optional[str] = None) -> int:
+        """Anzahl der Releases (optional gefiltert wie query)."""
+        where, params = self._filters(search, genre)
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM releases r {where}", params).fetchone()[0]
+
+    def ids(self) -> set:
+        """Alle Release-Schlüssel (release_key, für den Abgleich im Scraper)."""
+        with closing(self._connect()) as conn:
+            return {
+                post_id if post_id is not None else release_id
+                for release_id, post_id in conn.execute("SELECT id, post_id FROM releases")
+            }
+
+    def version(self) -> tuple:
+        """Datenstand (mtime + Größe von DB und WAL), z.B. als Cache-Schlüssel."""
+        return _file_version(self.path) + _file_version(f"{self.path}-wal")
+
+    def log_size(self) -> int:
+        # SQLite schreibt direkt, es gibt kein Log zu kompaktieren
+        return 0
+
+    def compact(self) -> int:
+        with closing(self._connect()) as conn:
+            conn.execute("VACUUM")
+            return conn.execute("SELECT COUNT(*) FROM releases").fetchone()[0]
+
+    def backfill_post_ids(self) -> int:
+        """
+        Migration: schlüsselt Zeilen mit Titel-ID auf die Post-ID um und ergänzt 'post_id'.
+
+        Returns:
+            Anzahl der umgeschlüsselten Releases
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT id, data FROM releases").fetchall()
+        updated = []
+        for row_id, data in rows:
+            release = json.loads(data)
+            post_id = _post_id(release)
+            if post_id is not None and (row_id != str(post_id) or release.get('post_id') != post_id):
+                release['post_id'] = post_id
+                updated.append(release)
+        # Upsert ersetzt die alte Zeile mit gleicher Post-ID
+        self.append(updated)
+        return len(updated)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Eine Verbindung pro Operation: threadsicher für Streamlit und Worker
+        return sqlite3.connect(self.path)
+
+    def _upsert(self, conn: sqlite3.Connection, release: dict) -> None:
+        genres = release.get('genres') or []
+        key = str(release_key(release))
+        post_id = _post_id(release)
+        if post_id is not None:
+            # Zeilen aus der Zeit vor den Post-IDs (Titel als Schlüssel) ersetzen
+            stale = conn.execute(
+                "SELECT id FROM releases WHERE post_id = ? AND id != ?", (post_id, key)
+            ).fetchall()
+            for (row_id,) in stale:
+                self._delete(conn, row_id)
+        conn.execute(
+            "INSERT INTO releases (id, artist, album, date_found, post_id, data) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET artist = excluded.artist, album = excluded.album, "
+            "date_found = excluded.date_found, post_id = excluded.post_id, data = excluded.data",
+            (
+                key,
+                release.get('artist', ''),
+                release.get('album', ''),
+                _sort_date(release.get('date_found', '')),
+                post_id,
+                json.dumps(_storable(release), ensure_ascii=False),
+            ),
+        )
+        conn.execute("DELETE FROM release_genres WHERE release_id = ?", (key,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO release_genres (release_id, genre) VALUES (?, ?)",
+            [(key, genre) for genre in genres],
+        )
+        if self.has_fts:
+            # FTS-Zeile teilt sich die rowid mit releases (Löschen per rowid statt Scan)
+            rowid = conn.execute("SELECT rowid FROM releases WHERE id = ?", (key,)).fetchone()[0]
+            conn.execute("DELETE FROM releases_fts WHERE rowid = ?", (rowid,))
+            conn.execute(
+                "INSERT INTO releases_fts (rowid, artist, album, genres) VALUES (?, ?, ?, ?)",
+                (rowid, release.get('artist', ''), release.get('album', ''), " ".join(genres)),
+            )
+
+    def _delete(self, conn: sqlite3.Connection, row_id: str) -> None:
+        row = conn.execute("SELECT rowid FROM releases WHERE id = ?", (row_id,)).fetchone()
+        if row is None:
+            return
+        conn.execute("DELETE FROM releases WHERE rowid = ?", (row[0],))
+        conn.execute("DELETE FROM release_genres WHERE release_id = ?", (row_id,))
+        if self.has_fts:
+            conn.execute("DELETE FROM releases_fts WHERE rowid = ?", (row[0],))
+
+    def _filters(self, search: Optional[str], genre: Optional[str]) -> tuple:
+        clauses, params = [], []
+        if search and search.strip():
+            if self.has_fts:
+                clauses.append("r.rowid IN (SELECT rowid FROM releases_fts WHERE releases_fts MATCH ?)")
+                params.append(_fts_query(search))
+            else:
+                pattern = f"%{search.strip().lower()}%"
+                clauses.append(
+                    "(lower(r.artist) LIKE ? OR lower(r.album) LIKE ? OR r.id IN "
+                    "(SELECT release_id FROM release_genres WHERE lower(genre) LIKE ?))"
+                )
+                params.extend([pattern, pattern, pattern])
+        if genre:
+            clauses.append("r.id IN (SELECT release_id FROM release_genres WHERE genre = ?)")
+            params.append(genre)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS releases (
+    id TEXT PRIMARY KEY,
+    artist TEXT NOT NULL DEFAULT '',
+    album TEXT NOT NULL DEFAULT '',
+    date_found TEXT NOT NULL DEFAULT '',
+    post_id INTEGER,
+    data TEXT NOT NULL
+);
+DROP INDEX IF EXISTS idx_releases_date;
+CREATE INDEX IF NOT EXISTS idx_releases_date_rowid ON releases (date_found);
+CREATE INDEX IF NOT EXISTS idx_releases_post_id ON releases (post_id);
+CREATE TABLE IF NOT EXISTS release_genres (
+    release_id TEXT NOT NULL,
+    genre TEXT NOT NULL,
+    PRIMARY KEY (release_id, genre)
+);
+CREATE INDEX IF NOT EXISTS idx_release_genres_genre ON release_genres (genre);
+"""
+
+_SQLITE_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS releases_fts USING fts5(
+    artist, album, genres,
+    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+)
+"""
+
+
+def _fts_query(search: str) -> str:
+    """Baut aus freier Eingabe eine FTS5-Query: jedes Wort als Präfix, UND-verknüpft."""
+    tokens = re.findall(r'\w+', search.lower())
+    return " ".join(f'"{token}"*' for token in tokens) or '""'
+
+
+def migrate_json_to_sqlite(sqlite_path: str = SQLITE_FILE) -> int:
+    """
+    Überträgt alle Releases aus releases.json + releases.jsonl in die SQLite-DB.
+
+    Returns:
+        Anzahl der übertragenen Releases
+    """
+    releases = JsonlReleaseStore().load()
+    # Älteste zuerst einfügen: bei gleichem Datum sortiert query() nach rowid absteigend
+    SqliteReleaseStore(sqlite_path).append(releases[::-1])
+    return len(releases)
+
+
+def open_store(backend: Optional[str] = None):
+    """
+    Öffnet den Release-Store.
+
+    Args:
+        backend: "jsonl" (releases.json + releases.jsonl) oder "sqlite"
+                 (releases.db); default STORE_BACKEND bzw. $NODATA_STORE
+    """
+    backend = backend or STORE_BACKEND
+    if backend == "sqlite":
+        return SqliteReleaseStore()
+    if backend == "jsonl":
+        return JsonlReleaseStore()
+    raise ValueError(f"Unbekanntes Store-Backend: {backend!r} (erlaubt: {', '.join(STORE_BACKENDS)})")